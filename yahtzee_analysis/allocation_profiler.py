@@ -0,0 +1,207 @@
+"""Allocation profiling: where the game allocates, per call site.
+
+``profile_method`` in performance_profiler.py reports one net-memory number
+per method, which hides short-lived allocations and says nothing about
+where they happen.  This mode uses ``tracemalloc`` snapshots grouped by
+traceback:
+
+* operations - each operation is called ``CALLS_PER_OPERATION`` times with
+  its return values kept alive, so fresh lists returned on every call show
+  up in the snapshot diff, grouped by the call site that allocated them.
+  Peak memory per call covers temporaries that are freed before returning.
+* live objects - ``Game``/``Dice``/``Scorecard``/``Hand`` instance counts
+  from the garbage collector
+* concurrent games - retained size per game, and its top call sites, with
+  N games alive at once
+
+Only allocations with a frame in ``yahtzee_game/`` are attributed to call
+sites; the totals include everything.
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+yahtzee_game_path = Path(__file__).parent.parent / 'yahtzee_game'
+sys.path.insert(0, str(yahtzee_game_path))
+
+from dice import Dice
+from game import Game
+from hand import Hand
+from scorecard import Scorecard
+
+CALLS_PER_OPERATION = 1000
+GAME_COUNTS = [1, 10, 100, 1000, 10000]
+TRACEBACK_DEPTH = 8
+TOP_SITES = 5
+TRACKED_TYPES = (Game, Dice, Scorecard, Hand)
+
+OPERATIONS = {
+    'game_init': lambda game: Game(2),
+    'scorecard_init': lambda game: Scorecard(2),
+    'dice_roll': lambda game: game.die[0].roll(),
+    'game_roll_dice': lambda game: game.roll_dice(),
+    'game_get_dice_values': lambda game: game.get_dice_values(),
+    'game_set_dice_values': lambda game: game.set_dice_values(),
+    'game_get_sorted_dice': lambda game: game.get_sorted_dice(),
+    'game_get_frequency': lambda game: game.get_frequency(),
+    'game_calculate_score': lambda game: game.calculate_score(12),
+    'scorecard_set_score': lambda game: game.players.set_score(0, 0, 3),
+}
+
+GAME_FILTER = tracemalloc.Filter(True, str(yahtzee_game_path / '*'), all_frames=True)
+
+
+def format_traceback(traceback):
+    """Frames as ``file:line``, innermost last, trimmed to the game's own frames."""
+    frames = []
+    for frame in traceback:
+        if str(yahtzee_game_path) not in frame.filename:
+            continue
+        label = f"{Path(frame.filename).name}:{frame.lineno}"
+        # Comprehensions get their own frame on the same line; show it once
+        if not frames or frames[-1] != label:
+            frames.append(label)
+    return frames
+
+
+def snapshot_diff(before, after):
+    """Per-traceback differences between two snapshots, limited to the game's files."""
+    return after.filter_traces([GAME_FILTER]).compare_to(
+        before.filter_traces([GAME_FILTER]), 'traceback')
+
+
+def call_sites(stats, divisor):
+    """Top call sites by allocated size in a snapshot diff, per ``divisor`` units.
+
+    Sites that grew by less than one byte per unit are noise (an int or
+    list growing once in a while) and are left out.
+    """
+    sites = [stat for stat in stats if stat.size_diff >= divisor]
+    sites.sort(key=lambda stat: stat.size_diff, reverse=True)
+    return [{
+        'traceback': format_traceback(stat.traceback),
+        'bytes': stat.size_diff / divisor,
+        'blocks': stat.count_diff / divisor
+    } for stat in sites[:TOP_SITES]]
+
+
+def live_objects():
+    """Number of live instances of each tracked class."""
+    counts = Counter({cls.__name__: 0 for cls in TRACKED_TYPES})
+    for obj in gc.get_objects():
+        if isinstance(obj, TRACKED_TYPES):
+            counts[type(obj).__name__] += 1
+    return dict(counts)
+
+
+def profile_operation(operation, game, calls=CALLS_PER_OPERATION):
+    """Allocations of ``calls`` calls of ``operation(game)`` with the results kept alive."""
+    results = [None] * calls
+    operation(game)  # first call outside the trace: lazy caches, attribute dicts
+    gc.collect()
+    tracemalloc.start(TRACEBACK_DEPTH)
+    try:
+        before = tracemalloc.take_snapshot()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        peaks = 0
+        for idx in range(calls):
+            # Read before resetting, so the result tuple is not in the peak
+            call_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            results[idx] = operation(game)
+            peaks += tracemalloc.get_traced_memory()[1] - call_start
+        retained = tracemalloc.get_traced_memory()[0] - start_memory
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = snapshot_diff(before, after)
+    return {
+        'calls': calls,
+        'retained_bytes_per_call': retained / calls,
+        'peak_bytes_per_call': peaks / calls,
+        # Every site in the diff, not just the top ones reported below
+        'blocks_per_call': sum(stat.count_diff for stat in stats) / calls,
+        'call_sites': call_sites(stats, calls)
+    }
+
+
+def profile_concurrent_games(num_games):
+    """Retained size and live objects with ``num_games`` two-player games alive at once."""
+    gc.collect()
+    baseline = live_objects()
+    tracemalloc.start(TRACEBACK_DEPTH)
+    try:
+        before = tracemalloc.take_snapshot()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        games = [Game(2) for _ in range(num_games)]
+        retained = tracemalloc.get_traced_memory()[0] - start_memory
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    live = live_objects()
+    result = {
+        'num_games': num_games,
+        'retained_kb': retained / 1024,
+        'bytes_per_game': retained / num_games,
+        'live_objects': {name: live[name] - baseline[name] for name in live},
+        'call_sites': call_sites(snapshot_diff(before, after), num_games)
+    }
+    del games
+    return result
+
+
+def run_allocation_analysis():
+    print("Running allocation analysis...")
+    print(f"Configuration: {CALLS_PER_OPERATION} calls per operation, "
+          f"concurrent games {GAME_COUNTS}, traceback depth {TRACEBACK_DEPTH}")
+    print("=" * 80)
+
+    game = Game(2)
+    operations = {name: profile_operation(operation, game) for name, operation in OPERATIONS.items()}
+    del game
+    gc.collect()
+    baseline_objects = live_objects()
+    concurrent = [profile_concurrent_games(n) for n in GAME_COUNTS]
+
+    results = {
+        'operations': operations,
+        'baseline_live_objects': baseline_objects,
+        'concurrent_games': concurrent,
+        'calls_per_operation': CALLS_PER_OPERATION,
+        'traceback_depth': TRACEBACK_DEPTH
+    }
+
+    output_dir = Path(__file__).parent / 'data'
+    output_dir.mkdir(exist_ok=True)
+
+    with open(output_dir / 'allocation_profile.json', 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print("\nAllocations per operation (results kept alive):")
+    print("-" * 80)
+    for name, metrics in operations.items():
+        print(f"  {name:24s} | retained {metrics['retained_bytes_per_call']:7.1f} B/call | "
+              f"peak {metrics['peak_bytes_per_call']:7.1f} B/call | "
+              f"{metrics['blocks_per_call']:4.1f} blocks/call")
+        for site in metrics['call_sites'][:2]:
+            print(f"  {'':24s}   {site['bytes']:7.1f} B  {' <- '.join(reversed(site['traceback']))}")
+
+    print(f"\nLive objects at baseline: {baseline_objects}")
+    print("\nConcurrent games:")
+    print("-" * 80)
+    for entry in concurrent:
+        print(f"  {entry['num_games']:>6,d} games | {entry['retained_kb']:10.1f} KB | "
+              f"{entry['bytes_per_game']:7.0f} B/game | objects {entry['live_objects']}")
+    print("  Largest call sites per game:")
+    for site in concurrent[-1]['call_sites']:
+        print(f"    {site['bytes']:7.1f} B  {' <- '.join(reversed(site['traceback']))}")
+
+    print(f"\nResults saved to: {output_dir / 'allocation_profile.json'}")
+    return results
+
+
+if __name__ == '__main__':
+    run_allocation_analysis()
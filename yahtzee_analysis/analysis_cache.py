@@ -0,0 +1,91 @@
+"""Per-file result cache keyed by content hash and tool version.
+
+The readability and pylint analyses look at one file at a time, so a
+file's result only changes when its bytes or the tool change.  Each tool
+has one JSON index under ``data/.cache/``:
+
+    {"version": "<tool version>", "entries": {"<path>": {"sha256": ..., "result": ...}}}
+
+A lookup hits when the file's SHA-256 and the tool version both match.  A
+new tool version drops every entry.  A tool whose result for one file also
+depends on other files (pylint follows imports and reads its config) folds
+``inputs_hash`` of all of them into the version, so any change drops the
+whole index.  Entries for files that no longer exist
+are pruned on ``save``.  The index is rewritten through a temporary file, so
+an interrupted run never leaves a truncated cache.
+"""
+import hashlib
+import json
+from importlib import metadata
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / 'data' / '.cache'
+
+
+def file_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def inputs_hash(paths):
+    """One SHA-256 over the paths and contents of ``paths``; missing files are skipped."""
+    digest = hashlib.sha256()
+    for path in sorted(str(path) for path in paths):
+        if Path(path).is_file():
+            digest.update(f'{path}\0{file_hash(path)}\0'.encode())
+    return digest.hexdigest()
+
+
+def tool_version(package):
+    """Installed version of ``package`` without starting a subprocess, or ``'not installed'``."""
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return 'not installed'
+
+
+class AnalysisCache:
+    """Results of one tool, per file, valid while the file and tool version are unchanged."""
+
+    def __init__(self, tool, version, cache_dir=CACHE_DIR):
+        self.path = Path(cache_dir) / f'{tool}.json'
+        self.version = version
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._hashes = {}
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if stored.get('version') == version:
+            self.entries = stored.get('entries', {})
+
+    def _hash(self, path):
+        key = str(path)
+        if key not in self._hashes:
+            self._hashes[key] = file_hash(path)
+        return self._hashes[key]
+
+    def get(self, path):
+        """Cached result for ``path``, or ``None`` if it is missing or stale."""
+        entry = self.entries.get(str(path))
+        if entry is not None and entry['sha256'] == self._hash(path):
+            self.hits += 1
+            return entry['result']
+        self.misses += 1
+        return None
+
+    def put(self, path, result):
+        self.entries[str(path)] = {'sha256': self._hash(path), 'result': result}
+
+    def save(self, keep=None):
+        """Write the index, keeping only ``keep`` paths if given."""
+        if keep is not None:
+            keep = {str(path) for path in keep}
+            self.entries = {path: entry for path, entry in self.entries.items() if path in keep}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.version, 'entries': self.entries}, f)
+        tmp_path.replace(self.path)
@@ -0,0 +1,319 @@
+"""Cyclomatic complexity, maintainability index and structure counts, in process.
+
+The same metrics ``radon cc`` and ``radon mi`` report, computed from the
+``ast`` and ``tokenize`` modules without starting a process or needing
+radon installed:
+
+* cyclomatic complexity per function, method and class: 1 plus one per
+  ``if``/``elif``/conditional expression, loop (and loop ``else``),
+  ``except`` handler (and ``try`` ``else``), extra ``and``/``or`` operand,
+  comprehension and comprehension ``if``, ``assert``, and non-wildcard
+  ``case``.  Nested functions are separate closures and do not add to the
+  enclosing function; a class scores its methods' average, as in radon.
+* maintainability index: radon's formula over Halstead volume, total
+  complexity, logical lines and the share of comment lines (docstrings
+  included), scaled to 0-100
+* function, method and class counts
+
+Each file is independent, so ``analyze_files`` spreads large file sets
+over a process pool.
+"""
+import ast
+import io
+import math
+import os
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+
+# Bump when any metric definition changes, so cached results are recomputed
+VERSION = '2'
+PARALLEL_THRESHOLD = 64
+
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+NON_CODE_TOKENS = {tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE, tokenize.INDENT,
+                   tokenize.DEDENT, tokenize.ENDMARKER}
+
+
+def cc_rank(complexity):
+    """Letter grade for a complexity: A (1-5) to F (41+)."""
+    if complexity <= 5:
+        return 'A'
+    return 'ABCDEF'[min(5, math.ceil(complexity / 10))]
+
+
+def mi_rank(mi):
+    """Letter grade for a maintainability index: A (>19), B (10-19), C (<=9)."""
+    if mi > 19:
+        return 'A'
+    return 'B' if mi > 9 else 'C'
+
+
+def decision_points(node):
+    """Branches added by ``node`` itself, not counting its children."""
+    if isinstance(node, (ast.If, ast.IfExp)):
+        return 1
+    if isinstance(node, (ast.For, ast.AsyncFor, ast.While)):
+        return 1 + bool(node.orelse)
+    if isinstance(node, ast.Try) or type(node).__name__ == 'TryStar':
+        return len(node.handlers) + bool(node.orelse)
+    if isinstance(node, ast.BoolOp):
+        return len(node.values) - 1
+    if isinstance(node, ast.comprehension):
+        return 1 + len(node.ifs)
+    if isinstance(node, ast.Match):
+        wildcard = any(isinstance(case.pattern, ast.MatchAs) and case.pattern.pattern is None
+                       for case in node.cases)
+        return max(0, len(node.cases) - wildcard)
+    return 0
+
+
+def walk_block(nodes, classname=None):
+    """Decision points under ``nodes``, plus the functions and classes defined there.
+
+    Function and class bodies are separate blocks: they are analyzed on
+    their own and not counted here.  Iterative, so deeply nested
+    expressions cannot hit the recursion limit.
+    """
+    count = 0
+    functions = []
+    classes = []
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, FUNCTION_NODES):
+            functions.append(function_block(node, classname))
+        elif isinstance(node, ast.ClassDef):
+            classes.append(class_block(node))
+        elif isinstance(node, ast.Assert):
+            # Like radon, an assert counts once and its condition is not inspected
+            count += 1
+        else:
+            count += decision_points(node)
+            stack.extend(ast.iter_child_nodes(node))
+    return count, functions, classes
+
+
+def function_block(node, classname=None):
+    count, closures, _ = walk_block(node.body)
+    block = {
+        'type': 'method' if classname else 'function',
+        'name': node.name,
+        'lineno': node.lineno,
+        'endline': node.end_lineno,
+        'col_offset': node.col_offset,
+        'complexity': 1 + count,
+        'rank': cc_rank(1 + count),
+        'closures': sorted(closures, key=lambda closure: closure['lineno'])
+    }
+    if classname:
+        block['classname'] = classname
+    return block
+
+
+def class_block(node):
+    methods = []
+    real_complexity = 1
+    for child in node.body:
+        count, functions, _ = walk_block([child], node.name)
+        methods.extend(functions)
+        real_complexity += count + sum(method['complexity'] for method in functions)
+    if methods:
+        complexity = int(real_complexity / len(methods)) + (len(methods) > 1)
+    else:
+        complexity = real_complexity
+    return {
+        'type': 'class',
+        'name': node.name,
+        'lineno': node.lineno,
+        'endline': node.end_lineno,
+        'col_offset': node.col_offset,
+        'complexity': complexity,
+        'rank': cc_rank(complexity),
+        'real_complexity': real_complexity,
+        'methods': sorted(methods, key=lambda method: method['lineno'])
+    }
+
+
+def halstead_volume(tree):
+    """Halstead volume ``N * log2(n)`` over operators and their operands.
+
+    Operands are told apart by name, attribute or constant value within
+    each function, as radon does; any other operand expression is distinct.
+    """
+    operators = operands = 0
+    distinct_operators = set()
+    distinct_operands = set()
+    stack = [(tree, None)]
+    while stack:
+        node, context = stack.pop()
+        if isinstance(node, FUNCTION_NODES):
+            stack.extend((child, node.name) for child in node.body)
+            continue
+        if isinstance(node, (ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.AugAssign)):
+            ops = [node.op]
+            if isinstance(node, ast.BinOp):
+                values = [node.left, node.right]
+            elif isinstance(node, ast.UnaryOp):
+                values = [node.operand]
+            elif isinstance(node, ast.BoolOp):
+                values = node.values
+            else:
+                values = [node.target, node.value]
+        elif isinstance(node, ast.Compare):
+            ops = node.ops
+            values = node.comparators + [node.left]
+        else:
+            ops = values = ()
+        operators += len(ops)
+        operands += len(values)
+        distinct_operators.update(type(op).__name__ for op in ops)
+        for value in values:
+            distinct_operands.add((context, operand_key(value)))
+        stack.extend((child, context) for child in ast.iter_child_nodes(node))
+    vocabulary = len(distinct_operators) + len(distinct_operands)
+    if vocabulary == 0:
+        return 0.0
+    return (operators + operands) * math.log2(vocabulary)
+
+
+def operand_key(node):
+    # Bare values, as radon compares them: name x, attribute .x and 'x' are one operand
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Constant):
+        return node.value
+    return node
+
+
+def logical_lines(part, last):
+    """Logical lines in one ``;``-separated statement: ``if x: y`` counts twice.
+
+    Mirrors radon, which looks at the last colon and sees an end marker
+    after the final part only.
+    """
+    if not part:
+        return 0
+    colons = [idx for idx, token in enumerate(part) if token.type == tokenize.OP and token.string == ':']
+    if not colons:
+        return 1
+    return 1 if colons[-1] == len(part) + last - 2 else 2
+
+
+def raw_metrics(source):
+    """Source lines, logical lines, comments and docstring lines, by radon's rules.
+
+    A statement made of nothing but a string (no trailing comment either)
+    is a docstring: one line long it counts as a comment line, longer its
+    lines count as ``multi``.
+    """
+    # Rows as tokenize numbers them (split on '\n' only), each kept as the
+    # pieces str.splitlines() gives: radon splits on form feeds and other line
+    # boundaries too, so a row holding one counts as several lines
+    lines = [line.splitlines() or [''] for line in io.StringIO(source).readlines()]
+    counts = {'sloc': 0, 'lloc': 0, 'comments': 0, 'multi': 0, 'single_comments': 0, 'blank': 0}
+    statement = []
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type in (tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER):
+            continue
+        statement.append(token)
+        code = [t for t in statement if t.type not in NON_CODE_TOKENS]
+        if token.type != tokenize.NEWLINE and (token.type != tokenize.NL or code):
+            continue
+        comments = sum(1 for t in statement if t.type == tokenize.COMMENT)
+        counts['comments'] += comments
+        first_row, last_row = statement[0].start[0], statement[-1].end[0]
+        rows = [piece.strip()
+                for row in range(first_row, last_row + 1)
+                for piece in (lines[row - 1] if row <= len(lines) else [''])]
+        if not code and comments:
+            counts['single_comments'] += 1
+        elif len(code) == 1 and code[0].type == tokenize.STRING and not comments:
+            if code[0].start[0] == code[0].end[0]:
+                counts['single_comments'] += 1
+            else:
+                counts['multi'] += sum(1 for row in rows if row)
+                counts['blank'] += sum(1 for row in rows if not row)
+        else:
+            counts['sloc'] += sum(1 for row in rows if row)
+            counts['blank'] += sum(1 for row in rows if not row)
+        part = []
+        for t in code:
+            if t.type == tokenize.OP and t.string == ';':
+                counts['lloc'] += logical_lines(part, last=False)
+                part = []
+            else:
+                part.append(t)
+        counts['lloc'] += logical_lines(part, last=True)
+        statement = []
+    return counts
+
+
+def mi_compute(volume, complexity, sloc, comments_percent):
+    """Maintainability index, 0-100 (radon's normalization of the classic formula)."""
+    if volume <= 0 or sloc <= 0:
+        return 100.0
+    comments_scale = math.sqrt(2.46 * math.radians(comments_percent))
+    mi = (171 - 5.2 * math.log(volume) - 0.23 * complexity - 16.2 * math.log(sloc)
+          + 50 * math.sin(comments_scale))
+    return min(max(0.0, mi * 100 / 171), 100.0)
+
+
+def analyze_source(source, filename='<unknown>'):
+    """All metrics for one module's source; raises ``SyntaxError`` if it does not parse."""
+    tree = ast.parse(source, filename)
+    module_decisions, functions, classes = walk_block(tree.body)
+    functions.sort(key=lambda block: block['lineno'])
+    classes.sort(key=lambda block: block['lineno'])
+
+    blocks = []
+    for block in functions:
+        blocks.append(block)
+    for cls in classes:
+        blocks.append(cls)
+        blocks.extend(cls['methods'])
+
+    total_complexity = (1 + module_decisions
+                        + sum(block['complexity'] - 1 for block in functions)
+                        + sum(cls['real_complexity'] - 1 for cls in classes))
+    raw = raw_metrics(source)
+    comments_percent = (raw['comments'] + raw['multi']) / raw['sloc'] * 100 if raw['sloc'] else 0
+    volume = halstead_volume(tree)
+    mi = mi_compute(volume, total_complexity, raw['lloc'], comments_percent)
+
+    return {
+        'blocks': blocks,
+        'mi': mi,
+        'rank': mi_rank(mi),
+        'total_complexity': total_complexity,
+        'halstead_volume': volume,
+        'functions': len(functions),
+        'methods': sum(len(cls['methods']) for cls in classes),
+        'classes': len(classes),
+        **raw
+    }
+
+
+def read_source(path):
+    # tokenize.open honors PEP 263 coding declarations, like the interpreter
+    with tokenize.open(path) as f:
+        return f.read()
+
+
+def analyze_file(path):
+    """``analyze_source`` for a file, or ``{'error': ...}`` if it cannot be read or parsed."""
+    try:
+        return analyze_source(read_source(path), str(path))
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError) as error:
+        return {'error': f"{type(error).__name__}: {error}"}
+
+
+def analyze_files(paths, workers=None):
+    """``analyze_file`` for each path, in a process pool for large file sets."""
+    paths = list(paths)
+    if len(paths) < PARALLEL_THRESHOLD:
+        return [analyze_file(path) for path in paths]
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze_file, paths, chunksize=max(1, len(paths) // (4 * workers))))
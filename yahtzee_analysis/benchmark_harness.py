@@ -0,0 +1,153 @@
+"""Micro-benchmark harness used by performance_profiler.py.
+
+Timing a single call between two ``perf_counter`` reads mostly measures the
+timer: for methods that run in well under a microsecond the clock resolution
+and call overhead swamp the result.  ``benchmark`` works like ``timeit``:
+
+1. warm up - call the function for ``WARMUP_SECONDS`` so caches, lazy
+   imports and the allocator are in steady state
+2. calibrate - double the inner loop count until one sample takes at least
+   ``MIN_SAMPLE_SECONDS``
+3. time - ``trials`` x ``samples_per_trial`` samples, each the mean per-call
+   time over the calibrated loop, minus the cost of an empty loop
+4. memory - a separate pass with ``tracemalloc`` running, so tracing never
+   slows down the timed samples
+
+Timing results are summarised as mean, std, median, p95 and p99 with
+bootstrap confidence intervals for the mean and median.
+"""
+import gc
+import statistics
+import time
+import tracemalloc
+from functools import partial
+
+import numpy as np
+
+NUM_TRIALS = 4  # Number of independent trial runs
+SAMPLES_PER_TRIAL = 21  # Number of samples per trial
+WARMUP_SECONDS = 0.05
+MIN_SAMPLE_SECONDS = 0.005
+MEMORY_SAMPLES = 20
+BOOTSTRAP_RESAMPLES = 2000
+CONFIDENCE = 0.95
+
+
+def _noop():
+    pass
+
+
+def _time_loops(call, loops):
+    """Seconds taken by ``loops`` calls of ``call``, with the GC paused as ``timeit`` does."""
+    iterator = range(loops)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in iterator:
+            call()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def warm_up(call, seconds=WARMUP_SECONDS):
+    """Call ``call`` repeatedly for about ``seconds``; return the number of calls made."""
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        call()
+        calls += 1
+    return calls
+
+
+def calibrate(call, min_seconds=MIN_SAMPLE_SECONDS):
+    """Smallest power-of-two loop count whose run takes at least ``min_seconds``."""
+    loops = 1
+    while _time_loops(call, loops) < min_seconds:
+        loops *= 2
+    return loops
+
+
+def percentile(values, q):
+    """``q``-th percentile (0-100) of ``values`` with linear interpolation."""
+    return float(np.percentile(values, q))
+
+
+def bootstrap_ci(values, statistic=np.median, resamples=BOOTSTRAP_RESAMPLES,
+                 confidence=CONFIDENCE, seed=0):
+    """Percentile bootstrap confidence interval ``[low, high]`` for ``statistic``."""
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return [float(values[0]), float(values[0])] if len(values) else [0.0, 0.0]
+    rng = np.random.default_rng(seed)
+    resampled = values[rng.integers(0, len(values), size=(resamples, len(values)))]
+    estimates = statistic(resampled, axis=1)
+    tail = (1 - confidence) / 2 * 100
+    return [float(np.percentile(estimates, tail)), float(np.percentile(estimates, 100 - tail))]
+
+
+def measure_memory(call, samples=MEMORY_SAMPLES):
+    """Net and peak allocations per call (KB), measured in their own ``tracemalloc`` pass."""
+    used = []
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+            call()
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            used.append((current_memory - start_memory) / 1024)
+            peaks.append((peak_memory - start_memory) / 1024)
+    finally:
+        tracemalloc.stop()
+    return used, peaks
+
+
+def benchmark(func, *args, trials=NUM_TRIALS, samples_per_trial=SAMPLES_PER_TRIAL,
+              memory_samples=MEMORY_SAMPLES, **kwargs):
+    """Benchmark ``func(*args, **kwargs)``; times are per call in milliseconds.
+
+    The returned dict keeps the original ``performance_metrics.json`` fields
+    (``execution_time_ms`` is the mean and ``execution_time_std`` the spread
+    of the per-trial means) and adds the distribution summary.
+    """
+    call = partial(func, *args, **kwargs)
+    warmup_calls = warm_up(call)
+    loops = calibrate(call)
+    overhead = min(_time_loops(partial(_noop), loops) for _ in range(3)) / loops
+
+    samples = []
+    trial_means = []
+    for _ in range(trials):
+        trial = [max(0.0, _time_loops(call, loops) / loops - overhead) * 1000
+                 for _ in range(samples_per_trial)]
+        trial_means.append(statistics.mean(trial))
+        samples.extend(trial)
+
+    used, peaks = measure_memory(call, memory_samples)
+
+    return {
+        'execution_time_ms': statistics.mean(samples),
+        'execution_time_std': statistics.stdev(trial_means) if len(trial_means) > 1 else 0,
+        'memory_used_kb': statistics.mean(used),
+        'memory_std_kb': statistics.stdev(used) if len(used) > 1 else 0,
+        'peak_memory_kb': statistics.mean(peaks),
+        'num_trials': trials,
+        'samples_per_trial': samples_per_trial,
+        'median_ms': statistics.median(samples),
+        'min_ms': min(samples),
+        'p95_ms': percentile(samples, 95),
+        'p99_ms': percentile(samples, 99),
+        'sample_std_ms': statistics.stdev(samples) if len(samples) > 1 else 0,
+        'mean_ci_ms': bootstrap_ci(samples, np.mean),
+        'median_ci_ms': bootstrap_ci(samples, np.median),
+        'confidence': CONFIDENCE,
+        'loops_per_sample': loops,
+        'warmup_calls': warmup_calls,
+        'loop_overhead_ms': overhead * 1000,
+        'memory_samples': memory_samples,
+        'samples_ms': samples
+    }
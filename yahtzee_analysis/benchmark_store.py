@@ -0,0 +1,313 @@
+"""History of performance_profiler.py runs and a regression gate.
+
+Every run of ``run_performance_analysis`` is recorded in an SQLite database
+(``data/benchmarks.db``) keyed by git commit and a machine fingerprint, with
+the per-method sample count, mean, standard deviation and percentiles from
+``benchmark_harness``.
+
+``compare`` matches two runs method by method and applies Welch's t-test
+to the per-sample times.  A method is a regression when it is slower with
+a one-sided p-value below ``ALPHA`` *and* its mean slowed down by more than
+``MIN_SLOWDOWN`` - the second condition keeps a real but negligible drift
+(say 1%) from failing the gate.  Runs are only compared on the same machine.
+
+Usage:
+    python benchmark_store.py record              # store data/performance_metrics.json
+    python benchmark_store.py list
+    python benchmark_store.py compare [BASE] [HEAD]
+
+BASE and HEAD are run ids or commit prefixes; by default HEAD is the latest
+run on this machine and BASE the latest earlier run from another commit.
+``compare`` exits with status 1 if any method regressed.
+"""
+import hashlib
+import json
+import math
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+
+DEFAULT_DB_PATH = Path(__file__).parent / 'data' / 'benchmarks.db'
+METRICS_PATH = Path(__file__).parent / 'data' / 'performance_metrics.json'
+ALPHA = 0.01
+MIN_SLOWDOWN = 0.05
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    commit_hash TEXT NOT NULL,
+    dirty INTEGER NOT NULL,
+    machine TEXT NOT NULL,
+    machine_info TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    module TEXT NOT NULL,
+    method TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    mean_ms REAL NOT NULL,
+    std_ms REAL NOT NULL,
+    median_ms REAL,
+    p95_ms REAL,
+    p99_ms REAL,
+    memory_used_kb REAL,
+    PRIMARY KEY (run_id, module, method)
+);
+CREATE INDEX IF NOT EXISTS runs_by_machine ON runs (machine, created_at);
+"""
+
+
+def machine_info():
+    """Properties of this machine and interpreter that affect timings."""
+    return {
+        'system': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation()
+    }
+
+
+def machine_fingerprint(info=None):
+    """Short stable hash of ``machine_info``."""
+    info = machine_info() if info is None else info
+    encoded = json.dumps(info, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def git_commit(repo=None):
+    """Return ``(commit hash, dirty)`` for the working tree, or ``('unknown', False)``."""
+    repo = repo or Path(__file__).parent
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=repo,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                cwd=repo, capture_output=True, text=True, check=True).stdout
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return 'unknown', False
+    return commit, bool(status.strip())
+
+
+def connect(db_path=DEFAULT_DB_PATH):
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def record_run(results, db_path=DEFAULT_DB_PATH, commit=None, dirty=False):
+    """Store a ``performance_metrics.json``-shaped dict; return the new run id."""
+    if commit is None:
+        commit, dirty = git_commit()
+    info = machine_info()
+    rows = []
+    for module, methods in results.items():
+        for method, metrics in methods.items():
+            n = len(metrics.get('samples_ms', ())) or metrics['num_trials'] * metrics['samples_per_trial']
+            rows.append((module, method, n, metrics['execution_time_ms'],
+                         metrics.get('sample_std_ms', metrics['execution_time_std']),
+                         metrics.get('median_ms'), metrics.get('p95_ms'), metrics.get('p99_ms'),
+                         metrics.get('memory_used_kb')))
+
+    with closing(connect(db_path)) as connection, connection:
+        cursor = connection.execute(
+            'INSERT INTO runs (commit_hash, dirty, machine, machine_info, created_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (commit, int(dirty), machine_fingerprint(info), json.dumps(info), time.time()))
+        run_id = cursor.lastrowid
+        connection.executemany(
+            'INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(run_id, *row) for row in rows])
+    return run_id
+
+
+def list_runs(db_path=DEFAULT_DB_PATH, machine=None):
+    """Runs newest first, optionally only those from one machine fingerprint."""
+    with closing(connect(db_path)) as connection:
+        if machine is None:
+            return connection.execute('SELECT * FROM runs ORDER BY id DESC').fetchall()
+        return connection.execute('SELECT * FROM runs WHERE machine = ? ORDER BY id DESC',
+                                  (machine,)).fetchall()
+
+
+def find_run(connection, ref, machine):
+    """Resolve a run id or commit prefix to the latest matching run on ``machine``."""
+    if ref.isdigit():
+        row = connection.execute('SELECT * FROM runs WHERE id = ?', (int(ref),)).fetchone()
+        if row is not None:
+            return row
+    row = connection.execute(
+        'SELECT * FROM runs WHERE commit_hash LIKE ? AND machine = ? ORDER BY id DESC LIMIT 1',
+        (ref + '%', machine)).fetchone()
+    if row is None:
+        raise ValueError(f"No run matches '{ref}' on this machine")
+    return row
+
+
+def default_runs(connection, machine):
+    """Latest run on ``machine`` and the latest earlier run from a different commit."""
+    head = connection.execute('SELECT * FROM runs WHERE machine = ? ORDER BY id DESC LIMIT 1',
+                              (machine,)).fetchone()
+    if head is None:
+        raise ValueError("No benchmark runs recorded on this machine")
+    base = connection.execute(
+        'SELECT * FROM runs WHERE machine = ? AND id < ? AND commit_hash != ? '
+        'ORDER BY id DESC LIMIT 1', (machine, head['id'], head['commit_hash'])).fetchone()
+    if base is None:
+        raise ValueError("No earlier run from another commit to compare against")
+    return base, head
+
+
+def _betacf(a, b, x):
+    """Continued fraction for the regularized incomplete beta function."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1, a - 1
+    c, d = 1.0, 1 - qab * x / qap
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        for aa in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                   -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+            d = 1 + aa * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + aa / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1) < 1e-12:
+            break
+    return h
+
+
+def _incomplete_beta(a, b, x):
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    log_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                 + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(log_front) * _betacf(a, b, x) / a
+    return 1 - math.exp(log_front) * _betacf(b, a, 1 - x) / b
+
+
+def t_sf(t, df):
+    """P(T > t) for Student's t distribution with ``df`` degrees of freedom."""
+    tail = 0.5 * _incomplete_beta(df / 2, 0.5, df / (df + t * t))
+    return tail if t >= 0 else 1 - tail
+
+
+def welch_t_test(mean_a, std_a, n_a, mean_b, std_b, n_b):
+    """Welch's t statistic, degrees of freedom and one-sided p-value for mean_b > mean_a.
+
+    Raises ``ValueError`` if either run has fewer than two samples, since its
+    variance (and so the degrees of freedom) is undefined.
+    """
+    if n_a < 2 or n_b < 2:
+        raise ValueError("insufficient samples")
+    var_a = std_a ** 2 / n_a
+    var_b = std_b ** 2 / n_b
+    if var_a + var_b == 0:
+        diff = mean_b - mean_a
+        return math.copysign(math.inf, diff) if diff else 0.0, math.inf, 0.0 if diff > 0 else 1.0
+    t = (mean_b - mean_a) / math.sqrt(var_a + var_b)
+    df = (var_a + var_b) ** 2 / (var_a ** 2 / (n_a - 1) + var_b ** 2 / (n_b - 1))
+    return t, df, t_sf(t, df)
+
+
+def compare_runs(connection, base_id, head_id, alpha=ALPHA, min_slowdown=MIN_SLOWDOWN):
+    """Per-method comparison rows for the methods both runs measured."""
+    query = 'SELECT * FROM results WHERE run_id = ?'
+    base = {(row['module'], row['method']): row for row in connection.execute(query, (base_id,))}
+    head = {(row['module'], row['method']): row for row in connection.execute(query, (head_id,))}
+    rows = []
+    for key in sorted(base.keys() & head.keys()):
+        a, b = base[key], head[key]
+        try:
+            t, df, p_value = welch_t_test(a['mean_ms'], a['std_ms'], a['n'],
+                                          b['mean_ms'], b['std_ms'], b['n'])
+        except ValueError:
+            # Too few samples to test; reported, but never flagged as a regression
+            t = df = p_value = None
+        change = (b['mean_ms'] - a['mean_ms']) / a['mean_ms'] if a['mean_ms'] else 0.0
+        rows.append({
+            'module': key[0],
+            'method': key[1],
+            'base_ms': a['mean_ms'],
+            'head_ms': b['mean_ms'],
+            'change': change,
+            't': t,
+            'df': df,
+            'p_value': p_value,
+            'regression': p_value is not None and p_value < alpha and change > min_slowdown
+        })
+    return rows
+
+
+def compare(base_ref=None, head_ref=None, db_path=DEFAULT_DB_PATH, alpha=ALPHA,
+            min_slowdown=MIN_SLOWDOWN):
+    """Compare two recorded runs; print a report and return the rows."""
+    machine = machine_fingerprint()
+    with closing(connect(db_path)) as connection:
+        if base_ref is None:
+            base, head = default_runs(connection, machine)
+        else:
+            base = find_run(connection, base_ref, machine)
+            head = (find_run(connection, head_ref, machine) if head_ref is not None
+                    else default_runs(connection, machine)[1])
+        if base['machine'] != head['machine']:
+            raise ValueError("Runs were recorded on different machines")
+        rows = compare_runs(connection, base['id'], head['id'], alpha, min_slowdown)
+
+    print(f"Base: run {base['id']} ({base['commit_hash'][:10]})   "
+          f"Head: run {head['id']} ({head['commit_hash'][:10]}{'+dirty' if head['dirty'] else ''})")
+    print(f"Regression: one-sided Welch p < {alpha} and slowdown > {min_slowdown:.0%}")
+    print("=" * 80)
+    for row in rows:
+        flag = 'REGRESSION' if row['regression'] else ''
+        name = f"{row['module']}.{row['method']}"
+        p_text = 'insufficient samples' if row['p_value'] is None else f"p={row['p_value']:.2g}"
+        print(f"  {name:45s} {row['base_ms'] * 1000:9.3f}µs -> "
+              f"{row['head_ms'] * 1000:9.3f}µs {row['change']:+7.1%}  {p_text} {flag}")
+    regressions = sum(row['regression'] for row in rows)
+    print(f"\n{regressions} regression(s) in {len(rows)} methods")
+    return rows
+
+
+def main(argv, db_path=DEFAULT_DB_PATH):
+    """Run one command-line command; return the process exit status."""
+    command = argv[0] if argv else 'compare'
+    try:
+        if command == 'record':
+            with open(METRICS_PATH) as f:
+                run_id = record_run(json.load(f), db_path)
+            print(f"Recorded run {run_id} in {db_path}")
+        elif command == 'list':
+            for run in list_runs(db_path):
+                stamp = time.strftime('%Y-%m-%d %H:%M', time.localtime(run['created_at']))
+                print(f"  {run['id']:5d}  {run['commit_hash'][:10]}{'+dirty' if run['dirty'] else '      '}"
+                      f"  {run['machine']}  {stamp}")
+        elif command == 'compare':
+            rows = compare(*argv[1:3], db_path=db_path)
+            return 1 if any(row['regression'] for row in rows) else 0
+        else:
+            print(f"Unknown command '{command}' (expected record, list or compare)")
+            return 2
+    except ValueError as error:
+        print(error)
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -7,17 +7,13 @@ import sys
 yahtzee_game_path = Path(__file__).parent.parent / 'yahtzee_game'
 sys.path.insert(0, str(yahtzee_game_path))
 
-from game import Game
+from simulation import GreedyStrategy, run_simulation
+
+NUM_GAMES = 200
 
 def run_game_simulation():
-    game = Game(2)
-    
-    for _ in range(10):
-        game.roll_dice()
-        game.set_frequency()
-        game.calculate_score(0)
-        game.calculate_score(6)
-        game.calculate_score(11)
+    # Full headless games, so the profile reflects a real game loop
+    run_simulation(NUM_GAMES, GreedyStrategy(), seed=0)
 
 def profile_with_cprofile():
     print("Running cProfile analysis...")
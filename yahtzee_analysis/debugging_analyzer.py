@@ -1,11 +1,69 @@
 import subprocess
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
+from analysis_cache import CACHE_DIR, AnalysisCache, inputs_hash, tool_version
+from readability_analyzer import source_files as game_modules
+
 yahtzee_game_path = Path(__file__).parent.parent / 'yahtzee_game'
 sys.path.insert(0, str(yahtzee_game_path))
 
+PYLINT_CONFIG_NAMES = ('pylintrc', '.pylintrc', 'pyproject.toml', 'setup.cfg', 'tox.ini')
+
+
+def pylint_config_files(yahtzee_path):
+    """Every file pylint may read its configuration from when run in ``yahtzee_path``."""
+    directories = [Path(yahtzee_path).resolve(), *Path(yahtzee_path).resolve().parents]
+    candidates = [directory / name for directory in directories for name in PYLINT_CONFIG_NAMES]
+    if os.environ.get('PYLINTRC'):
+        candidates.append(Path(os.environ['PYLINTRC']))
+    home = Path.home()
+    candidates += [home / '.pylintrc', home / '.config' / 'pylintrc', Path('/etc/pylintrc')]
+    return candidates
+
+
+def pylint_cache(yahtzee_path, source_files, cache_dir=CACHE_DIR):
+    """The pylint result cache, valid only while every linted module and the config are unchanged.
+
+    Messages such as no-member, import-error and the signature checks depend
+    on the modules a file imports, so one file's result is only reusable when
+    none of them changed either.
+    """
+    inputs = [Path(yahtzee_path) / file for file in source_files] + pylint_config_files(yahtzee_path)
+    version = f"{tool_version('pylint')}-{inputs_hash(inputs)}"
+    return AnalysisCache('pylint', version, cache_dir)
+
+
+def pylint_file(file_path):
+    try:
+        # Run in the game directory so pylint finds the same config files that are hashed
+        result = subprocess.run(
+            ['pylint', str(file_path), '--output-format=json'],
+            capture_output=True, text=True, cwd=Path(file_path).parent
+        )
+        
+        if not result.stdout:
+            return None
+        issues = json.loads(result.stdout)
+        metrics = {
+            'total_issues': len(issues),
+            'by_type': {},
+            'issues': issues
+        }
+        
+        for issue in issues:
+            issue_type = issue.get('type', 'unknown')
+            metrics['by_type'][issue_type] = metrics['by_type'].get(issue_type, 0) + 1
+        return metrics
+        
+    except FileNotFoundError:
+        return 'pylint not installed'
+    except json.JSONDecodeError:
+        return 'Could not parse pylint output'
+
 def run_pylint_analysis():
     print("Running pylint analysis...")
     
@@ -13,36 +71,28 @@ def run_pylint_analysis():
     output_dir = Path(__file__).parent / 'data'
     output_dir.mkdir(exist_ok=True)
     
-    source_files = ['dice.py', 'scorecard.py', 'game.py', 'main.py']
-    results = {}
+    source_files = [path.name for path in game_modules(yahtzee_path)]
+    
+    # Nothing is relinted unless a module, the pylint config or pylint itself changed
+    cache = pylint_cache(yahtzee_path, source_files)
+    cached = {file: cache.get(yahtzee_path / file) for file in source_files}
+    stale = [file for file in source_files if cached[file] is None]
+    
+    # One pylint process per file, run side by side
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        file_results = dict(zip(stale, pool.map(lambda file: pylint_file(yahtzee_path / file), stale)))
+    for file, metrics in file_results.items():
+        # Messages such as 'pylint not installed' are not results; retry those next time
+        if isinstance(metrics, dict):
+            cache.put(yahtzee_path / file, metrics)
+    cache.save(keep=[yahtzee_path / file for file in source_files])
+    print(f"Cache: {cache.hits} unchanged, {len(stale)} linted")
     
+    results = {}
     for file in source_files:
-        file_path = yahtzee_path / file
-        if not file_path.exists():
-            continue
-        
-        try:
-            result = subprocess.run(
-                ['pylint', str(file_path), '--output-format=json'],
-                capture_output=True, text=True
-            )
-            
-            if result.stdout:
-                issues = json.loads(result.stdout)
-                results[file] = {
-                    'total_issues': len(issues),
-                    'by_type': {},
-                    'issues': issues
-                }
-                
-                for issue in issues:
-                    issue_type = issue.get('type', 'unknown')
-                    results[file]['by_type'][issue_type] = results[file]['by_type'].get(issue_type, 0) + 1
-            
-        except FileNotFoundError:
-            results[file] = 'pylint not installed'
-        except json.JSONDecodeError:
-            results[file] = 'Could not parse pylint output'
+        metrics = cached[file] if cached[file] is not None else file_results[file]
+        if metrics is not None:
+            results[file] = metrics
     
     with open(output_dir / 'pylint_metrics.json', 'w') as f:
         json.dump(results, f, indent=2)
@@ -96,5 +146,8 @@ def run_test_coverage():
         print("coverage not installed - run: pip install coverage")
 
 if __name__ == '__main__':
-    run_pylint_analysis()
-    run_test_coverage()
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'all'
+    if mode in ('pylint', 'all'):
+        run_pylint_analysis()
+    if mode in ('coverage', 'all'):
+        run_test_coverage()
@@ -0,0 +1,305 @@
+"""Source metrics for whole repositories, streamed as JSON lines.
+
+Walks a directory tree, picks files by glob include/exclude patterns, and
+analyzes each file according to its language:
+
+* ``.py`` - line counts (``count_lines``), plus total and largest
+  cyclomatic complexity, maintainability index and function/class counts
+  from ``ast_metrics.py``
+* ``.scala`` - line counts plus structure, immutability and error handling
+  counts from ``yahtzee_scala_analysis/scala_scanner.py``
+
+Files are analyzed in batches on a process pool.  At most ``WINDOW_PER_WORKER``
+batches per worker are in flight, and results are consumed in walk order.
+Every directory is one package; its files are written as they finish,
+followed by a package record once the walk moves on.  Memory use therefore
+depends on the largest directory, not on the size of the repository.
+
+Patterns follow .gitignore conventions: a pattern without ``/`` matches a
+file or directory name at any depth (``*.py``, ``tests``), and one with
+``/`` matches the path relative to the root segment by segment, so ``*``
+stays within one directory (``yahtzee_game/*.py`` does not match
+``yahtzee_game/tests/test_dice.py``) and only ``**`` spans directories
+(``**/generated/**``).  Excluded directories are not descended into.
+
+Output (``data/source_metrics.jsonl``), one JSON object per line:
+
+    {"type": "file", "path": "yahtzee_game/dice.py", "package": "yahtzee_game", "language": "python", ...}
+    {"type": "package", "package": "yahtzee_game", "files": 21, "languages": {"python": 21}, ...}
+    {"type": "total", "files": 120, "packages": 9, ...}
+
+Usage:
+    python metrics_engine.py                          # whole repository
+    python metrics_engine.py ../yahtzee_game          # one directory
+    python metrics_engine.py ROOT '*.scala' '!test'   # include, and !exclude, patterns
+"""
+import json
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatchcase
+from heapq import nlargest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'yahtzee_scala_analysis'))
+
+import ast_metrics
+import scala_scanner
+
+REPO_ROOT = Path(__file__).parent.parent
+OUTPUT_PATH = Path(__file__).parent / 'data' / 'source_metrics.jsonl'
+
+DEFAULT_INCLUDE = ['*.py', '*.scala']
+DEFAULT_EXCLUDE = ['.*', '__pycache__', 'target', 'build', 'dist', 'node_modules', 'venv', '*.egg-info']
+
+BATCH_SIZE = 32
+WINDOW_PER_WORKER = 4
+LINE_KEYS = ['total_lines', 'code_lines', 'comment_lines', 'blank_lines']
+
+
+def count_lines(file_path):
+    with open(file_path) as f:
+        return count_source_lines(f.read())
+
+
+def count_source_lines(content):
+    lines = content.split('\n')
+
+    return {
+        'total_lines': len(lines),
+        'code_lines': len([l for l in lines if l.strip() and not l.strip().startswith('#')]),
+        'comment_lines': len([l for l in lines if l.strip().startswith('#')]),
+        'blank_lines': len([l for l in lines if not l.strip()])
+    }
+
+
+def python_metrics(path):
+    source = ast_metrics.read_source(path)
+    metrics = count_source_lines(source)
+    try:
+        code = ast_metrics.analyze_source(source, str(path))
+    except (SyntaxError, ValueError) as error:
+        metrics['complexity_error'] = f"{type(error).__name__}: {error}"
+        return metrics
+    metrics.update({
+        'complexity': code['total_complexity'],
+        'max_complexity': max((block['complexity'] for block in code['blocks']), default=0),
+        'mi': code['mi'],
+        'mi_rank': code['rank'],
+        'functions': code['functions'],
+        'methods': code['methods'],
+        'classes': code['classes']
+    })
+    return metrics
+
+
+def scala_metrics(path):
+    scan = scala_scanner.scan_file(path)
+    lines = scan['lines']
+    metrics = {
+        'total_lines': lines['total'],
+        'code_lines': lines['code'],
+        'comment_lines': lines['comments'],
+        'blank_lines': lines['blank']
+    }
+    for group, keys in scala_scanner.METRICS.items():
+        metrics[group] = {key: scan['tokens'].get(name, 0) for key, name in keys.items()}
+    return metrics
+
+
+# File suffix -> (language, metrics function)
+LANGUAGES = {
+    '.py': ('python', python_metrics),
+    '.scala': ('scala', scala_metrics),
+}
+
+
+def matches(rel_path, patterns):
+    """Whether a root-relative posix path matches any of ``patterns`` (.gitignore style)."""
+    name = rel_path.rsplit('/', 1)[-1]
+    parts = rel_path.split('/')
+    for pattern in patterns:
+        if '/' not in pattern:
+            if fnmatchcase(name, pattern):
+                return True
+        elif _match_segments(parts, pattern.strip('/').split('/')):
+            return True
+    return False
+
+
+def _match_segments(parts, segments):
+    # fnmatch within one path segment; '**' matches any number of whole segments
+    if not segments:
+        return not parts
+    if segments[0] == '**':
+        return any(_match_segments(parts[idx:], segments[1:]) for idx in range(len(parts) + 1))
+    return bool(parts) and fnmatchcase(parts[0], segments[0]) and _match_segments(parts[1:], segments[1:])
+
+
+def walk_packages(root, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE):
+    """Yield ``(package, files)`` for every directory under ``root`` with matching files.
+
+    ``package`` is the directory relative to ``root`` (``'.'`` for the root
+    itself).  Directories and files come in sorted order.
+    """
+    root = Path(root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root)
+        dirnames[:] = sorted(name for name in dirnames
+                             if not matches((rel_dir / name).as_posix(), exclude))
+        files = []
+        for name in sorted(filenames):
+            rel_path = (rel_dir / name).as_posix()
+            if (Path(name).suffix in LANGUAGES and matches(rel_path, include)
+                    and not matches(rel_path, exclude)):
+                files.append(Path(dirpath) / name)
+        if files:
+            yield rel_dir.as_posix(), files
+
+
+def find_files(root, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE):
+    """Matching files under ``root``, in walk order."""
+    return [path for _, files in walk_packages(root, include, exclude) for path in files]
+
+
+def analyze_file(path):
+    """Language and metrics for one file; unreadable files get an ``error`` instead."""
+    language, metrics_function = LANGUAGES[Path(path).suffix]
+    try:
+        return language, metrics_function(path)
+    except (OSError, UnicodeDecodeError, SyntaxError) as error:
+        return language, {'error': f"{type(error).__name__}: {error}"}
+
+
+def analyze_batch(paths):
+    return [analyze_file(path) for path in paths]
+
+
+def batches(packages, batch_size):
+    """Split each package's files into batches; a batch never spans two packages."""
+    for package, files in packages:
+        for start in range(0, len(files), batch_size):
+            yield package, files[start:start + batch_size]
+
+
+def analyzed_batches(packages, workers, batch_size=BATCH_SIZE):
+    """Yield ``(package, files, results)`` per batch, in order, with a bounded number in flight."""
+    if workers == 1:
+        for package, files in batches(packages, batch_size):
+            yield package, files, analyze_batch(files)
+        return
+    window = workers * WINDOW_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for package, files in batches(packages, batch_size):
+            pending.append((package, files, pool.submit(analyze_batch, files)))
+            if len(pending) >= window:
+                package, files, future = pending.popleft()
+                yield package, files, future.result()
+        while pending:
+            package, files, future = pending.popleft()
+            yield package, files, future.result()
+
+
+def package_record(package, summary):
+    return {
+        'type': 'package',
+        'package': package,
+        'files': sum(summary['languages'].values()),
+        'languages': dict(summary['languages']),
+        'errors': summary['errors'],
+        **{key: summary['lines'][key] for key in LINE_KEYS}
+    }
+
+
+def new_summary():
+    return {'languages': Counter(), 'errors': 0, 'lines': Counter({key: 0 for key in LINE_KEYS})}
+
+
+def add_to_summary(summary, language, metrics):
+    summary['languages'][language] += 1
+    if 'error' in metrics:
+        summary['errors'] += 1
+    else:
+        summary['lines'].update({key: metrics[key] for key in LINE_KEYS})
+
+
+def scan_repository(root=REPO_ROOT, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE, workers=None):
+    """Yield a record per file, one per package after its files, and a final total record."""
+    root = Path(root)
+    workers = workers or os.cpu_count() or 1
+    total = new_summary()
+    packages = 0
+    current, summary = None, None
+    for package, files, results in analyzed_batches(walk_packages(root, include, exclude), workers):
+        if package != current:
+            if current is not None:
+                yield package_record(current, summary)
+            current, summary = package, new_summary()
+            packages += 1
+        for path, (language, metrics) in zip(files, results):
+            add_to_summary(summary, language, metrics)
+            add_to_summary(total, language, metrics)
+            yield {
+                'type': 'file',
+                'path': path.relative_to(root).as_posix(),
+                'package': package,
+                'language': language,
+                **metrics
+            }
+    if current is not None:
+        yield package_record(current, summary)
+    yield dict(package_record('.', total), type='total', packages=packages, workers=workers)
+
+
+def write_jsonl(records, output_path=OUTPUT_PATH):
+    """Write ``records`` one per line as they arrive; return the last record (the total)."""
+    output_path.parent.mkdir(exist_ok=True)
+    record = None
+    with open(output_path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+    return record
+
+
+def parse_patterns(args):
+    """Split command-line patterns into include and ``!``-prefixed exclude lists."""
+    include = [arg for arg in args if not arg.startswith('!')]
+    exclude = [arg[1:] for arg in args if arg.startswith('!')]
+    return include or DEFAULT_INCLUDE, DEFAULT_EXCLUDE + exclude
+
+
+if __name__ == '__main__':
+    root = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else REPO_ROOT
+    include, exclude = parse_patterns(sys.argv[2:])
+
+    print(f"Scanning {root}...")
+    print(f"Include: {include}  Exclude: {exclude}")
+    print("=" * 80)
+
+    largest = []
+
+    def track_packages(records):
+        # Keep only the ten largest packages for the report below
+        for record in records:
+            if record['type'] == 'package':
+                largest.append(record)
+                largest[:] = nlargest(10, largest, key=lambda r: r['code_lines'])
+            yield record
+
+    total = write_jsonl(track_packages(scan_repository(root, include, exclude)))
+
+    print(f"\n{total['files']} files in {total['packages']} packages "
+          f"({', '.join(f'{n} {language}' for language, n in total['languages'].items()) or 'none'}), "
+          f"{total['workers']} workers")
+    print(f"Lines: {total['total_lines']} total, {total['code_lines']} code, "
+          f"{total['comment_lines']} comment, {total['blank_lines']} blank")
+    if total['errors']:
+        print(f"Unreadable files: {total['errors']}")
+    print("\nLargest packages by code lines:")
+    print("-" * 80)
+    for record in largest:
+        print(f"  {record['package']:50s} | {record['files']:5d} files | {record['code_lines']:8d} code lines")
+
+    print(f"\nResults saved to: {OUTPUT_PATH}")
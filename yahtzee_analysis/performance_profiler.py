@@ -1,9 +1,10 @@
-import time
-import tracemalloc
 import json
 from pathlib import Path
 import sys
-import statistics
+
+from benchmark_store import DEFAULT_DB_PATH, record_run
+from benchmark_harness import (NUM_TRIALS, SAMPLES_PER_TRIAL, WARMUP_SECONDS,
+                               MIN_SAMPLE_SECONDS, benchmark)
 
 yahtzee_game_path = Path(__file__).parent.parent / 'yahtzee_game'
 sys.path.insert(0, str(yahtzee_game_path))
@@ -12,51 +13,9 @@ from dice import Dice
 from scorecard import Scorecard
 from game import Game
 
-# Configuration for statistical accuracy
-NUM_TRIALS = 4  # Number of independent trial runs
-SAMPLES_PER_TRIAL = 21  # Number of samples per trial
-
 def profile_method(func, *args, **kwargs):
-    """Profile a method with multiple trials and samples for statistical accuracy."""
-    all_times = []
-    all_memory = []
-    all_peak_memory = []
-    
-    for trial in range(NUM_TRIALS):
-        trial_times = []
-        trial_memory = []
-        trial_peak = []
-        
-        for sample in range(SAMPLES_PER_TRIAL):
-            tracemalloc.start()
-            start_time = time.perf_counter()
-            start_memory = tracemalloc.get_traced_memory()[0]
-            
-            result = func(*args, **kwargs)
-            
-            end_time = time.perf_counter()
-            current_memory, peak_memory = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            
-            trial_times.append((end_time - start_time) * 1000)
-            trial_memory.append((current_memory - start_memory) / 1024)
-            trial_peak.append(peak_memory / 1024)
-        
-        # Collect average from each trial
-        all_times.append(statistics.mean(trial_times))
-        all_memory.append(statistics.mean(trial_memory))
-        all_peak_memory.append(statistics.mean(trial_peak))
-    
-    # Calculate statistics across all trials
-    return {
-        'execution_time_ms': statistics.mean(all_times),
-        'execution_time_std': statistics.stdev(all_times) if len(all_times) > 1 else 0,
-        'memory_used_kb': statistics.mean(all_memory),
-        'memory_std_kb': statistics.stdev(all_memory) if len(all_memory) > 1 else 0,
-        'peak_memory_kb': statistics.mean(all_peak_memory),
-        'num_trials': NUM_TRIALS,
-        'samples_per_trial': SAMPLES_PER_TRIAL
-    }
+    """Benchmark a method: warmup, calibrated inner loops, then a separate memory pass."""
+    return benchmark(func, *args, **kwargs)
 
 def profile_dice():
     results = {}
@@ -94,11 +53,9 @@ def profile_game():
     
     # Sorted dice operations
     results['game_get_sorted_dice'] = profile_method(game.get_sorted_dice)
-    results['game_set_sorted_dice'] = profile_method(game.set_sorted_dice)
     
     # Frequency operations
     results['game_get_frequency'] = profile_method(game.get_frequency)
-    results['game_set_frequency'] = profile_method(game.set_frequency)
     
     # Scoring calculations (all categories)
     results['game_calculate_score_ones'] = profile_method(game.calculate_score, 0)
@@ -134,7 +91,8 @@ def profile_game():
 
 def run_performance_analysis():
     print("Running performance analysis...")
-    print(f"Configuration: {NUM_TRIALS} trials × {SAMPLES_PER_TRIAL} samples per trial")
+    print(f"Configuration: {NUM_TRIALS} trials × {SAMPLES_PER_TRIAL} samples per trial, "
+          f"{WARMUP_SECONDS * 1000:.0f}ms warmup, ≥{MIN_SAMPLE_SECONDS * 1000:.0f}ms per sample")
     print("=" * 80)
     
     all_results = {
@@ -155,14 +113,20 @@ def run_performance_analysis():
         print(f"\n{module.upper()}")
         print("-" * 80)
         for method, metrics in methods.items():
-            time_mean = metrics['execution_time_ms']
-            time_std = metrics['execution_time_std']
+            median = metrics['median_ms'] * 1000
+            low, high = (value * 1000 for value in metrics['median_ci_ms'])
+            p99 = metrics['p99_ms'] * 1000
             mem_mean = metrics['memory_used_kb']
             mem_std = metrics['memory_std_kb']
-            print(f"  {method:30s} | Time: {time_mean:7.4f}±{time_std:6.4f}ms | Memory: {mem_mean:7.2f}±{mem_std:5.2f}KB")
+            print(f"  {method:30s} | Median: {median:8.3f}µs [{low:8.3f}, {high:8.3f}] | "
+                  f"p99: {p99:8.3f}µs | Memory: {mem_mean:7.2f}±{mem_std:5.2f}KB")
+    
+    run_id = record_run(all_results)
     
     print(f"\nResults saved to: {output_dir / 'performance_metrics.json'}")
-    print(f"Statistics: Mean ± Std Dev from {NUM_TRIALS} trials")
+    print(f"Recorded as run {run_id} in {DEFAULT_DB_PATH} (compare with: python benchmark_store.py compare)")
+    print(f"Statistics: per-call median with a 95% bootstrap CI over "
+          f"{NUM_TRIALS * SAMPLES_PER_TRIAL} samples; memory from a separate tracemalloc pass")
     return all_results
 
 if __name__ == '__main__':
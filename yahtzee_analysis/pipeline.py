@@ -0,0 +1,202 @@
+"""Run the analysis stages as a dependency graph on a worker pool.
+
+Every stage is one analysis script run as a subprocess.  A stage starts as
+soon as all of its dependencies have finished, so independent stages run
+side by side.  Inside a stage, per-file pylint calls are spread over
+threads too.
+
+Stages that measure time are marked ``exclusive``: they run alone, since
+sharing the CPU with another stage would skew their results.  Everything
+else overlaps, so the run takes about as long as the exclusive stages plus
+the slowest chain of the rest.
+
+Each stage's output goes to ``data/logs/<stage>.log``.  If a stage fails,
+its dependents are skipped and the pipeline exits with status 1.  Wall-clock
+time per stage is printed and saved to ``data/pipeline_timings.json``.
+
+Usage:
+    python pipeline.py                 # every stage, one worker per CPU
+    python pipeline.py 4               # at most 4 stages at once
+    python pipeline.py 4 readability   # selected stages and their dependencies
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+ANALYSIS_DIR = Path(__file__).parent
+OUTPUT_DIR = ANALYSIS_DIR / 'data'
+LOG_DIR = OUTPUT_DIR / 'logs'
+
+
+class Stage:
+    """One analysis step: a command, the stages it needs, and whether it must run alone."""
+
+    def __init__(self, name, args, deps=(), exclusive=False):
+        self.name = name
+        self.args = list(args)
+        self.deps = tuple(deps)
+        self.exclusive = exclusive
+
+    @property
+    def command(self):
+        return [sys.executable] + self.args
+
+
+STAGES = [
+    Stage('performance', ['performance_profiler.py'], exclusive=True),
+    Stage('scoring_benchmark', ['scoring_benchmark.py'], exclusive=True),
+    Stage('throughput', ['throughput_benchmark.py'], exclusive=True),
+    Stage('sampling_profile', ['sampling_profiler.py'], exclusive=True),
+    Stage('allocations', ['allocation_profiler.py']),
+    Stage('cprofile', ['cprofile_analyzer.py']),
+    Stage('readability', ['readability_analyzer.py']),
+    Stage('source_metrics', ['metrics_engine.py']),
+    Stage('pylint', ['debugging_analyzer.py', 'pylint']),
+    Stage('coverage', ['debugging_analyzer.py', 'coverage']),
+    Stage('visualize', ['visualizer.py'],
+          deps=('performance', 'throughput', 'allocations', 'readability', 'pylint')),
+]
+
+
+def select_stages(stages, names):
+    """The named stages plus everything they depend on, in their original order."""
+    by_name = {stage.name: stage for stage in stages}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(unknown)}")
+    wanted = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in wanted:
+            wanted.add(name)
+            pending.extend(by_name[name].deps)
+    return [stage for stage in stages if stage.name in wanted]
+
+
+def check_graph(stages):
+    """Raise ``ValueError`` for unknown dependencies or cycles."""
+    names = {stage.name for stage in stages}
+    for stage in stages:
+        missing = [dep for dep in stage.deps if dep not in names]
+        if missing:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown stages {missing}")
+    done = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [stage for stage in remaining if set(stage.deps) <= done]
+        if not ready:
+            raise ValueError(f"Dependency cycle among {[stage.name for stage in remaining]}")
+        done.update(stage.name for stage in ready)
+        remaining = [stage for stage in remaining if stage.name not in done]
+
+
+def run_stage(stage, log_dir=LOG_DIR):
+    """Run one stage's command, logging its output; return ``(returncode, seconds)``."""
+    log_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    with open(log_dir / f'{stage.name}.log', 'w') as log:
+        result = subprocess.run(stage.command, cwd=ANALYSIS_DIR, stdout=log,
+                                stderr=subprocess.STDOUT)
+    return result.returncode, time.perf_counter() - start
+
+
+def run_pipeline(stages=STAGES, workers=None, runner=run_stage):
+    """Run ``stages`` respecting dependencies; return ``{name: result dict}``."""
+    check_graph(stages)
+    workers = workers or os.cpu_count() or 1
+    pending = {stage.name: stage for stage in stages}
+    status = {}
+    results = {}
+    running = {}
+    pipeline_start = time.perf_counter()
+
+    def print_result(name, message):
+        print(f"  [{time.perf_counter() - pipeline_start:7.1f}s] {name:18s} {message}")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            # Dependents of a failed or skipped stage are skipped
+            for name, stage in list(pending.items()):
+                if any(status.get(dep) in ('failed', 'skipped') for dep in stage.deps):
+                    del pending[name]
+                    status[name] = 'skipped'
+                    results[name] = {'status': 'skipped', 'seconds': 0.0}
+                    print_result(name, "skipped (dependency failed)")
+
+            exclusive_running = any(stage.exclusive for stage, _ in running.values())
+            for name, stage in list(pending.items()):
+                if len(running) >= workers or exclusive_running:
+                    break
+                if not all(status.get(dep) == 'ok' for dep in stage.deps):
+                    continue
+                if stage.exclusive and running:
+                    # Wait for the pool to drain; nothing else starts meanwhile
+                    break
+                del pending[name]
+                running[pool.submit(runner, stage)] = (stage, time.perf_counter() - pipeline_start)
+                print_result(name, "started" + (" (exclusive)" if stage.exclusive else ""))
+                exclusive_running = stage.exclusive
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, started_at = running.pop(future)
+                try:
+                    returncode, seconds = future.result()
+                except OSError as error:
+                    returncode, seconds = str(error), 0.0
+                status[stage.name] = 'ok' if returncode == 0 else 'failed'
+                results[stage.name] = {
+                    'status': status[stage.name],
+                    'returncode': returncode,
+                    'started_s': started_at,
+                    'seconds': seconds,
+                    'exclusive': stage.exclusive
+                }
+                print_result(stage.name, f"{status[stage.name]} in {seconds:.1f}s")
+
+    results['_total'] = {
+        'wall_seconds': time.perf_counter() - pipeline_start,
+        'stage_seconds': sum(r['seconds'] for name, r in results.items() if name != '_total'),
+        'workers': workers
+    }
+    return results
+
+
+if __name__ == '__main__':
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    try:
+        stages = select_stages(STAGES, sys.argv[2:]) if len(sys.argv) > 2 else STAGES
+    except ValueError as error:
+        print(error)
+        sys.exit(2)
+
+    print("Running analysis pipeline...")
+    print(f"Stages: {', '.join(stage.name for stage in stages)}")
+    print("=" * 80)
+    results = run_pipeline(stages, workers)
+    total = results['_total']
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    with open(OUTPUT_DIR / 'pipeline_timings.json', 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print("\nStage timings:")
+    print("-" * 80)
+    for stage in stages:
+        result = results[stage.name]
+        print(f"  {stage.name:18s} {result['status']:8s} {result['seconds']:7.1f}s")
+    print(f"\nWall clock: {total['wall_seconds']:.1f}s for {total['stage_seconds']:.1f}s of stages "
+          f"({total['workers']} workers)")
+    print(f"Logs saved to: {LOG_DIR}")
+    print(f"Timings saved to: {OUTPUT_DIR / 'pipeline_timings.json'}")
+    failed = [name for name, result in results.items() if result.get('status') == 'failed']
+    if failed:
+        print(f"Failed stages: {', '.join(failed)}")
+    sys.exit(1 if failed else 0)
@@ -1,7 +1,36 @@
-import subprocess
 import json
+import sys
 from pathlib import Path
 
+import ast_metrics
+from analysis_cache import AnalysisCache
+from metrics_engine import DEFAULT_EXCLUDE, count_lines, find_files
+
+# Bump when count_lines changes, so cached line counts are recomputed
+LINE_COUNT_VERSION = '1'
+
+def source_files(yahtzee_path):
+    """The game's modules: every .py file outside tests/."""
+    return find_files(yahtzee_path, ['*.py'], DEFAULT_EXCLUDE + ['tests'])
+
+def code_metrics(paths, cache):
+    """ast_metrics results per file, analyzing only files not in ``cache``."""
+    results = {}
+    stale = []
+    for path in paths:
+        cached = cache.get(path)
+        if cached is None:
+            stale.append(path)
+        else:
+            results[str(path)] = cached
+    # Files are independent: large sets are spread over a process pool
+    for path, result in zip(stale, ast_metrics.analyze_files(stale)):
+        results[str(path)] = result
+        # Files that do not parse are reported, not cached
+        if 'error' not in result:
+            cache.put(path, result)
+    return dict(sorted(results.items()))
+
 def analyze_readability():
     print("Running readability analysis...")
     
@@ -11,43 +40,39 @@ def analyze_readability():
     
     results = {}
     
-    source_files = ['dice.py', 'scorecard.py', 'game.py', 'main.py']
+    line_cache = AnalysisCache('line_counts', LINE_COUNT_VERSION)
+    module_paths = source_files(yahtzee_path)
+    for file_path in module_paths:
+        metrics = line_cache.get(file_path)
+        if metrics is None:
+            metrics = count_lines(file_path)
+            line_cache.put(file_path, metrics)
+        results[file_path.name] = metrics
+    line_cache.save(keep=module_paths)
     
-    for file in source_files:
-        file_path = yahtzee_path / file
-        if not file_path.exists():
-            continue
-        
-        with open(file_path) as f:
-            content = f.read()
-            lines = content.split('\n')
-            
-        results[file] = {
-            'total_lines': len(lines),
-            'code_lines': len([l for l in lines if l.strip() and not l.strip().startswith('#')]),
-            'comment_lines': len([l for l in lines if l.strip().startswith('#')]),
-            'blank_lines': len([l for l in lines if not l.strip()])
-        }
+    # Complexity for every file under yahtzee_game/, tests included
+    code_paths = sorted(find_files(yahtzee_path))
+    python_version = '.'.join(map(str, sys.version_info[:2]))
+    code_cache = AnalysisCache('code_metrics', f'{ast_metrics.VERSION}-py{python_version}')
+    code = code_metrics(code_paths, code_cache)
+    code_cache.save(keep=code_paths)
     
-    try:
-        radon_cc = subprocess.run(
-            ['radon', 'cc', str(yahtzee_path), '-a', '-j'],
-            capture_output=True, text=True
-        )
-        if radon_cc.returncode == 0:
-            results['cyclomatic_complexity'] = json.loads(radon_cc.stdout)
-    except FileNotFoundError:
-        results['cyclomatic_complexity'] = 'radon not installed'
+    results['cyclomatic_complexity'] = {
+        path: {'error': metrics['error']} if 'error' in metrics else metrics['blocks']
+        for path, metrics in code.items()
+    }
+    results['maintainability_index'] = {
+        path: {'error': metrics['error']} if 'error' in metrics else {'mi': metrics['mi'], 'rank': metrics['rank']}
+        for path, metrics in code.items()
+    }
+    results['structure'] = {
+        path: {key: metrics[key] for key in ('functions', 'methods', 'classes')}
+        for path, metrics in code.items() if 'error' not in metrics
+    }
     
-    try:
-        radon_mi = subprocess.run(
-            ['radon', 'mi', str(yahtzee_path), '-j'],
-            capture_output=True, text=True
-        )
-        if radon_mi.returncode == 0:
-            results['maintainability_index'] = json.loads(radon_mi.stdout)
-    except FileNotFoundError:
-        results['maintainability_index'] = 'radon not installed'
+    hits = line_cache.hits + code_cache.hits
+    misses = line_cache.misses + code_cache.misses
+    print(f"Cache: {hits} unchanged, {misses} re-analyzed")
     
     with open(output_dir / 'readability_metrics.json', 'w') as f:
         json.dump(results, f, indent=2)
@@ -62,6 +87,17 @@ def analyze_readability():
             print(f"  Comment Lines: {metrics['comment_lines']}")
             print(f"  Blank Lines:   {metrics['blank_lines']}")
     
+    print("\nComplexity (cyclomatic, worst block per file; maintainability index):")
+    print("-" * 70)
+    for path, metrics in code.items():
+        name = Path(path).relative_to(yahtzee_path)
+        if 'error' in metrics:
+            print(f"  {str(name):32s} {metrics['error']}")
+            continue
+        worst = max(metrics['blocks'], key=lambda block: block['complexity'], default=None)
+        worst_text = f"{worst['complexity']:3d} {worst['rank']} {worst['name']}" if worst else "  - -"
+        print(f"  {str(name):32s} CC {worst_text:46s} MI {metrics['mi']:5.1f} {metrics['rank']}")
+    
     print(f"\nResults saved to: {output_dir / 'readability_metrics.json'}")
     return results
 
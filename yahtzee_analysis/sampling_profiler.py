@@ -0,0 +1,238 @@
+"""Low-overhead sampling profiler with collapsed-stack and SVG flamegraph output.
+
+cProfile hooks every call and return, which inflates the cost of tiny
+methods like ``Dice.face_value``.  ``SamplingProfiler`` instead runs a
+background thread that wakes every ``interval`` seconds, reads the target
+thread's current frame from ``sys._current_frames()`` and counts the stack.
+The profiled code runs unmodified; its only cost is the GIL hand-off to the
+sampler, so a sample lands on whatever was running at that moment.
+
+Python only switches threads every ``sys.getswitchinterval()`` seconds
+(5 ms by default), which would cap the sampling rate, so the switch interval
+is lowered to ``interval`` while the profiler runs.
+
+Stacks are written in the collapsed format used by flamegraph tools (one
+``root;caller;callee count`` line per distinct stack) and rendered to a
+self-contained SVG flamegraph without external tools.
+"""
+import html
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+
+yahtzee_game_path = Path(__file__).parent.parent / 'yahtzee_game'
+sys.path.insert(0, str(yahtzee_game_path))
+
+DEFAULT_INTERVAL = 0.001
+NUM_GAMES = 20000
+SVG_WIDTH = 1200
+FRAME_HEIGHT = 16
+FONT_SIZE = 11
+MIN_FRAME_WIDTH = 0.1  # pixels; narrower frames are not drawn
+
+
+def frame_label(code):
+    """``file:qualified name`` label of a code object."""
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{os.path.basename(code.co_filename)}:{name}"
+
+
+class SamplingProfiler:
+    """Sample one thread's Python stack from a background thread.
+
+    Use as a context manager around the code to profile; by default the
+    thread that enters the context is sampled.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks = Counter()
+        self.num_samples = 0
+        self.elapsed = 0.0
+        self._labels = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._switch_interval = None
+        self._start_time = 0.0
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = frame_label(code)
+        return label
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        stack = []
+        while frame is not None:
+            stack.append(self._label(frame.f_code))
+            frame = frame.f_back
+        stack.reverse()
+        self.stacks[tuple(stack)] += 1
+        self.num_samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError("Profiler is already running")
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._stop.clear()
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.elapsed += time.perf_counter() - self._start_time
+        sys.setswitchinterval(self._switch_interval)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def collapsed_lines(self):
+        """Collapsed stacks, most frequent first."""
+        return [f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common()]
+
+    def write_collapsed(self, path):
+        with open(path, 'w') as f:
+            f.write('\n'.join(self.collapsed_lines()) + '\n')
+
+    def self_counts(self):
+        """Samples in which each function was the innermost frame."""
+        counts = Counter()
+        for stack, count in self.stacks.items():
+            counts[stack[-1]] += count
+        return counts
+
+    def total_counts(self):
+        """Samples in which each function was anywhere on the stack."""
+        counts = Counter()
+        for stack, count in self.stacks.items():
+            for label in set(stack):
+                counts[label] += count
+        return counts
+
+
+def build_tree(stacks):
+    """Merge collapsed stacks into a ``{'name', 'value', 'children'}`` call tree."""
+    root = {'name': 'all', 'value': 0, 'children': {}}
+    for stack, count in stacks.items():
+        root['value'] += count
+        node = root
+        for label in stack:
+            node = node['children'].setdefault(label, {'name': label, 'value': 0, 'children': {}})
+            node['value'] += count
+    return root
+
+
+def _tree_depth(node):
+    return 1 + max((_tree_depth(child) for child in node['children'].values()), default=0)
+
+
+def _frame_color(name):
+    """Stable warm colour per function, as in the classic flamegraph palette."""
+    h = zlib.crc32(name.encode())
+    return f"rgb({205 + h % 50},{(h >> 8) % 180 + 50},{(h >> 16) % 55})"
+
+
+def render_flamegraph(stacks, title='Flame Graph'):
+    """Return an SVG flamegraph of collapsed ``stacks`` (root at the bottom)."""
+    root = build_tree(stacks)
+    total = root['value'] or 1
+    depth = _tree_depth(root)
+    top_margin = 2 * FRAME_HEIGHT
+    height = top_margin + depth * FRAME_HEIGHT + FRAME_HEIGHT
+    scale = (SVG_WIDTH - 20) / total
+    rects = []
+
+    def draw(node, x, level):
+        width = node['value'] * scale
+        if width < MIN_FRAME_WIDTH:
+            return
+        y = height - FRAME_HEIGHT - (level + 1) * FRAME_HEIGHT
+        name = html.escape(node['name'])
+        tooltip = f"{name} ({node['value']:,} samples, {100 * node['value'] / total:.2f}%)"
+        max_chars = int(width / (FONT_SIZE * 0.6))
+        text = name if len(node['name']) <= max_chars else (
+            html.escape(node['name'][:max_chars - 2]) + '..' if max_chars > 3 else '')
+        rects.append(
+            f'<g><title>{tooltip}</title>'
+            f'<rect x="{x:.2f}" y="{y}" width="{width:.2f}" height="{FRAME_HEIGHT - 1}" '
+            f'fill="{_frame_color(node["name"])}" rx="2"/>'
+            f'<text x="{x + 3:.2f}" y="{y + FRAME_HEIGHT - 4}">{text}</text></g>')
+        child_x = x
+        for child in sorted(node['children'].values(), key=lambda c: c['name']):
+            draw(child, child_x, level + 1)
+            child_x += child['value'] * scale
+
+    draw(root, 10.0, 0)
+    return (
+        f'<?xml version="1.0" standalone="no"?>\n'
+        f'<svg version="1.1" width="{SVG_WIDTH}" height="{height}" '
+        f'xmlns="http://www.w3.org/2000/svg" font-family="Verdana" font-size="{FONT_SIZE}">\n'
+        f'<rect width="100%" height="100%" fill="#f8f8f8"/>\n'
+        f'<text x="{SVG_WIDTH / 2}" y="{FRAME_HEIGHT + 4}" text-anchor="middle" '
+        f'font-size="{FONT_SIZE + 5}">{html.escape(title)}</text>\n'
+        + '\n'.join(rects) + '\n</svg>\n')
+
+
+def profile_simulation(num_games=NUM_GAMES, strategy_name='greedy', interval=DEFAULT_INTERVAL):
+    from simulation import make_strategy, run_simulation
+
+    print("Running sampling profiler...")
+    print(f"Configuration: {num_games} games, {strategy_name} strategy, "
+          f"{interval * 1000:g}ms sampling interval")
+    print("=" * 80)
+
+    strategy = make_strategy(strategy_name)
+    with SamplingProfiler(interval) as profiler:
+        result = run_simulation(num_games, strategy, seed=0)
+
+    output_dir = Path(__file__).parent / 'visualizations'
+    output_dir.mkdir(exist_ok=True)
+    collapsed_path = output_dir / f'sampling_profile_{strategy_name}.collapsed'
+    svg_path = output_dir / f'sampling_profile_{strategy_name}.svg'
+    profiler.write_collapsed(collapsed_path)
+    title = f"{num_games:,} {strategy_name} games - {profiler.num_samples:,} samples"
+    svg_path.write_text(render_flamegraph(profiler.stacks, title))
+
+    print(f"  {result.num_games:,} games in {result.elapsed:.2f}s "
+          f"({result.games_per_second:,.0f} games/s), {profiler.num_samples:,} samples "
+          f"({profiler.num_samples / profiler.elapsed:,.0f}/s)")
+    print("\nTop 15 functions by self samples:")
+    print("-" * 80)
+    totals = profiler.total_counts()
+    for label, count in profiler.self_counts().most_common(15):
+        print(f"  {100 * count / profiler.num_samples:6.2f}% self "
+              f"{100 * totals[label] / profiler.num_samples:6.2f}% total  {label}")
+
+    print(f"\nCollapsed stacks saved to: {collapsed_path}")
+    print(f"Flamegraph saved to: {svg_path}")
+    return profiler
+
+
+if __name__ == '__main__':
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_GAMES
+    strategy_name = sys.argv[2] if len(sys.argv) > 2 else 'greedy'
+    profile_simulation(num_games, strategy_name)
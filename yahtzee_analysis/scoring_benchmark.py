@@ -0,0 +1,82 @@
+import timeit
+import json
+import random
+import numpy as np
+from pathlib import Path
+import sys
+
+yahtzee_game_path = Path(__file__).parent.parent / 'yahtzee_game'
+sys.path.insert(0, str(yahtzee_game_path))
+
+from game import Game
+from scoring import NUM_SLOTS, score_slot, lookup_score
+from batch_scoring import score_batch
+
+NUM_HANDS = 1000
+REPEATS = 5
+
+def make_hands(num_hands, seed=0):
+    rng = random.Random(seed)
+    return [[rng.randint(1, 6) for _ in range(5)] for _ in range(num_hands)]
+
+def score_all_branchy(hands):
+    for hand in hands:
+        for slot_idx in range(NUM_SLOTS):
+            score_slot(hand, slot_idx)
+
+def score_all_table(hands):
+    for hand in hands:
+        for slot_idx in range(NUM_SLOTS):
+            lookup_score(hand, slot_idx)
+
+def score_all_game(game, hands):
+    for hand in hands:
+        game.dice_values = hand
+        for slot_idx in range(NUM_SLOTS):
+            game.calculate_score(slot_idx)
+
+def score_all_batch(hand_array):
+    score_batch(hand_array)
+
+def best_time_per_call(func, num_calls):
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    best = min(timer.repeat(repeat=REPEATS, number=loops)) / loops
+    return best / num_calls * 1e6
+
+def run_scoring_benchmark():
+    print("Running scoring benchmark...")
+    print(f"Configuration: {NUM_HANDS} hands × {NUM_SLOTS} slots, best of {REPEATS} repeats")
+    print("=" * 80)
+
+    hands = make_hands(NUM_HANDS)
+    hand_array = np.array(hands)
+    game = Game(1)
+    num_calls = NUM_HANDS * NUM_SLOTS
+
+    results = {
+        'branchy_us_per_score': best_time_per_call(lambda: score_all_branchy(hands), num_calls),
+        'table_us_per_score': best_time_per_call(lambda: score_all_table(hands), num_calls),
+        'game_calculate_score_us': best_time_per_call(lambda: score_all_game(game, hands), num_calls),
+        'batch_us_per_score': best_time_per_call(lambda: score_all_batch(hand_array), num_calls),
+        'num_hands': NUM_HANDS,
+        'repeats': REPEATS
+    }
+    results['speedup'] = results['branchy_us_per_score'] / results['table_us_per_score']
+
+    output_dir = Path(__file__).parent / 'data'
+    output_dir.mkdir(exist_ok=True)
+
+    with open(output_dir / 'scoring_benchmark.json', 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"  Branchy rules           : {results['branchy_us_per_score']:8.3f} µs/score")
+    print(f"  Table lookup            : {results['table_us_per_score']:8.3f} µs/score")
+    print(f"  Game.calculate_score    : {results['game_calculate_score_us']:8.3f} µs/score")
+    print(f"  NumPy score_batch       : {results['batch_us_per_score']:8.3f} µs/score")
+    print(f"  Speedup (branchy/table) : {results['speedup']:8.1f}x")
+    print(f"\nResults saved to: {output_dir / 'scoring_benchmark.json'}")
+    return results
+
+if __name__ == '__main__':
+    run_scoring_benchmark()
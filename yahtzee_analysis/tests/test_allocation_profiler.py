@@ -0,0 +1,68 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from allocation_profiler import OPERATIONS, Game, live_objects, profile_operation
+
+CALLS = 200
+
+
+class TestProfileOperation(unittest.TestCase):
+    """Test suite for per-call allocation profiling of game operations."""
+
+    def setUp(self):
+        self.game = Game(2)
+
+    def test_fresh_list_is_retained(self):
+        """Test that an operation returning a new list reports its bytes and call site."""
+        result = profile_operation(OPERATIONS['game_get_dice_values'], self.game, CALLS)
+        self.assertEqual(result['calls'], CALLS)
+        # A five-element list is at least its header plus five pointers
+        self.assertGreater(result['retained_bytes_per_call'], 56 + 5 * 8 - 1)
+        self.assertGreaterEqual(result['peak_bytes_per_call'], result['retained_bytes_per_call'])
+        self.assertGreaterEqual(result['blocks_per_call'], 1)
+
+        self.assertTrue(result['call_sites'])
+        site = result['call_sites'][0]
+        self.assertGreater(site['bytes'], 0)
+        self.assertTrue(site['traceback'])
+        for frame in site['traceback']:
+            filename, lineno = frame.rsplit(':', 1)
+            self.assertTrue(os.path.exists(os.path.join(
+                os.path.dirname(__file__), '..', '..', 'yahtzee_game', filename)), frame)
+            self.assertTrue(lineno.isdigit())
+        self.assertTrue(site['traceback'][-1].startswith('hand.py:'))
+
+    def test_noop_retains_nothing(self):
+        """Test that an operation allocating nothing reports about zero bytes and no sites."""
+        result = profile_operation(lambda game: None, self.game, CALLS)
+        self.assertLess(abs(result['retained_bytes_per_call']), 8)
+        self.assertLess(result['blocks_per_call'], 0.1)
+        self.assertEqual(result['call_sites'], [])
+
+    def test_score_lookup_retains_nothing(self):
+        """Test that scoring, which returns a small int, retains no game allocations."""
+        result = profile_operation(OPERATIONS['game_calculate_score'], self.game, CALLS)
+        self.assertLess(abs(result['retained_bytes_per_call']), 8)
+        self.assertEqual(result['call_sites'], [])
+
+
+class TestLiveObjects(unittest.TestCase):
+    """Test suite for counting live game objects."""
+
+    def test_counts_new_game(self):
+        """Test that a new game adds its dice, scorecard and hand to the live counts."""
+        before = live_objects()
+        game = Game(2)
+        after = live_objects()
+        self.assertEqual(after['Game'] - before['Game'], 1)
+        self.assertEqual(after['Dice'] - before['Dice'], len(game.die))
+        self.assertEqual(after['Scorecard'] - before['Scorecard'], 1)
+        self.assertEqual(after['Hand'] - before['Hand'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
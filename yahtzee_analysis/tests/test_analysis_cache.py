@@ -0,0 +1,91 @@
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analysis_cache import AnalysisCache, inputs_hash
+from debugging_analyzer import pylint_cache
+
+RESULT = {'total_issues': 1, 'by_type': {'convention': 1}, 'issues': []}
+
+
+class TestAnalysisCache(unittest.TestCase):
+    """Test suite for the per-file result cache and the pylint cache key."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.cache_dir = self.tmp / 'cache'
+        self.game = self.tmp / 'game'
+        self.game.mkdir()
+        (self.game / 'hand.py').write_text('class Hand:\n    pass\n')
+        (self.game / 'game.py').write_text('from hand import Hand\n')
+        self.files = ['game.py', 'hand.py']
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def lint_run(self):
+        """Look up game.py, store RESULT on a miss, and save, as run_pylint_analysis does."""
+        cache = pylint_cache(self.game, self.files, self.cache_dir)
+        result = cache.get(self.game / 'game.py')
+        if result is None:
+            cache.put(self.game / 'game.py', RESULT)
+        cache.save(keep=[self.game / file for file in self.files])
+        return result
+
+    def test_unchanged_file_hits(self):
+        """Test that a saved result is returned while the file and version are unchanged."""
+        cache = AnalysisCache('tool', '1', self.cache_dir)
+        self.assertIsNone(cache.get(self.game / 'hand.py'))
+        cache.put(self.game / 'hand.py', RESULT)
+        cache.save()
+        again = AnalysisCache('tool', '1', self.cache_dir)
+        self.assertEqual(again.get(self.game / 'hand.py'), RESULT)
+        self.assertEqual((again.hits, again.misses), (1, 0))
+
+    def test_edited_file_or_new_version_misses(self):
+        """Test that editing the file or changing the tool version invalidates it."""
+        cache = AnalysisCache('tool', '1', self.cache_dir)
+        cache.put(self.game / 'hand.py', RESULT)
+        cache.save()
+        self.assertIsNone(AnalysisCache('tool', '2', self.cache_dir).get(self.game / 'hand.py'))
+        (self.game / 'hand.py').write_text('class Hand:\n    size = 5\n')
+        self.assertIsNone(AnalysisCache('tool', '1', self.cache_dir).get(self.game / 'hand.py'))
+
+    def test_inputs_hash_tracks_contents(self):
+        """Test that inputs_hash changes with any file's contents and ignores missing files."""
+        paths = [self.game / 'game.py', self.game / 'hand.py']
+        before = inputs_hash(paths)
+        self.assertEqual(inputs_hash(paths + [self.game / 'missing.toml']), before)
+        (self.game / 'hand.py').write_text('class Hand:\n    size = 5\n')
+        self.assertNotEqual(inputs_hash(paths), before)
+
+    def test_pylint_cache_hits_when_nothing_changed(self):
+        """Test that a second lint run reuses the stored result."""
+        self.assertIsNone(self.lint_run())
+        self.assertEqual(self.lint_run(), RESULT)
+
+    def test_pylint_cache_drops_result_when_an_import_changes(self):
+        """Test that editing hand.py invalidates the cached result for game.py."""
+        self.lint_run()
+        (self.game / 'hand.py').write_text('class Hand:\n    def score(self):\n        return 0\n')
+        self.assertIsNone(self.lint_run())
+        self.assertEqual(self.lint_run(), RESULT)
+
+    def test_pylint_cache_drops_result_when_config_changes(self):
+        """Test that adding or editing a pylintrc invalidates every cached result."""
+        self.lint_run()
+        (self.game / '.pylintrc').write_text('[MESSAGES CONTROL]\ndisable=C0114\n')
+        self.assertIsNone(self.lint_run())
+        self.assertEqual(self.lint_run(), RESULT)
+        (self.game / '.pylintrc').write_text('[MESSAGES CONTROL]\ndisable=C0115\n')
+        self.assertIsNone(self.lint_run())
+
+
+if __name__ == '__main__':
+    unittest.main()
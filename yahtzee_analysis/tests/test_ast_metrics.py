@@ -0,0 +1,188 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    from radon.complexity import cc_visit
+    from radon.metrics import mi_visit
+    from radon.raw import analyze
+except ImportError:
+    analyze = None
+
+from ast_metrics import analyze_source, raw_metrics
+
+# One function per kind of decision point, a closure and a class to average
+COMPLEXITY_SOURCE = '''\
+def branches(x):
+    if x > 2:
+        return 'big'
+    elif x > 1:
+        return 'mid'
+    return 'odd' if x % 2 else 'even'
+
+
+def operands(a, b, c):
+    return a and b or c and not a
+
+
+def comprehension(rows):
+    return [cell for row in rows if row for cell in row if cell > 0]
+
+
+def handlers(path):
+    try:
+        value = open(path).read()
+    except OSError:
+        value = ''
+    except ValueError:
+        value = None
+    else:
+        value = value.strip()
+    finally:
+        pass
+    return value
+
+
+def dispatch(command):
+    match command:
+        case 'roll':
+            return 1
+        case 'score':
+            return 2
+        case _:
+            return 0
+
+
+def outer(values):
+    def inner(value):
+        if value:
+            return value
+        return 0
+    return [inner(value) for value in values]
+
+
+class Table:
+    def simple(self):
+        return 1
+
+    def branchy(self, x):
+        if x:
+            return 1
+        for item in x:
+            if item:
+                return item
+        return 0
+'''
+
+RAW_KEYS = ('sloc', 'lloc', 'comments', 'multi', 'single_comments', 'blank')
+
+# Form feeds (^L page breaks, as in older stdlib modules) between statements,
+# before a statement, inside brackets and inside a docstring
+FORM_FEED_SOURCE = (
+    'import os\n'
+    '\x0c\n'
+    '\n'
+    'def scale(values, factor):\n'
+    '    # Multiply every value\n'
+    '    result = []\n'
+    '    for value in values:\n'
+    '        if value > 0 and factor:\n'
+    '            result.append(value * factor)\n'
+    '        else:\n'
+    '            result.append(-value)\n'
+    '    return result\n'
+    '\x0c\n'
+    '\x0cclass Table:\n'
+    '    """Rows of values.\n'
+    '\x0c\n'
+    '    One per line."""\n'
+    '    sizes = (1,\n'
+    '\x0c\n'
+    '             2)\n'
+    '\n'
+    '    def total(self, rows):\n'
+    '        return sum(len(row) for row in rows if row)\n'
+)
+
+# radon 6.0.1's raw counts for FORM_FEED_SOURCE
+RADON_RAW = {'sloc': 14, 'lloc': 14, 'comments': 1, 'multi': 2, 'single_comments': 1, 'blank': 11}
+
+
+class TestAstMetrics(unittest.TestCase):
+    """Test suite for the in-process radon-compatible metrics."""
+
+    def test_form_feed_raw_counts_match_radon(self):
+        """Test that lines holding form feeds are counted as radon counts them."""
+        self.assertEqual(raw_metrics(FORM_FEED_SOURCE), RADON_RAW)
+
+    def test_plain_source_raw_counts(self):
+        """Test raw counts for a docstring, a comment, a blank line and code."""
+        source = '"""Module."""\n# note\n\nif x: y = 1\n'
+        self.assertEqual(raw_metrics(source), {
+            'sloc': 1, 'lloc': 3, 'comments': 1, 'multi': 0, 'single_comments': 2, 'blank': 1
+        })
+
+    @unittest.skipUnless(analyze is not None, "radon not installed")
+    def test_form_feed_parity_with_radon(self):
+        """Test raw counts and maintainability index against radon itself."""
+        metrics = analyze_source(FORM_FEED_SOURCE)
+        radon_raw = analyze(FORM_FEED_SOURCE)
+        self.assertEqual({key: metrics[key] for key in RAW_KEYS},
+                         {key: getattr(radon_raw, key) for key in RAW_KEYS})
+        self.assertAlmostEqual(metrics['mi'], mi_visit(FORM_FEED_SOURCE, True))
+
+
+    def complexities(self):
+        blocks = analyze_source(COMPLEXITY_SOURCE)['blocks']
+        return {block['name']: block for block in blocks}
+
+    def test_if_elif_and_conditional_expression(self):
+        """Test that if, elif and an IfExp each add one."""
+        self.assertEqual(self.complexities()['branches']['complexity'], 4)
+
+    def test_bool_op_operands(self):
+        """Test that each extra and/or operand adds one; 'not' adds nothing."""
+        self.assertEqual(self.complexities()['operands']['complexity'], 4)
+
+    def test_comprehension_with_ifs(self):
+        """Test that each comprehension 'for' and each of its 'if's add one."""
+        self.assertEqual(self.complexities()['comprehension']['complexity'], 5)
+
+    def test_try_except_else(self):
+        """Test that each except handler and the else add one, and finally adds nothing."""
+        self.assertEqual(self.complexities()['handlers']['complexity'], 4)
+
+    def test_match_with_wildcard(self):
+        """Test that match cases add one each, except the wildcard case."""
+        self.assertEqual(self.complexities()['dispatch']['complexity'], 3)
+
+    def test_closure_does_not_add_to_parent(self):
+        """Test that a nested function is its own closure block."""
+        outer = self.complexities()['outer']
+        self.assertEqual(outer['complexity'], 2)
+        self.assertEqual([(closure['name'], closure['complexity']) for closure in outer['closures']],
+                         [('inner', 2)])
+
+    def test_class_averages_its_methods(self):
+        """Test that a class scores its methods' average, as radon does."""
+        blocks = self.complexities()
+        self.assertEqual((blocks['simple']['complexity'], blocks['branchy']['complexity']), (1, 4))
+        self.assertEqual(blocks['Table']['real_complexity'], 6)
+        self.assertEqual(blocks['Table']['complexity'], 4)
+        self.assertEqual(blocks['branchy']['classname'], 'Table')
+
+    @unittest.skipUnless(analyze is not None, "radon not installed")
+    def test_complexity_parity_with_radon(self):
+        """Test every block's complexity against radon's cc_visit."""
+        ours = [(block['name'], block['complexity'])
+                for block in analyze_source(COMPLEXITY_SOURCE)['blocks']]
+        # cc_visit lists classes and their methods side by side, as analyze_source does
+        theirs = [(block.name, block.complexity) for block in cc_visit(COMPLEXITY_SOURCE)]
+        self.assertEqual(sorted(ours), sorted(theirs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+import benchmark_harness
+from benchmark_harness import benchmark, bootstrap_ci, calibrate
+
+
+class FakeClock:
+    """perf_counter stand-in that only advances when the benchmarked call runs."""
+
+    def __init__(self, seconds_per_call):
+        self.now = 0.0
+        self.seconds_per_call = seconds_per_call
+
+    def perf_counter(self):
+        return self.now
+
+    def call(self):
+        self.now += self.seconds_per_call
+
+
+class TestCalibration(unittest.TestCase):
+    """Test suite for the timeit-style loop calibration."""
+
+    def test_calibration_reaches_target_with_fewest_doublings(self):
+        """Test that the loop count is the smallest power of two reaching the target time."""
+        clock = FakeClock(0.001)
+        with mock.patch.object(benchmark_harness.time, 'perf_counter', clock.perf_counter):
+            loops = calibrate(clock.call, min_seconds=0.005)
+            self.assertEqual(loops, 8)
+            self.assertGreaterEqual(benchmark_harness._time_loops(clock.call, loops), 0.005)
+            self.assertLess(benchmark_harness._time_loops(clock.call, loops // 2), 0.005)
+
+    def test_slow_call_needs_one_loop(self):
+        """Test that a call slower than the target is timed once per sample."""
+        clock = FakeClock(0.01)
+        with mock.patch.object(benchmark_harness.time, 'perf_counter', clock.perf_counter):
+            self.assertEqual(calibrate(clock.call, min_seconds=0.005), 1)
+
+
+class TestBootstrap(unittest.TestCase):
+    """Test suite for the bootstrap confidence intervals."""
+
+    def setUp(self):
+        self.values = np.random.default_rng(7).normal(10.0, 1.0, 200)
+
+    def test_mean_interval_brackets_the_mean(self):
+        """Test that the seeded CI contains the sample mean and has about the normal width."""
+        low, high = bootstrap_ci(self.values, np.mean)
+        mean = float(np.mean(self.values))
+        self.assertLess(low, mean)
+        self.assertGreater(high, mean)
+        # Normal approximation: 2 * 1.96 * sd / sqrt(n)
+        expected_width = 2 * 1.96 * np.std(self.values, ddof=1) / np.sqrt(len(self.values))
+        self.assertAlmostEqual(high - low, expected_width, delta=0.25 * expected_width)
+
+    def test_interval_is_reproducible(self):
+        """Test that the same seed gives the same interval and another seed a different one."""
+        self.assertEqual(bootstrap_ci(self.values, np.median), bootstrap_ci(self.values, np.median))
+        self.assertNotEqual(bootstrap_ci(self.values, np.median),
+                            bootstrap_ci(self.values, np.median, seed=1))
+
+    def test_higher_confidence_is_wider(self):
+        """Test that a 99% interval contains the 90% one."""
+        low_90, high_90 = bootstrap_ci(self.values, np.mean, confidence=0.90)
+        low_99, high_99 = bootstrap_ci(self.values, np.mean, confidence=0.99)
+        self.assertLessEqual(low_99, low_90)
+        self.assertGreaterEqual(high_99, high_90)
+
+    def test_degenerate_samples(self):
+        """Test that one value gives a zero-width interval and no values gives zeros."""
+        self.assertEqual(bootstrap_ci([3.5]), [3.5, 3.5])
+        self.assertEqual(bootstrap_ci([]), [0.0, 0.0])
+
+
+class TestBenchmark(unittest.TestCase):
+    """Test suite for the full benchmark summary."""
+
+    def test_summary_fields(self):
+        """Test that a small benchmark reports consistent statistics."""
+        result = benchmark(sorted, list(range(50)), trials=2, samples_per_trial=5, memory_samples=3)
+        self.assertEqual(len(result['samples_ms']), 10)
+        self.assertLessEqual(result['min_ms'], result['median_ms'])
+        self.assertLessEqual(result['median_ms'], result['p95_ms'])
+        low, high = result['mean_ci_ms']
+        self.assertLessEqual(low, result['execution_time_ms'])
+        self.assertGreaterEqual(high, result['execution_time_ms'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import sys
+import os
+import io
+import math
+import sqlite3
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import benchmark_store
+from benchmark_store import main, record_run, t_sf, welch_t_test
+
+
+def metrics(mean_ms, std_ms, n=84):
+    """One method's entry in the performance_metrics.json shape."""
+    return {'execution_time_ms': mean_ms, 'execution_time_std': std_ms,
+            'num_trials': 1, 'samples_per_trial': n}
+
+
+class TestStudentT(unittest.TestCase):
+    """Test suite for the hand-rolled Student's t tail probability."""
+
+    def test_t_table_values(self):
+        """Test t_sf against one-sided critical values from a t table."""
+        for t, df, tail in [(1.812, 10, 0.05), (2.228, 10, 0.025), (2.764, 10, 0.01),
+                            (3.169, 10, 0.005), (2.086, 20, 0.025), (2.042, 30, 0.025),
+                            (1.984, 100, 0.025), (2.626, 100, 0.005)]:
+            self.assertAlmostEqual(t_sf(t, df), tail, delta=1e-4 + tail * 1e-3)
+
+    def test_closed_forms(self):
+        """Test t_sf against the exact Cauchy (df=1) and df=2 survival functions."""
+        for t in (-3.0, -0.5, 0.0, 0.7, 4.0, 50.0):
+            self.assertAlmostEqual(t_sf(t, 1), 0.5 - math.atan(t) / math.pi, places=10)
+            self.assertAlmostEqual(t_sf(t, 2), 0.5 - t / (2 * math.sqrt(2 + t * t)), places=10)
+
+    def test_symmetry(self):
+        """Test that P(T > -t) = 1 - P(T > t)."""
+        self.assertAlmostEqual(t_sf(-1.812, 10), 0.95, delta=2e-4)
+        self.assertEqual(t_sf(0.0, 7), 0.5)
+
+    def test_welch_needs_two_samples(self):
+        """Test that a run with one sample is rejected instead of dividing by zero."""
+        with self.assertRaises(ValueError):
+            welch_t_test(1.0, 0.1, 1, 1.2, 0.1, 50)
+        t, df, p_value = welch_t_test(1.0, 0.1, 50, 1.2, 0.1, 50)
+        self.assertGreater(t, 0)
+        self.assertAlmostEqual(df, 98.0)
+        self.assertLess(p_value, 1e-6)
+
+
+class TestCompareGate(unittest.TestCase):
+    """Test suite for recording runs and the compare exit status."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / 'benchmarks.db'
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def gate(self, base, head):
+        record_run({'game': base}, self.db_path, commit='a' * 40)
+        record_run({'game': head}, self.db_path, commit='b' * 40)
+        with redirect_stdout(io.StringIO()) as output:
+            status = main(['compare'], db_path=self.db_path)
+        return status, output.getvalue()
+
+    def test_unchanged_timings_pass(self):
+        """Test that equal timings exit 0."""
+        status, _ = self.gate({'roll': metrics(0.01, 0.001)}, {'roll': metrics(0.01, 0.001)})
+        self.assertEqual(status, 0)
+
+    def test_significant_slowdown_fails(self):
+        """Test that a large, significant slowdown exits 1 and is flagged."""
+        status, output = self.gate({'roll': metrics(0.01, 0.001)}, {'roll': metrics(0.02, 0.001)})
+        self.assertEqual(status, 1)
+        self.assertIn('REGRESSION', output)
+
+    def test_small_slowdown_passes(self):
+        """Test that a significant but sub-threshold slowdown exits 0."""
+        status, _ = self.gate({'roll': metrics(0.01, 0.0001)}, {'roll': metrics(0.0102, 0.0001)})
+        self.assertEqual(status, 0)
+
+    def test_single_sample_runs_are_reported_not_flagged(self):
+        """Test that one-sample runs print 'insufficient samples' and exit 0."""
+        status, output = self.gate({'roll': metrics(0.01, 0.0, n=1)}, {'roll': metrics(0.02, 0.0, n=1)})
+        self.assertEqual(status, 0)
+        self.assertIn('insufficient samples', output)
+
+    def test_missing_runs_exit_2(self):
+        """Test that comparing with no earlier commit exits 2."""
+        record_run({'game': {'roll': metrics(0.01, 0.001)}}, self.db_path, commit='a' * 40)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(['compare'], db_path=self.db_path), 2)
+
+    def test_connections_are_closed(self):
+        """Test that record_run and list_runs close their connections."""
+        opened = []
+        connect = benchmark_store.connect
+
+        def tracking_connect(db_path):
+            connection = connect(db_path)
+            opened.append(connection)
+            return connection
+
+        with mock.patch.object(benchmark_store, 'connect', tracking_connect):
+            record_run({'game': {'roll': metrics(0.01, 0.001)}}, self.db_path, commit='a' * 40)
+            self.assertEqual(len(benchmark_store.list_runs(self.db_path)), 1)
+        self.assertEqual(len(opened), 2)
+        for connection in opened:
+            with self.assertRaises(sqlite3.ProgrammingError):
+                connection.execute('SELECT 1')
+
+if __name__ == '__main__':
+    unittest.main()
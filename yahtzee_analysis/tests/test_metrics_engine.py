@@ -0,0 +1,85 @@
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from metrics_engine import DEFAULT_EXCLUDE, find_files, matches
+
+
+class TestPatterns(unittest.TestCase):
+    """Test suite for the .gitignore-style include/exclude patterns."""
+
+    def test_name_patterns_match_at_any_depth(self):
+        """Test that a pattern without '/' matches the last path segment anywhere."""
+        self.assertTrue(matches('dice.py', ['*.py']))
+        self.assertTrue(matches('yahtzee_game/tests/test_dice.py', ['*.py']))
+        self.assertTrue(matches('yahtzee_game/tests', ['tests']))
+        self.assertFalse(matches('yahtzee_game/tests/test_dice.py', ['tests']))
+
+    def test_star_stays_within_one_directory(self):
+        """Test that '*' in a path pattern does not match across '/'."""
+        self.assertTrue(matches('yahtzee_game/dice.py', ['yahtzee_game/*.py']))
+        self.assertFalse(matches('yahtzee_game/tests/test_x.py', ['yahtzee_game/*.py']))
+        self.assertFalse(matches('other/yahtzee_game/dice.py', ['yahtzee_game/*.py']))
+        self.assertTrue(matches('a/b/c.py', ['a/?/*.py']))
+
+    def test_double_star_spans_directories(self):
+        """Test that '**' matches zero or more whole directories."""
+        patterns = ['**/generated/**']
+        self.assertTrue(matches('generated/x.py', patterns))
+        self.assertTrue(matches('src/deep/generated/x/y.py', patterns))
+        self.assertFalse(matches('src/generated_old/x.py', patterns))
+        self.assertTrue(matches('yahtzee_game/tests/test_x.py', ['yahtzee_game/**/*.py']))
+        self.assertTrue(matches('yahtzee_game/dice.py', ['yahtzee_game/**/*.py']))
+
+    def test_leading_slash_anchors_to_root(self):
+        """Test that '/pattern' is the same as 'pattern' relative to the root."""
+        self.assertTrue(matches('build/out.py', ['/build/*.py']))
+        self.assertFalse(matches('src/build/out.py', ['/build/*.py']))
+
+
+class TestFindFiles(unittest.TestCase):
+    """Test suite for walking a tree with include and exclude patterns."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        for rel in ('pkg/a.py', 'pkg/b.scala', 'pkg/tests/test_a.py', 'pkg/sub/c.py',
+                    'pkg/notes.txt', 'top.py', '.hidden/h.py', 'pkg/__pycache__/a.py'):
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('x = 1\n')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def found(self, *args):
+        return [path.relative_to(self.root).as_posix() for path in find_files(self.root, *args)]
+
+    def test_default_patterns(self):
+        """Test the default include of .py/.scala and exclusion of hidden and cache dirs."""
+        self.assertEqual(self.found(), ['top.py', 'pkg/a.py', 'pkg/b.scala', 'pkg/sub/c.py',
+                                        'pkg/tests/test_a.py'])
+
+    def test_path_include_skips_nested_files(self):
+        """Test that 'pkg/*.py' includes only files directly inside pkg."""
+        self.assertEqual(self.found(['pkg/*.py']), ['pkg/a.py'])
+        self.assertEqual(self.found(['pkg/**/*.py']), ['pkg/a.py', 'pkg/sub/c.py', 'pkg/tests/test_a.py'])
+
+    def test_excludes_prune_directories(self):
+        """Test name and path excludes, including a directory excluded by path."""
+        def found(*exclude):
+            return self.found(['*.py'], DEFAULT_EXCLUDE + list(exclude))
+
+        self.assertEqual(found('tests'), ['top.py', 'pkg/a.py', 'pkg/sub/c.py'])
+        self.assertEqual(found('pkg/*'), ['top.py'])
+        self.assertEqual(found('pkg/*.py'), ['top.py', 'pkg/sub/c.py', 'pkg/tests/test_a.py'])
+        self.assertIn('.hidden/h.py', self.found(['*.py'], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import sys
+import os
+import io
+import threading
+import time
+from contextlib import redirect_stdout
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pipeline import Stage, check_graph, run_pipeline, select_stages
+
+
+class StubRunner:
+    """Stands in for run_stage: sleeps briefly and records what ran alongside what."""
+
+    def __init__(self, fail=(), seconds=0.02):
+        self.fail = set(fail)
+        self.seconds = seconds
+        self.lock = threading.Lock()
+        self.running = set()
+        self.started = []
+        self.finished = []
+        self.overlaps = {}
+
+    def __call__(self, stage):
+        with self.lock:
+            self.running.add(stage.name)
+            self.started.append(stage.name)
+            self.overlaps.setdefault(stage.name, set()).update(self.running)
+            for other in self.running:
+                self.overlaps.setdefault(other, set()).add(stage.name)
+        time.sleep(self.seconds)
+        with self.lock:
+            self.running.discard(stage.name)
+            self.finished.append(stage.name)
+        return (1 if stage.name in self.fail else 0), self.seconds
+
+
+def run(stages, runner, workers=4):
+    with redirect_stdout(io.StringIO()):
+        return run_pipeline(stages, workers, runner)
+
+
+class TestPipeline(unittest.TestCase):
+    """Test suite for the dependency-graph stage scheduler."""
+
+    def test_dependencies_finish_before_dependents_start(self):
+        """Test that every stage starts only after all of its dependencies finished."""
+        stages = [Stage('report', [], deps=('lint', 'metrics')),
+                  Stage('lint', []), Stage('metrics', [], deps=('parse',)), Stage('parse', [])]
+        runner = StubRunner()
+        results = run(stages, runner)
+        for stage in stages:
+            self.assertEqual(results[stage.name]['status'], 'ok')
+            for dep in stage.deps:
+                self.assertLess(runner.finished.index(dep), runner.started.index(stage.name))
+        self.assertEqual(runner.started[-1], 'report')
+
+    def test_independent_stages_overlap(self):
+        """Test that stages without dependencies run side by side."""
+        runner = StubRunner(seconds=0.05)
+        run([Stage('a', []), Stage('b', []), Stage('c', [])], runner)
+        self.assertEqual(runner.overlaps['a'], {'a', 'b', 'c'})
+
+    def test_exclusive_stages_run_alone(self):
+        """Test that nothing runs alongside an exclusive stage."""
+        stages = [Stage('a', []), Stage('timing', [], exclusive=True), Stage('b', []),
+                  Stage('timing2', [], exclusive=True), Stage('c', [])]
+        runner = StubRunner()
+        results = run(stages, runner)
+        self.assertEqual(runner.overlaps['timing'], {'timing'})
+        self.assertEqual(runner.overlaps['timing2'], {'timing2'})
+        self.assertTrue(results['timing']['exclusive'])
+        self.assertEqual(len(runner.finished), 5)
+
+    def test_failure_skips_dependents(self):
+        """Test that a failed stage skips its dependents, transitively, but not the rest."""
+        stages = [Stage('build', []), Stage('test', [], deps=('build',)),
+                  Stage('report', [], deps=('test',)), Stage('lint', [])]
+        runner = StubRunner(fail=['build'])
+        results = run(stages, runner)
+        self.assertEqual(results['build']['status'], 'failed')
+        self.assertEqual(results['test']['status'], 'skipped')
+        self.assertEqual(results['report']['status'], 'skipped')
+        self.assertEqual(results['lint']['status'], 'ok')
+        self.assertEqual(sorted(runner.started), ['build', 'lint'])
+
+    def test_cycle_is_rejected(self):
+        """Test that a dependency cycle raises before any stage runs."""
+        stages = [Stage('a', [], deps=('c',)), Stage('b', [], deps=('a',)),
+                  Stage('c', [], deps=('b',)), Stage('d', [])]
+        with self.assertRaises(ValueError) as context:
+            check_graph(stages)
+        self.assertIn('cycle', str(context.exception))
+        runner = StubRunner()
+        with self.assertRaises(ValueError):
+            run(stages, runner)
+        self.assertEqual(runner.started, [])
+
+    def test_unknown_dependency_is_rejected(self):
+        """Test that depending on a stage that does not exist raises ValueError."""
+        with self.assertRaises(ValueError):
+            check_graph([Stage('a', [], deps=('missing',))])
+
+    def test_select_stages_adds_dependencies(self):
+        """Test that selecting a stage pulls in its dependencies in the original order."""
+        stages = [Stage('a', []), Stage('b', [], deps=('a',)), Stage('c', [], deps=('b',)), Stage('d', [])]
+        self.assertEqual([stage.name for stage in select_stages(stages, ['c'])], ['a', 'b', 'c'])
+        with self.assertRaises(ValueError):
+            select_stages(stages, ['nope'])
+
+
+if __name__ == '__main__':
+    unittest.main()
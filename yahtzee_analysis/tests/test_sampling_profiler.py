@@ -0,0 +1,168 @@
+import unittest
+import sys
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from collections import Counter
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sampling_profiler import SamplingProfiler, build_tree, render_flamegraph
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+
+def sample_stacks():
+    """Two callees under one caller, plus a sample taken in the caller itself."""
+    return Counter({
+        ('main', 'play', 'roll'): 5,
+        ('main', 'play', 'score'): 3,
+        ('main', 'play'): 2,
+    })
+
+
+class TestStackCounts(unittest.TestCase):
+    """Test suite for the collapsed-stack views of a profiler's samples."""
+
+    def setUp(self):
+        self.profiler = SamplingProfiler()
+        self.profiler.stacks = sample_stacks()
+
+    def test_collapsed_lines_most_frequent_first(self):
+        """Test that collapsed lines join frames with ';' and are sorted by count."""
+        self.assertEqual(self.profiler.collapsed_lines(),
+                         ['main;play;roll 5', 'main;play;score 3', 'main;play 2'])
+
+    def test_self_counts_use_innermost_frame(self):
+        """Test that self counts credit only the innermost frame of each stack."""
+        self.assertEqual(self.profiler.self_counts(), Counter({'roll': 5, 'score': 3, 'play': 2}))
+
+    def test_total_counts_use_every_frame(self):
+        """Test that total counts credit every frame on the stack."""
+        self.assertEqual(self.profiler.total_counts(),
+                         Counter({'main': 10, 'play': 10, 'roll': 5, 'score': 3}))
+
+    def test_total_counts_recursion_counted_once(self):
+        """Test that a recursive function is counted once per sample."""
+        self.profiler.stacks = Counter({('main', 'walk', 'walk', 'walk'): 4})
+        self.assertEqual(self.profiler.total_counts()['walk'], 4)
+        self.assertEqual(self.profiler.self_counts()['walk'], 4)
+
+    def test_write_collapsed(self):
+        """Test that write_collapsed writes one line per stack."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'profile.collapsed')
+            self.profiler.write_collapsed(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), 'main;play;roll 5\nmain;play;score 3\nmain;play 2\n')
+
+
+class TestBuildTree(unittest.TestCase):
+    """Test suite for merging collapsed stacks into a call tree."""
+
+    def test_values_are_inclusive(self):
+        """Test that each node's value is the number of samples it appears in."""
+        root = build_tree(sample_stacks())
+        self.assertEqual(root['name'], 'all')
+        self.assertEqual(root['value'], 10)
+        main = root['children']['main']
+        self.assertEqual(main['value'], 10)
+        play = main['children']['play']
+        self.assertEqual(play['value'], 10)
+        self.assertEqual({name: child['value'] for name, child in play['children'].items()},
+                         {'roll': 5, 'score': 3})
+        self.assertEqual(play['children']['roll']['children'], {})
+
+    def test_same_name_under_different_callers(self):
+        """Test that a function reached from two callers gets two separate nodes."""
+        root = build_tree(Counter({('a', 'leaf'): 1, ('b', 'leaf'): 2}))
+        self.assertEqual(root['children']['a']['children']['leaf']['value'], 1)
+        self.assertEqual(root['children']['b']['children']['leaf']['value'], 2)
+
+    def test_empty_stacks(self):
+        """Test that no samples give an empty root."""
+        self.assertEqual(build_tree(Counter()), {'name': 'all', 'value': 0, 'children': {}})
+
+
+class TestRenderFlamegraph(unittest.TestCase):
+    """Test suite for the SVG flamegraph renderer."""
+
+    def frames(self, svg):
+        root = ET.fromstring(svg.split('\n', 1)[1])
+        return {
+            group.find(SVG + 'title').text.split(' (')[0]: group.find(SVG + 'rect')
+            for group in root.iter(SVG + 'g')
+        }
+
+    def test_one_frame_per_tree_node(self):
+        """Test that the SVG is well-formed and draws every node of the tree."""
+        frames = self.frames(render_flamegraph(sample_stacks()))
+        self.assertEqual(set(frames), {'all', 'main', 'play', 'roll', 'score'})
+
+    def test_widths_proportional_to_samples(self):
+        """Test that frame widths are proportional to inclusive sample counts."""
+        frames = self.frames(render_flamegraph(sample_stacks()))
+        width = {name: float(rect.get('width')) for name, rect in frames.items()}
+        self.assertAlmostEqual(width['all'], width['play'], places=2)
+        self.assertAlmostEqual(width['roll'] / width['all'], 0.5, places=3)
+        self.assertAlmostEqual(width['score'] / width['all'], 0.3, places=3)
+
+    def test_children_stacked_above_parent(self):
+        """Test that callees sit above their caller, side by side in name order."""
+        frames = self.frames(render_flamegraph(sample_stacks()))
+        y = {name: float(rect.get('y')) for name, rect in frames.items()}
+        x = {name: float(rect.get('x')) for name, rect in frames.items()}
+        self.assertLess(y['main'], y['all'])
+        self.assertLess(y['roll'], y['play'])
+        self.assertEqual(y['roll'], y['score'])
+        self.assertEqual(x['roll'], x['play'])
+        self.assertGreater(x['score'], x['roll'])
+
+    def test_names_and_title_are_escaped(self):
+        """Test that labels with markup characters do not break the SVG."""
+        svg = render_flamegraph(Counter({('game.py:<lambda>', 'a&b'): 1}), title='<T&C>')
+        frames = self.frames(svg)
+        self.assertIn('game.py:<lambda>', frames)
+        self.assertIn('a&b', frames)
+        self.assertIn('&lt;T&amp;C&gt;', svg)
+
+    def test_empty_stacks(self):
+        """Test that rendering with no samples still gives a valid, empty SVG."""
+        self.assertEqual(self.frames(render_flamegraph(Counter())), {})
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """Test suite for starting and stopping the sampler."""
+
+    def test_switch_interval_restored(self):
+        """Test that the interpreter's switch interval is restored when the context exits."""
+        original = sys.getswitchinterval()
+        with SamplingProfiler(interval=original / 10):
+            self.assertLess(sys.getswitchinterval(), original)
+        self.assertEqual(sys.getswitchinterval(), original)
+
+    def test_switch_interval_restored_on_error(self):
+        """Test that the switch interval is restored when the profiled code raises."""
+        original = sys.getswitchinterval()
+        with self.assertRaises(ValueError):
+            with SamplingProfiler(interval=original / 10):
+                raise ValueError
+        self.assertEqual(sys.getswitchinterval(), original)
+
+    def test_start_twice_raises(self):
+        """Test that starting a running profiler raises RuntimeError."""
+        profiler = SamplingProfiler()
+        with profiler:
+            with self.assertRaises(RuntimeError):
+                profiler.start()
+
+    def test_stop_without_start(self):
+        """Test that stopping a profiler that never started is a no-op."""
+        original = sys.getswitchinterval()
+        SamplingProfiler().stop()
+        self.assertEqual(sys.getswitchinterval(), original)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+import json
+import os
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+yahtzee_game_path = Path(__file__).parent.parent / 'yahtzee_game'
+sys.path.insert(0, str(yahtzee_game_path))
+
+from batch_scoring import score_batch
+from game import Game
+from parallel import run_parallel
+from rng import BufferedFaceSource
+from scoring import NUM_SLOTS, lookup_score
+from simulation import make_strategy, play_game
+from solver import DEFAULT_TABLE_PATH
+
+# Problem sizes are powers of ten from 10^3 up to the configured maximum;
+# full games are ~1000x more work than scoring one hand, so they stop earlier
+MIN_EXPONENT = 3
+MAX_GAMES_EXPONENT = 5
+MAX_HANDS_EXPONENT = 7
+# The pure-Python scorer is ~100x slower than score_batch, so cap its size
+MAX_LOOKUP_EXPONENT = 6
+GAME_STRATEGY = 'greedy'
+LATENCY_GAMES = 500
+SEED = 0
+
+def sizes(max_exponent, min_exponent=MIN_EXPONENT):
+    return [10 ** exponent for exponent in range(min_exponent, max_exponent + 1)]
+
+def worker_counts():
+    return sorted({1, 2, 4, os.cpu_count() or 1})
+
+def benchmark_games(game_sizes, workers_list, strategy_name=GAME_STRATEGY):
+    """Full single-player games per second for every (size, worker count) pair."""
+    results = []
+    for workers in workers_list:
+        for num_games in game_sizes:
+            run = run_parallel(num_games, partial(make_strategy, strategy_name), seed=SEED,
+                               workers=workers)
+            results.append({
+                'strategy': strategy_name,
+                'num_games': num_games,
+                'workers': workers,
+                'wall_time_s': run.wall_time,
+                'games_per_second': run.games_per_second,
+                'turns_per_second': run.games_per_second * NUM_SLOTS,
+                'mean_score': run.stats.mean_score
+            })
+            print(f"  games    {num_games:>10,d} × {workers} workers : "
+                  f"{run.games_per_second:12,.0f} games/s  {run.games_per_second * NUM_SLOTS:12,.0f} turns/s")
+    return results
+
+def make_hands(num_hands, seed=SEED):
+    return np.random.default_rng(seed).integers(1, 7, size=(num_hands, 5), dtype=np.int8)
+
+def time_lookup(hands):
+    hand_list = hands.tolist()
+    start = time.perf_counter()
+    for hand in hand_list:
+        for slot_idx in range(NUM_SLOTS):
+            lookup_score(hand, slot_idx)
+    return time.perf_counter() - start
+
+def time_batch(hands):
+    start = time.perf_counter()
+    score_batch(hands)
+    return time.perf_counter() - start
+
+def benchmark_scoring(hand_sizes, max_lookup):
+    """Hands scored in all 13 slots per second, for the table lookup and score_batch."""
+    results = []
+    for num_hands in hand_sizes:
+        hands = make_hands(num_hands)
+        for method, timer in (('lookup_score', time_lookup), ('score_batch', time_batch)):
+            if method == 'lookup_score' and num_hands > max_lookup:
+                continue
+            elapsed = timer(hands)
+            results.append({
+                'method': method,
+                'num_hands': num_hands,
+                'elapsed_s': elapsed,
+                'hands_per_second': num_hands / elapsed,
+                'scores_per_second': num_hands * NUM_SLOTS / elapsed
+            })
+            print(f"  scoring  {num_hands:>10,d} hands ({method:12s}) : "
+                  f"{num_hands / elapsed:12,.0f} hands/s  {num_hands * NUM_SLOTS / elapsed:12,.0f} scores/s")
+    return results
+
+class TimedStrategy:
+    """Delegate to a strategy and record the latency of every decision in nanoseconds."""
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self.reroll_ns = []
+        self.slot_ns = []
+
+    def begin_turn(self, game, player_idx):
+        self.strategy.begin_turn(game, player_idx)
+
+    def choose_reroll(self, dice_values, rolls_left, mask, upper):
+        start = time.perf_counter_ns()
+        reroll = self.strategy.choose_reroll(dice_values, rolls_left, mask, upper)
+        self.reroll_ns.append(time.perf_counter_ns() - start)
+        return reroll
+
+    def choose_slot(self, dice_values, mask, upper):
+        start = time.perf_counter_ns()
+        slot_idx = self.strategy.choose_slot(dice_values, mask, upper)
+        self.slot_ns.append(time.perf_counter_ns() - start)
+        return slot_idx
+
+def latency_summary(samples_ns):
+    samples_us = np.asarray(samples_ns) / 1000
+    return {
+        'count': len(samples_us),
+        'mean_us': float(samples_us.mean()),
+        'p50_us': float(np.percentile(samples_us, 50)),
+        'p95_us': float(np.percentile(samples_us, 95)),
+        'p99_us': float(np.percentile(samples_us, 99)),
+        'max_us': float(samples_us.max())
+    }
+
+def benchmark_decisions(strategy_names, num_games=LATENCY_GAMES):
+    """Per-call latency of choose_reroll and choose_slot over real games."""
+    results = {}
+    for name in strategy_names:
+        timed = TimedStrategy(make_strategy(name))
+        game = Game(1, BufferedFaceSource(SEED))
+        for _ in range(num_games):
+            game.players.reset()
+            play_game(game, [timed])
+        results[name] = {
+            'choose_reroll': latency_summary(timed.reroll_ns),
+            'choose_slot': latency_summary(timed.slot_ns)
+        }
+        for decision, summary in results[name].items():
+            print(f"  latency  {name:8s} {decision:14s} : p50 {summary['p50_us']:8.2f}µs  "
+                  f"p95 {summary['p95_us']:8.2f}µs  p99 {summary['p99_us']:8.2f}µs")
+    return results
+
+def run_throughput_benchmark(max_games_exponent=MAX_GAMES_EXPONENT,
+                             max_hands_exponent=MAX_HANDS_EXPONENT):
+    print("Running throughput benchmark...")
+    game_sizes = sizes(max_games_exponent)
+    hand_sizes = sizes(max_hands_exponent)
+    workers_list = worker_counts()
+    # The optimal strategy is only timed when its table is already solved
+    strategy_names = ['random', 'greedy'] + (['optimal'] if DEFAULT_TABLE_PATH.exists() else [])
+    print(f"Configuration: games {game_sizes[0]:,}-{game_sizes[-1]:,} × workers {workers_list}, "
+          f"hands {hand_sizes[0]:,}-{hand_sizes[-1]:,}, latency over {LATENCY_GAMES} games")
+    print("=" * 80)
+
+    results = {
+        'config': {
+            'game_sizes': game_sizes,
+            'hand_sizes': hand_sizes,
+            'workers': workers_list,
+            'cpu_count': os.cpu_count(),
+            'game_strategy': GAME_STRATEGY,
+            'latency_games': LATENCY_GAMES
+        },
+        'games': benchmark_games(game_sizes, workers_list),
+        'scoring': benchmark_scoring(hand_sizes, 10 ** MAX_LOOKUP_EXPONENT),
+        'decision_latency': benchmark_decisions(strategy_names)
+    }
+
+    output_dir = Path(__file__).parent / 'data'
+    output_dir.mkdir(exist_ok=True)
+
+    with open(output_dir / 'throughput_benchmark.json', 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\nResults saved to: {output_dir / 'throughput_benchmark.json'}")
+    return results
+
+if __name__ == '__main__':
+    max_games = int(sys.argv[1]) if len(sys.argv) > 1 else MAX_GAMES_EXPONENT
+    max_hands = int(sys.argv[2]) if len(sys.argv) > 2 else MAX_HANDS_EXPONENT
+    run_throughput_benchmark(max_games, max_hands)
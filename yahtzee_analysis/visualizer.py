@@ -22,20 +22,25 @@ def visualize_performance():
     
     methods = []
     times = []
+    errors = []
     memory = []
     
     for module, module_data in data.items():
         for method, metrics in module_data.items():
             methods.append(f"{module}.{method}")
-            times.append(metrics['execution_time_ms'])
+            # Median with its bootstrap CI when the harness recorded one
+            median = metrics.get('median_ms', metrics['execution_time_ms'])
+            low, high = metrics.get('median_ci_ms', [median, median])
+            times.append(median)
+            errors.append((median - low, high - median))
             memory.append(metrics['memory_used_kb'])
     
     y_pos = np.arange(len(methods))
     
-    ax1.barh(y_pos, times, color='steelblue')
+    ax1.barh(y_pos, times, xerr=np.array(errors).T, color='steelblue', ecolor='black', capsize=2)
     ax1.set_yticks(y_pos)
     ax1.set_yticklabels(methods, fontsize=8)
-    ax1.set_xlabel('Execution Time (ms)')
+    ax1.set_xlabel('Execution Time (ms, median ± 95% CI)')
     ax1.set_title('Method Execution Time')
     ax1.invert_yaxis()
     
@@ -92,7 +97,7 @@ def visualize_readability():
     ax1.legend()
     
     total_lines = [code_lines[i] + comment_lines[i] + blank_lines[i] for i in range(len(files))]
-    colors = ['steelblue', 'coral', 'lightgreen', 'gold']
+    colors = plt.cm.tab20(np.linspace(0, 1, len(files)))
     ax2.pie(total_lines, labels=files, autopct='%1.1f%%', colors=colors, startangle=90)
     ax2.set_title('Code Distribution by File')
     
@@ -150,6 +155,108 @@ def visualize_pylint():
     print(f"Debugging visualization saved to: {output_dir / 'debugging_metrics.png'}")
     plt.close()
 
+def visualize_throughput():
+    data = load_json_data('throughput_benchmark.json')
+    if not data:
+        print("No throughput data found. Run throughput_benchmark.py first.")
+        return
+    
+    fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(18, 6))
+    fig.suptitle('Throughput Benchmark', fontsize=16, fontweight='bold')
+    
+    for workers in data['config']['workers']:
+        runs = [r for r in data['games'] if r['workers'] == workers]
+        ax1.plot([r['num_games'] for r in runs], [r['games_per_second'] for r in runs],
+                 marker='o', label=f'{workers} workers')
+    ax1.set_xscale('log')
+    ax1.set_xlabel('Games')
+    ax1.set_ylabel('Games / second')
+    ax1.set_title(f"Full Games ({data['config']['game_strategy']} strategy)")
+    ax1.legend()
+    
+    for method in sorted({r['method'] for r in data['scoring']}):
+        runs = [r for r in data['scoring'] if r['method'] == method]
+        ax2.plot([r['num_hands'] for r in runs], [r['hands_per_second'] for r in runs],
+                 marker='o', label=method)
+    ax2.set_xscale('log')
+    ax2.set_yscale('log')
+    ax2.set_xlabel('Hands')
+    ax2.set_ylabel('Hands scored (13 slots) / second')
+    ax2.set_title('Scoring Throughput')
+    ax2.legend()
+    
+    labels = []
+    p50 = []
+    p99 = []
+    for strategy, decisions in data['decision_latency'].items():
+        for decision, summary in decisions.items():
+            labels.append(f"{strategy}.{decision}")
+            p50.append(summary['p50_us'])
+            p99.append(summary['p99_us'])
+    y_pos = np.arange(len(labels))
+    ax3.barh(y_pos - 0.2, p50, 0.4, label='p50', color='steelblue')
+    ax3.barh(y_pos + 0.2, p99, 0.4, label='p99', color='coral')
+    ax3.set_yticks(y_pos)
+    ax3.set_yticklabels(labels, fontsize=8)
+    ax3.set_xscale('log')
+    ax3.set_xlabel('Latency (µs)')
+    ax3.set_title('Strategy Decision Latency')
+    ax3.invert_yaxis()
+    ax3.legend()
+    
+    plt.tight_layout()
+    
+    output_dir = Path(__file__).parent / 'visualizations'
+    output_dir.mkdir(exist_ok=True)
+    plt.savefig(output_dir / 'throughput_benchmark.png', dpi=300, bbox_inches='tight')
+    print(f"Throughput visualization saved to: {output_dir / 'throughput_benchmark.png'}")
+    plt.close()
+
+def visualize_allocations():
+    data = load_json_data('allocation_profile.json')
+    if not data:
+        print("No allocation data found. Run allocation_profiler.py first.")
+        return
+    
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig.suptitle('Allocation Analysis', fontsize=16, fontweight='bold')
+    
+    operations = list(data['operations'].keys())
+    retained = [data['operations'][op]['retained_bytes_per_call'] for op in operations]
+    peak = [data['operations'][op]['peak_bytes_per_call'] for op in operations]
+    y_pos = np.arange(len(operations))
+    
+    ax1.barh(y_pos - 0.2, retained, 0.4, label='Retained', color='steelblue')
+    ax1.barh(y_pos + 0.2, peak, 0.4, label='Peak', color='coral')
+    ax1.set_yticks(y_pos)
+    ax1.set_yticklabels(operations, fontsize=8)
+    ax1.set_xlabel('Bytes per call')
+    ax1.set_title('Allocations per Operation')
+    ax1.invert_yaxis()
+    ax1.legend()
+    
+    games = data['concurrent_games']
+    num_games = [entry['num_games'] for entry in games]
+    ax2.plot(num_games, [entry['retained_kb'] for entry in games], marker='o', color='steelblue')
+    for entry in games:
+        ax2.annotate(f"{entry['bytes_per_game']:.0f} B/game", (entry['num_games'], entry['retained_kb']),
+                     textcoords='offset points', xytext=(5, -12), fontsize=8)
+    ax2.set_xscale('log')
+    ax2.set_yscale('log')
+    ax2.set_xlabel('Concurrent games (2 players)')
+    ax2.set_ylabel('Retained memory (KB)')
+    objects = games[-1]['live_objects']
+    ax2.set_title('Retained Size: ' + ', '.join(f"{n // games[-1]['num_games']} {name}"
+                                                for name, n in objects.items()) + ' per game')
+    
+    plt.tight_layout()
+    
+    output_dir = Path(__file__).parent / 'visualizations'
+    output_dir.mkdir(exist_ok=True)
+    plt.savefig(output_dir / 'allocation_profile.png', dpi=300, bbox_inches='tight')
+    print(f"Allocation visualization saved to: {output_dir / 'allocation_profile.png'}")
+    plt.close()
+
 def create_summary_visualization():
     perf_data = load_json_data('performance_metrics.json')
     read_data = load_json_data('readability_metrics.json')
@@ -195,5 +302,7 @@ if __name__ == '__main__':
     visualize_performance()
     visualize_readability()
     visualize_pylint()
+    visualize_throughput()
+    visualize_allocations()
     create_summary_visualization()
     print("\nAll visualizations generated successfully!")
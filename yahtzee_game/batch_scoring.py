@@ -0,0 +1,68 @@
+"""Vectorized NumPy scoring of many hands at once.
+
+``score_batch`` applies the same category rules as ``Game.calculate_score``
+to an ``[N, 5]`` array of face values without a per-hand Python loop.
+"""
+import numpy as np
+
+from scoring import NUM_DICE, NUM_FACES, NUM_SLOTS
+
+FACE_VALUES = np.arange(1, NUM_FACES + 1)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def face_counts(hands):
+    """Return an ``[N, 6]`` array with the number of dice showing each face."""
+    n = len(hands)
+    offsets = np.arange(n)[:, None] * NUM_FACES
+    flat = (hands - 1 + offsets).ravel()
+    return np.bincount(flat, minlength=n * NUM_FACES).reshape(n, NUM_FACES)
+
+
+def _score_chunk(hands, out):
+    counts = face_counts(hands)
+    totals = hands.sum(axis=1)
+    max_count = counts.max(axis=1)
+    present = counts > 0
+    distinct = present.sum(axis=1)
+
+    # Slots 0-5: number
+    out[:, :6] = counts * FACE_VALUES
+    # Slots 6-7: Three / Four of a Kind
+    out[:, 6] = np.where(max_count >= 3, totals, 0)
+    out[:, 7] = np.where(max_count >= 4, totals, 0)
+    # Slot 8: Full House (exactly two faces, one of them three times)
+    out[:, 8] = np.where((distinct == 2) & (max_count == 3), 25, 0)
+    # Slot 9: Small Straight (1-2-3-4, 2-3-4-5 or 3-4-5-6 all present)
+    small = (present[:, 0:4].all(axis=1)
+             | present[:, 1:5].all(axis=1)
+             | present[:, 2:6].all(axis=1))
+    out[:, 9] = np.where(small, 30, 0)
+    # Slot 10: Large Straight (five distinct faces missing either 1 or 6)
+    large = (distinct == 5) & ~(present[:, 0] & present[:, 5])
+    out[:, 10] = np.where(large, 40, 0)
+    # Slot 11: Yahtzee
+    out[:, 11] = np.where(max_count == 5, 50, 0)
+    # Slot 12: Chance
+    out[:, 12] = totals
+
+
+def score_batch(hands, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.int16):
+    """Score every hand in every category.
+
+    ``hands`` is an ``[N, 5]`` array-like of face values 1-6 in any order.
+    Returns an ``[N, 13]`` array whose column ``i`` is the score for slot ``i``.
+    Hands are processed ``chunk_size`` rows at a time to bound temporaries.
+    """
+    hands = np.asarray(hands)
+    if hands.ndim != 2 or hands.shape[1] != NUM_DICE:
+        raise ValueError("hands must have shape [N, 5]")
+    if hands.size and (hands.min() < 1 or hands.max() > NUM_FACES):
+        raise ValueError("Face value must be between 1 and 6")
+    hands = hands.astype(np.intp, copy=False)
+
+    scores = np.empty((len(hands), NUM_SLOTS), dtype=dtype)
+    for start in range(0, len(hands), chunk_size):
+        stop = start + chunk_size
+        _score_chunk(hands[start:stop], scores[start:stop])
+    return scores
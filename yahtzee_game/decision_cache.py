@@ -0,0 +1,84 @@
+"""Bounded LRU cache for keep/reroll decisions.
+
+Picking the best keep means weighing up to 32 keep subsets against their
+outcome distributions, yet a long-running bot meets the same positions over
+and over.  ``DecisionCache`` memoizes ``(kept values, expected value)`` per
+position, keyed by
+
+    (hand_key(dice), used-slot mask, rolls left, capped upper subtotal)
+
+``hand_key`` ignores dice order, so every permutation of a hand shares one
+entry; the reroll positions for the actual dice order are derived from the
+cached keep on each call.
+"""
+from collections import OrderedDict
+
+from scoring import hand_key, reroll_indices
+
+DEFAULT_MAXSIZE = 1 << 16
+
+
+class DecisionCache:
+    """Memoize ``compute(dice_values, rolls_left, mask, upper) -> (kept, value)``.
+
+    The least recently used entry is evicted once ``maxsize`` entries are held.
+    """
+
+    def __init__(self, compute, maxsize=DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.compute = compute
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def choose_keep(self, dice_values, rolls_left, mask, upper):
+        """Return the cached (kept values, expected value), computing it on a miss."""
+        key = (hand_key(dice_values), mask, rolls_left, upper)
+        entries = self._entries
+        decision = entries.get(key)
+        if decision is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return decision
+        self.misses += 1
+        decision = self.compute(dice_values, rolls_left, mask, upper)
+        entries[key] = decision
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return decision
+
+    def choose_reroll(self, dice_values, rolls_left, mask, upper):
+        """Return the set of dice positions to reroll under the cached keep."""
+        kept, _ = self.choose_keep(dice_values, rolls_left, mask, upper)
+        return reroll_indices(dice_values, kept)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, position):
+        dice_values, rolls_left, mask, upper = position
+        return (hand_key(dice_values), mask, rolls_left, upper) in self._entries
+
+    def to_dict(self):
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate
+        }
@@ -1,8 +1,13 @@
 import random
 
+from instrumentation import counted
+
 class Dice:
-    def __init__(self):
-        self._face_value = random.randint(1, 6)
+    def __init__(self, rng=None):
+        self._rng = rng if rng is not None else random
+        self._face_value = self._rng.randint(1, 6)
+        # Called with the new face whenever it changes (Game keeps its hand in sync this way)
+        self.on_change = None
     
     @property
     def face_value(self):
@@ -12,9 +17,14 @@ class Dice:
     def face_value(self, value):
         if 1 <= value <= 6:
             self._face_value = value
+            if self.on_change is not None:
+                self.on_change(value)
         else:
             raise ValueError("Face value must be between 1 and 6")
     
+    @counted('dice.roll')
     def roll(self):
-        self._face_value = random.randint(1, 6)
-        return self._face_value
\ No newline at end of file
+        value = self._face_value = self._rng.randint(1, 6)
+        if self.on_change is not None:
+            self.on_change(value)
+        return value
\ No newline at end of file
@@ -0,0 +1,240 @@
+"""Exact final-score distributions under a strategy.
+
+``score_distribution`` follows ``Game.play`` round by round.  A layer maps
+every reachable state (used-slot mask, capped upper subtotal) to the
+probability distribution of the score banked so far.  For each state the
+strategy's whole turn is resolved exactly with the reroll transition matrix:
+
+    P(final hand) = T[reroll all] @ T[keep with 2 rolls left] @ T[keep with 1 roll left]
+
+(each product pools the hands by the keep they lead to, so it is a 462-wide
+vector times ``T``),
+which gives, per open slot, a small PMF of the points scored there.  Lower
+section outcomes are convolved into the next state's PMF; upper section
+outcomes move the upper subtotal, so each point value is a shifted copy.
+The upper bonus is added once the card is full.
+
+Score PMFs are stored compactly as ``(offset, array)`` over their non-zero
+range.  Two knobs bound the work and memory:
+
+* ``min_prob`` - entries (and whole states) below this probability are
+  dropped after every round; the dropped mass is reported as ``truncated``
+* ``max_score`` - scores above it are folded into the top bucket
+
+A strategy is anything with ``turn_policy(mask, upper)`` (a ``StrategyTable``
+or an ``OptimalStrategy`` wrapping one), or any deterministic ``Strategy``,
+which is asked about each of the 252 sorted hands instead.
+"""
+import sys
+import time
+
+import numpy as np
+
+from scoring import (ALL_HANDS, NUM_SLOTS, NUM_UPPER_SLOTS, UPPER_BONUS, UPPER_BONUS_THRESHOLD,
+                     hand_key)
+from transitions import EMPTY_KEEP, KEEP_INDEX, NUM_KEEPS, SCORES, TRANSITIONS
+
+SCORE_INT = SCORES.astype(np.intp)
+HAND_ROWS = np.arange(len(ALL_HANDS))
+POINTS_RANGE = int(SCORE_INT.max()) + 1
+# Highest possible final score under this tree's rules
+MAX_SCORE = int(SCORE_INT.max(axis=0).sum()) + UPPER_BONUS
+DEFAULT_MIN_PROB = 1e-12
+
+
+class StrategyPolicy:
+    """``turn_policy`` for a deterministic ``Strategy``, built by querying every sorted hand."""
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+
+    def turn_policy(self, mask, upper):
+        strategy = self.strategy
+        keeps = {2: [], 1: []}
+        slots = []
+        for hand in ALL_HANDS:
+            values = list(hand)
+            for rolls_left in (2, 1):
+                reroll = strategy.choose_reroll(values, rolls_left, mask, upper)
+                kept = [value for idx, value in enumerate(values) if idx not in reroll]
+                keeps[rolls_left].append(KEEP_INDEX[hand_key(kept)])
+            slots.append(strategy.choose_slot(values, mask, upper))
+        return np.array(keeps[2]), np.array(keeps[1]), np.array(slots)
+
+
+def as_policy(strategy):
+    """Return an object with ``turn_policy`` for a table, ``OptimalStrategy`` or ``Strategy``."""
+    if hasattr(strategy, 'turn_policy'):
+        return strategy
+    table = getattr(strategy, 'table', None)
+    if hasattr(table, 'turn_policy'):
+        return table
+    return StrategyPolicy(strategy)
+
+
+def turn_outcomes(policy, mask, upper):
+    """Return ``[(slot, offset, pmf)]``: the points distribution of each slot the turn can use."""
+    keeps_two_left, keeps_one_left, slots = policy.turn_policy(mask, upper)
+    hand_probs = TRANSITIONS[EMPTY_KEEP]
+    for keeps in (keeps_two_left, keeps_one_left):
+        # Pool the hands by the keep they lead to, then reroll each keep once
+        hand_probs = np.bincount(keeps, weights=hand_probs, minlength=NUM_KEEPS) @ TRANSITIONS
+    # One bincount over (slot, points) pairs gives every slot's points PMF
+    pairs = slots * POINTS_RANGE + SCORE_INT[HAND_ROWS, slots]
+    pmfs = np.bincount(pairs, weights=hand_probs,
+                       minlength=NUM_SLOTS * POINTS_RANGE).reshape(NUM_SLOTS, POINTS_RANGE)
+    outcomes = []
+    for slot in np.unique(slots):
+        nonzero = np.flatnonzero(pmfs[slot])
+        outcomes.append((int(slot), nonzero[0], pmfs[slot, nonzero[0]:nonzero[-1] + 1]))
+    return outcomes
+
+
+def _merge(parts, max_score):
+    """Sum compact ``(offset, pmf)`` parts into one, folding scores above ``max_score``."""
+    lo = min(offset for offset, _ in parts)
+    hi = max(offset + len(pmf) for offset, pmf in parts)
+    merged = np.zeros(hi - lo)
+    for offset, pmf in parts:
+        merged[offset - lo:offset - lo + len(pmf)] += pmf
+    if hi > max_score + 1:
+        keep = max(1, max_score + 1 - lo)
+        merged[keep - 1] += merged[keep:].sum()
+        merged = merged[:keep]
+        lo = min(lo, max_score)
+    return lo, merged
+
+
+def _trim(offset, pmf, min_prob):
+    """Drop leading and trailing entries below ``min_prob``; return (offset, pmf, dropped)."""
+    kept = np.flatnonzero(pmf >= min_prob)
+    if not len(kept):
+        return offset, None, pmf.sum()
+    start, stop = kept[0], kept[-1] + 1
+    dropped = pmf[:start].sum() + pmf[stop:].sum()
+    return offset + start, pmf[start:stop], dropped
+
+
+def _advance(layer, policy, min_prob, max_score):
+    """Play one round from every state of ``layer``; return (next layer, dropped mass)."""
+    contributions = {}
+    for (mask, upper), (offset, pmf) in layer.items():
+        for slot, points_offset, points_pmf in turn_outcomes(policy, mask, upper):
+            next_mask = mask | (1 << slot)
+            if slot < NUM_UPPER_SLOTS:
+                for idx in np.flatnonzero(points_pmf):
+                    points = points_offset + idx
+                    state = (next_mask, min(UPPER_BONUS_THRESHOLD, upper + points))
+                    contributions.setdefault(state, []).append(
+                        (offset + points, pmf * points_pmf[idx]))
+            else:
+                contributions.setdefault((next_mask, upper), []).append(
+                    (offset + points_offset, np.convolve(pmf, points_pmf)))
+
+    next_layer = {}
+    dropped = 0.0
+    for state, parts in contributions.items():
+        offset, pmf = _merge(parts, max_score)
+        offset, pmf, lost = _trim(offset, pmf, min_prob)
+        dropped += lost
+        if pmf is not None:
+            next_layer[state] = (offset, pmf)
+    return next_layer, dropped
+
+
+class ScoreDistribution:
+    """PMF of the final score: ``pmf[s]`` is P(final score == s)."""
+
+    def __init__(self, pmf, truncated=0.0):
+        self.pmf = pmf
+        self.truncated = truncated
+        self._cdf = np.cumsum(pmf)
+
+    @property
+    def total_probability(self):
+        return float(self._cdf[-1]) if len(self._cdf) else 0.0
+
+    @property
+    def mean(self):
+        return float(np.arange(len(self.pmf)) @ self.pmf) / (self.total_probability or 1.0)
+
+    @property
+    def std(self):
+        scores = np.arange(len(self.pmf))
+        variance = float((scores - self.mean) ** 2 @ self.pmf) / (self.total_probability or 1.0)
+        return variance ** 0.5
+
+    def cdf(self, score):
+        """P(final score <= score)."""
+        if score < 0:
+            return 0.0
+        return float(self._cdf[min(int(score), len(self._cdf) - 1)])
+
+    def prob_above(self, score):
+        """P(final score > score)."""
+        return self.total_probability - self.cdf(score)
+
+    def quantile(self, q):
+        """Smallest score whose CDF reaches ``q`` of the total probability."""
+        return int(np.searchsorted(self._cdf, q * self.total_probability))
+
+    def to_dict(self):
+        support = np.flatnonzero(self.pmf)
+        return {
+            'mean': self.mean,
+            'std': self.std,
+            'min_score': int(support[0]) if len(support) else 0,
+            'max_score': int(support[-1]) if len(support) else 0,
+            'median': self.quantile(0.5),
+            'p5': self.quantile(0.05),
+            'p95': self.quantile(0.95),
+            'truncated': self.truncated,
+            'pmf': {str(score): float(self.pmf[score]) for score in support}
+        }
+
+
+def score_distribution(strategy, mask=0, upper=0, score=0, min_prob=DEFAULT_MIN_PROB,
+                       max_score=MAX_SCORE, progress=False):
+    """Exact distribution of the final score when ``strategy`` plays on from a state.
+
+    ``mask``/``upper`` describe the player's card between turns and ``score``
+    the points already banked (upper bonus excluded); the result includes them.
+    """
+    policy = as_policy(strategy)
+    upper = min(UPPER_BONUS_THRESHOLD, upper)
+    layer = {(mask, upper): _merge([(score, np.ones(1))], max_score)}
+    truncated = 0.0
+    rounds_left = NUM_SLOTS - bin(mask).count('1')
+    start = time.perf_counter()
+    for round_idx in range(rounds_left):
+        layer, dropped = _advance(layer, policy, min_prob, max_score)
+        truncated += dropped
+        if progress:
+            print(f"  round {round_idx + 1}/{rounds_left}: {len(layer)} states "
+                  f"({time.perf_counter() - start:.1f}s)")
+        if not layer:
+            # min_prob trimmed every state away; all the mass is in truncated
+            return ScoreDistribution(np.zeros(max_score + 1), truncated)
+
+    parts = []
+    for (_, final_upper), (offset, pmf) in layer.items():
+        bonus = UPPER_BONUS if final_upper >= UPPER_BONUS_THRESHOLD else 0
+        parts.append((offset + bonus, pmf))
+    offset, pmf = _merge(parts, max_score)
+    final = np.zeros(max_score + 1)
+    final[offset:offset + len(pmf)] = pmf
+    return ScoreDistribution(final, truncated)
+
+
+if __name__ == '__main__':
+    from simulation import make_strategy
+    strategy_name = sys.argv[1] if len(sys.argv) > 1 else 'optimal'
+    min_prob = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_MIN_PROB
+    start = time.perf_counter()
+    dist = score_distribution(make_strategy(strategy_name), min_prob=min_prob, progress=True)
+    print(f"Strategy:   {strategy_name}")
+    print(f"Mean score: {dist.mean:.4f} ± {dist.std:.2f}")
+    print(f"Quantiles:  p5 {dist.quantile(0.05)}, median {dist.quantile(0.5)}, "
+          f"p95 {dist.quantile(0.95)}")
+    print(f"Truncated:  {dist.truncated:.3g}")
+    print(f"Time:       {time.perf_counter() - start:.1f}s")
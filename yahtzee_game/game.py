@@ -1,47 +1,84 @@
+import random
+from functools import partial
+
 from dice import Dice
+from hand import Hand
+from instrumentation import counted, timed
 from scorecard import Scorecard
+from scoring import NUM_SLOTS, SCORES_BY_KEY, is_small_straight, is_large_straight
 
 class Game:
     current_round = 0 
-    dice_values = [0] * 5
-    sorted_dice = [0] * 5
-    frequency = [0] * 6  
     players = Scorecard(2)  
     die = [Dice() for _ in range(5)]
 
-    def __init__(self, players):
+    def __init__(self, players, rng=None):
+        self.rng = rng if rng is not None else random
         self.players = Scorecard(players)
-        self.die = [Dice() for _ in range(5)]
+        self.die = [Dice(self.rng) for _ in range(5)]
+        self.hand = Hand([dice.face_value for dice in self.die])
+        self._bind_dice()
         self.roll_dice()
-        self.set_dice_values()
-        self.set_sorted_dice()
-        self.set_frequency()
     
+    # dice_values, sorted_dice and frequency are views of the packed hand, so
+    # they can never drift out of sync with each other. Every Dice reports its
+    # new face to the hand, so rolling or setting a die directly updates it too.
+    @property
+    def dice_values(self):
+        return self.hand.values()
+    
+    @dice_values.setter
+    def dice_values(self, values):
+        self.hand.set_values(values)
+        for dice, value in zip(self.die, values):
+            dice.face_value = value
+    
+    @property
+    def sorted_dice(self):
+        return list(self.hand.sorted_values())
+    
+    @property
+    def frequency(self):
+        return self.hand.counts()
+    
+    @timed('game.roll_dice')
     def roll_dice(self):
         for dice in self.die:
             dice.roll()
-        self.set_dice_values()
     
+    @timed('game.reroll_dice')
+    def reroll_dice(self, indices):
+        die = self.die
+        for idx in indices:
+            die[idx].roll()
+    
+    @counted('game.get_dice_values')
     def get_dice_values(self):
-        return [dice.face_value for dice in self.die]
+        return self.hand.values()
     
+    @counted('game.get_sorted_dice')
     def get_sorted_dice(self):
-        return sorted(self.get_dice_values())
+        return list(self.hand.sorted_values())
     
+    @counted('game.get_frequency')
     def get_frequency(self):
-        return self.frequency
+        return self.hand.counts()
     
+    @counted('game.set_dice_values')
     def set_dice_values(self):
-        for i in range(5):
-            self.dice_values[i] = self.die[i].face_value
+        # Rebuild the hand from the Dice objects, e.g. after self.die was replaced
+        self.hand.set_values([dice.face_value for dice in self.die])
+        self._bind_dice()
+
+    def _bind_dice(self):
+        for idx, dice in enumerate(self.die):
+            dice.on_change = partial(self.hand.set_face, idx)
 
     def set_sorted_dice(self):
-        self.sorted_dice = sorted(self.dice_values)
+        """Deprecated no-op, kept for compatibility: sorted_dice is always derived from the hand."""
     
     def set_frequency(self):
-        self.frequency = [0] * 6
-        for value in self.dice_values:
-            self.frequency[value - 1] += 1
+        """Deprecated no-op, kept for compatibility: frequency is always derived from the hand."""
 
     def play(self):
         for round_num in range(1, 14):  
@@ -62,11 +99,7 @@ class Game:
                         for idx in reroll_indices:
                             kept_indices.discard(idx)
                         # Roll the reroll dice
-                        for idx in reroll_indices:
-                            self.die[idx].roll()
-                        self.set_dice_values()
-                        self.set_sorted_dice()
-                        self.set_frequency()
+                        self.reroll_dice(reroll_indices)
                 print(f"\nFinal dice: {self.get_dice_values()}")
                 slot_idx = self.get_scoring_slot_input(player_idx)
                 score = self.calculate_score(slot_idx)
@@ -131,14 +164,13 @@ class Game:
         print(f"{'Slot':<5} {'Category':<50} {'Score':<8} {'Status':<12}")
         print(f"{'-'*80}")
         for i, category in enumerate(categories):
-            score = player_card[i]
-            status = "✓ OPEN" if score == 0 else "✗ USED"
-            score_display = str(score) if score != 0 else "-"
+            used = self.players.is_used(player_idx, i)
+            status = "✗ USED" if used else "✓ OPEN"
+            score_display = str(player_card[i]) if used else "-"
             print(f"{i:<5} {category:<50} {score_display:<8} {status:<12}")
         print(f"{'='*80}")
     
     def get_scoring_slot_input(self, player_idx):
-        player_card = self.players.get_player_card(player_idx)
         self.display_scorecard(player_idx)
         while True:
             try:
@@ -146,7 +178,7 @@ class Game:
                     f"\nChoose an open scoring slot (0-12) for Player {player_idx + 1}: "
                 ))
                 if 0 <= slot < 13:
-                    if player_card[slot] != 0:
+                    if self.players.is_used(player_idx, slot):
                         print(f"❌ Slot {slot} already used! Choose an open slot.")
                         self.display_scorecard(player_idx)
                         continue
@@ -156,63 +188,14 @@ class Game:
             except ValueError:
                 print("Invalid input. Please enter a number between 0 and 12.")
     
+    @timed('game.calculate_score')
     def calculate_score(self, slot_idx):
-        values = self.get_dice_values()
-        sorted_values = self.get_sorted_dice()
-        freq = self.get_frequency()
-        
-        # Slots 0-5: number
-        if slot_idx < 6:
-            return sum(v for v in values if v == slot_idx + 1)
-        
-        # Slot 6: Three of a Kind
-        elif slot_idx == 6:
-            if any(f >= 3 for f in freq):
-                return sum(values)
-            return 0
-        
-        # Slot 7: Four of a Kind
-        elif slot_idx == 7:
-            if any(f >= 4 for f in freq):
-                return sum(values)
-            return 0
-        
-        # Slot 8: Full House
-        elif slot_idx == 8:
-            if sorted(freq).count(0) == 4 and (3 in freq and 2 in freq):
-                return 25
-            return 0
-        
-        # Slot 9: Small Straight (4 consecutive numbers)
-        elif slot_idx == 9:
-            if self.is_small_straight(sorted_values):
-                return 30
-            return 0
-        
-        # Slot 10: Large Straight (5 consecutive numbers)
-        elif slot_idx == 10:
-            if self.is_large_straight(sorted_values):
-                return 40
-            return 0
-        
-        # Slot 11: Yahtzee (all 5 dice the same)
-        elif slot_idx == 11:
-            if max(freq) == 5:
-                return 50
-            return 0
-        
-        # Slot 12: Chance (sum of all dice)
-        elif slot_idx == 12:
-            return sum(values)
-        
+        if 0 <= slot_idx < NUM_SLOTS:
+            return SCORES_BY_KEY[self.hand.key][slot_idx]
         return 0
     
     def is_small_straight(self, sorted_values):
-        straights = [[1, 2, 3, 4], [2, 3, 4, 5], [3, 4, 5, 6]]
-        for straight in straights:
-            if all(num in sorted_values for num in straight):
-                return True
-        return False
+        return is_small_straight(sorted_values)
     
     def is_large_straight(self, sorted_values):
-        return sorted_values == [1, 2, 3, 4, 5] or sorted_values == [2, 3, 4, 5, 6]
\ No newline at end of file
+        return is_large_straight(sorted_values)
@@ -0,0 +1,96 @@
+"""Compact integer-encoded hand of five dice.
+
+A ``Hand`` keeps two packed ints, updated together whenever a die changes:
+
+* ``faces`` - die ``i``'s face in bits ``3i .. 3i+2`` (positions preserved)
+* ``key``   - the count of face ``v`` in bits ``3(v-1) .. 3(v-1)+2``, which is
+  exactly ``scoring.hand_key`` and so indexes the precomputed score table
+
+plus the running total.  Counts, sum, sorted form and scores are O(1), and
+rerolling one die is a constant-time delta rather than a full resync.
+"""
+from scoring import ALL_HANDS, FACE_BITS, HAND_INDEX, NUM_DICE, SCORES_BY_KEY
+
+_SHIFTS = tuple(3 * idx for idx in range(NUM_DICE))
+
+
+class Hand:
+    __slots__ = ('_faces', '_key', '_total')
+
+    def __init__(self, values):
+        self.set_values(values)
+
+    def set_values(self, values):
+        """Replace all five faces."""
+        if len(values) != NUM_DICE:
+            raise ValueError("A hand has exactly 5 dice")
+        faces = key = 0
+        for shift, value in zip(_SHIFTS, values):
+            if not 1 <= value <= 6:
+                raise ValueError("Face value must be between 1 and 6")
+            faces |= value << shift
+            key += FACE_BITS[value]
+        self._faces = faces
+        self._key = key
+        self._total = sum(values)
+
+    def set_face(self, idx, value):
+        """Change die ``idx`` to ``value``, updating counts and total incrementally."""
+        if not 1 <= value <= 6:
+            raise ValueError("Face value must be between 1 and 6")
+        shift = _SHIFTS[idx]
+        old = (self._faces >> shift) & 7
+        self._faces += (value - old) << shift
+        self._key += FACE_BITS[value] - FACE_BITS[old]
+        self._total += value - old
+
+    def face(self, idx):
+        return (self._faces >> _SHIFTS[idx]) & 7
+
+    def values(self):
+        """Face values in dice order, as a new list."""
+        faces = self._faces
+        return [(faces >> shift) & 7 for shift in _SHIFTS]
+
+    @property
+    def faces(self):
+        return self._faces
+
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def total(self):
+        return self._total
+
+    @property
+    def index(self):
+        """Position of this hand in ``scoring.ALL_HANDS``."""
+        return HAND_INDEX[self._key]
+
+    def count(self, face):
+        return (self._key >> (3 * (face - 1))) & 7
+
+    def counts(self):
+        key = self._key
+        return [(key >> shift) & 7 for shift in (0, 3, 6, 9, 12, 15)]
+
+    def sorted_values(self):
+        """Face values in ascending order, as a tuple."""
+        return ALL_HANDS[HAND_INDEX[self._key]]
+
+    def scores(self):
+        """The 13 category scores of this hand."""
+        return SCORES_BY_KEY[self._key]
+
+    def __eq__(self, other):
+        if isinstance(other, Hand):
+            return self._faces == other._faces
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._faces)
+
+    def __repr__(self):
+        return f"Hand({self.values()})"
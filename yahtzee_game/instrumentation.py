@@ -0,0 +1,273 @@
+"""Call counters and latency histograms for the game's hot paths.
+
+Instrumentation is off unless the ``YAHTZEE_INSTRUMENT`` environment variable
+is set (to anything but ``''`` or ``'0'``) when this module is first
+imported.  While it is off, ``counted`` and ``timed`` return the decorated
+function itself, so instrumented methods run exactly the code they would
+without the decorator.
+
+While it is on, every thread records into its own ``Recorder`` (found
+through a ``threading.local``), so the hot path never takes a lock.
+``snapshot`` sums the recorders of every thread that has recorded anything
+in this process.  Each process has its own recorders; snapshots exported by
+several processes are combined with ``merge_snapshots``.
+
+Timers keep a histogram with one bucket per power of two nanoseconds
+(bucket ``i`` holds durations of ``i`` bits, i.e. ``[2**(i-1), 2**i)`` ns),
+which bounds memory and makes merging a plain element-wise sum.  With
+instrumentation on, the process writes its snapshot to
+``yahtzee_analysis/data/instrumentation_<pid>.json`` when it exits.
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+ENV_VAR = 'YAHTZEE_INSTRUMENT'
+ENABLED = os.environ.get(ENV_VAR, '') not in ('', '0')
+NUM_BUCKETS = 64
+DEFAULT_SNAPSHOT_DIR = Path(__file__).parent.parent / 'yahtzee_analysis' / 'data'
+
+
+class Histogram:
+    """Sum, maximum and power-of-two buckets of durations in nanoseconds.
+
+    The count is the sum of the buckets, so recording a duration touches
+    just three fields.
+    """
+
+    __slots__ = ('total_ns', 'max_ns', 'buckets')
+
+    def __init__(self):
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * NUM_BUCKETS
+
+    def record(self, ns):
+        self.total_ns += ns
+        self.buckets[min(ns.bit_length(), NUM_BUCKETS - 1)] += 1
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def merge(self, other):
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        return self
+
+    @property
+    def count(self):
+        return sum(self.buckets)
+
+    @property
+    def mean_ns(self):
+        count = self.count
+        return self.total_ns / count if count else 0.0
+
+    @property
+    def min_ns(self):
+        """Lower bound of the lowest non-empty bucket."""
+        for bits, n in enumerate(self.buckets):
+            if n:
+                return 1 << (bits - 1) if bits else 0
+        return 0
+
+    def quantile(self, q):
+        """Upper bound (ns) of the bucket holding the ``q`` quantile, capped at ``max_ns``."""
+        count = self.count
+        if not count:
+            return 0
+        target = q * count
+        seen = 0
+        for bits, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                return min(1 << bits, self.max_ns)
+        return self.max_ns
+
+    def to_dict(self):
+        last = max((bits for bits, n in enumerate(self.buckets) if n), default=-1)
+        return {
+            'count': self.count,
+            'total_ns': self.total_ns,
+            'mean_ns': self.mean_ns,
+            'min_ns': self.min_ns,
+            'max_ns': self.max_ns,
+            'p50_ns': self.quantile(0.5),
+            'p90_ns': self.quantile(0.9),
+            'p99_ns': self.quantile(0.99),
+            'buckets': self.buckets[:last + 1]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.total_ns = data['total_ns']
+        histogram.max_ns = data['max_ns']
+        buckets = data['buckets']
+        histogram.buckets = buckets + [0] * (NUM_BUCKETS - len(buckets))
+        return histogram
+
+
+class Recorder:
+    """One thread's counters and timer histograms."""
+
+    __slots__ = ('counters', 'timers')
+
+    def __init__(self):
+        self.counters = {}
+        self.timers = {}
+
+
+_local = threading.local()
+# Every thread's recorder, so snapshot() can find them.  list.append is
+# atomic, and a recorder stays here after its thread exits so its counts
+# are not lost.
+_recorders = []
+
+
+def recorder():
+    """The calling thread's recorder, created on first use."""
+    try:
+        return _local.recorder
+    except AttributeError:
+        rec = _local.recorder = Recorder()
+        # The wrappers read the dicts straight off the thread-local
+        _local.counters = rec.counters
+        _local.timers = rec.timers
+        _recorders.append(rec)
+        return rec
+
+
+def _add(name, n):
+    counters = recorder().counters
+    counters[name] = counters.get(name, 0) + n
+
+
+def _histogram(name):
+    timers = recorder().timers
+    histogram = timers.get(name)
+    if histogram is None:
+        histogram = timers[name] = Histogram()
+    return histogram
+
+
+def count(name, n=1):
+    """Add ``n`` to counter ``name``; a no-op while instrumentation is off."""
+    if ENABLED:
+        _add(name, n)
+
+
+def counted(name):
+    """Decorator counting calls to the function under ``name``."""
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                _local.counters[name] += 1
+            except (AttributeError, KeyError):
+                _add(name, 1)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def timed(name):
+    """Decorator recording the duration of every call in histogram ``name``.
+
+    Calls that raise are not recorded.
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            result = func(*args, **kwargs)
+            elapsed = clock() - start
+            try:
+                histogram = _local.timers[name]
+            except (AttributeError, KeyError):
+                histogram = _histogram(name)
+            histogram.total_ns += elapsed
+            # Durations below 2**63 ns have at most 63 bits, so always fit a bucket
+            histogram.buckets[elapsed.bit_length()] += 1
+            if elapsed > histogram.max_ns:
+                histogram.max_ns = elapsed
+            return result
+        return wrapper
+    return decorate
+
+
+def snapshot():
+    """Counters and timers summed over every thread of this process, as a JSON-ready dict."""
+    counters = {}
+    timers = {}
+    for rec in list(_recorders):
+        # Copy each dict in one step; another thread may be adding names
+        for name, n in list(rec.counters.items()):
+            counters[name] = counters.get(name, 0) + n
+        for name, histogram in list(rec.timers.items()):
+            timers.setdefault(name, Histogram()).merge(histogram)
+    return {
+        'enabled': ENABLED,
+        'pid': os.getpid(),
+        'timestamp': time.time(),
+        'threads': len(_recorders),
+        'counters': dict(sorted(counters.items())),
+        'timers': {name: timers[name].to_dict() for name in sorted(timers)}
+    }
+
+
+def merge_snapshots(snapshots):
+    """Combine snapshots from several processes into one."""
+    counters = {}
+    timers = {}
+    for snap in snapshots:
+        for name, n in snap['counters'].items():
+            counters[name] = counters.get(name, 0) + n
+        for name, data in snap['timers'].items():
+            timers.setdefault(name, Histogram()).merge(Histogram.from_dict(data))
+    return {
+        'enabled': any(snap['enabled'] for snap in snapshots),
+        'pids': sorted({pid for snap in snapshots for pid in snap.get('pids', [snap.get('pid')])}),
+        'timestamp': max((snap['timestamp'] for snap in snapshots), default=time.time()),
+        'threads': sum(snap['threads'] for snap in snapshots),
+        'counters': dict(sorted(counters.items())),
+        'timers': {name: timers[name].to_dict() for name in sorted(timers)}
+    }
+
+
+def reset():
+    """Clear every thread's counters and timers."""
+    for rec in list(_recorders):
+        rec.counters.clear()
+        rec.timers.clear()
+
+
+def export_snapshot(path=None):
+    """Write ``snapshot()`` as JSON (by default into the analysis data directory)."""
+    if path is None:
+        path = DEFAULT_SNAPSHOT_DIR / f'instrumentation_{os.getpid()}.json'
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(snapshot(), f, indent=2)
+    return path
+
+
+def _export_at_exit():
+    if _recorders:
+        export_snapshot()
+
+
+if ENABLED:
+    atexit.register(_export_at_exit)
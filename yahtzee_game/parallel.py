@@ -0,0 +1,187 @@
+"""Multi-core simulation runner with deterministic per-shard seeds.
+
+``run_parallel`` splits N games into fixed-size shards and plays them on a
+``ProcessPoolExecutor``.  Every shard gets its own ``BufferedFaceSource``
+seeded from ``(seed, shard index)``, so a shard plays the same games
+whichever worker runs it.  Shard statistics are integer sums that are merged
+as shards finish, which makes the aggregate independent of the worker count
+and completion order.
+"""
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+from game import Game
+from rng import BufferedFaceSource
+from scoring import NUM_SLOTS
+from simulation import make_strategy, play_game
+
+DEFAULT_SHARD_SIZE = 1000
+
+
+def shard_seed(seed, shard_idx):
+    """Seed for one shard; string seeds are hashed with SHA-512 by ``random.Random``."""
+    return f"{seed}:{shard_idx}"
+
+
+class SimulationStats:
+    """Mergeable score histogram and per-category totals for a set of games."""
+
+    def __init__(self):
+        self.num_games = 0
+        self.histogram = Counter()
+        self.category_sums = [0] * NUM_SLOTS
+        self.category_sq_sums = [0] * NUM_SLOTS
+        self.category_zeros = [0] * NUM_SLOTS
+        self.elapsed = 0.0
+
+    def add_game(self, score, card):
+        self.num_games += 1
+        self.histogram[score] += 1
+        for slot_idx, value in enumerate(card):
+            self.category_sums[slot_idx] += value
+            self.category_sq_sums[slot_idx] += value * value
+            if value == 0:
+                self.category_zeros[slot_idx] += 1
+
+    def merge(self, other):
+        self.num_games += other.num_games
+        self.histogram.update(other.histogram)
+        for slot_idx in range(NUM_SLOTS):
+            self.category_sums[slot_idx] += other.category_sums[slot_idx]
+            self.category_sq_sums[slot_idx] += other.category_sq_sums[slot_idx]
+            self.category_zeros[slot_idx] += other.category_zeros[slot_idx]
+        self.elapsed += other.elapsed
+        return self
+
+    @property
+    def mean_score(self):
+        if not self.num_games:
+            return 0.0
+        return sum(score * count for score, count in self.histogram.items()) / self.num_games
+
+    @property
+    def score_std(self):
+        if self.num_games < 2:
+            return 0.0
+        mean = self.mean_score
+        sq_dev = sum(count * (score - mean) ** 2 for score, count in self.histogram.items())
+        return (sq_dev / (self.num_games - 1)) ** 0.5
+
+    def category_means(self):
+        n = self.num_games or 1
+        return [total / n for total in self.category_sums]
+
+    def category_stds(self):
+        n = self.num_games or 1
+        return [max(0.0, sq / n - (total / n) ** 2) ** 0.5
+                for total, sq in zip(self.category_sums, self.category_sq_sums)]
+
+    def same_results(self, other):
+        """True if both hold identical game results (timings are ignored)."""
+        return (self.num_games == other.num_games
+                and self.histogram == other.histogram
+                and self.category_sums == other.category_sums
+                and self.category_sq_sums == other.category_sq_sums
+                and self.category_zeros == other.category_zeros)
+
+    def to_dict(self):
+        return {
+            'num_games': self.num_games,
+            'mean_score': self.mean_score,
+            'score_std': self.score_std,
+            'histogram': {str(score): count for score, count in sorted(self.histogram.items())},
+            'category_means': self.category_means(),
+            'category_stds': self.category_stds(),
+            'category_zero_rate': [zeros / (self.num_games or 1) for zeros in self.category_zeros]
+        }
+
+
+def run_shard(strategy_factory, num_games, seed, shard_idx):
+    """Play one shard of single-player games and return its statistics."""
+    strategy = strategy_factory()
+    game = Game(1, BufferedFaceSource(shard_seed(seed, shard_idx)))
+    stats = SimulationStats()
+    start = time.perf_counter()
+    for _ in range(num_games):
+        game.players.reset()
+        score = play_game(game, [strategy])[0]
+        stats.add_game(score, game.players.get_player_card(0))
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def shard_sizes(num_games, shard_size):
+    full, rest = divmod(num_games, shard_size)
+    return [shard_size] * full + ([rest] if rest else [])
+
+
+class ParallelResult:
+    """Merged statistics of a parallel run plus wall-clock throughput."""
+
+    def __init__(self, stats, wall_time, workers, num_shards):
+        self.stats = stats
+        self.wall_time = wall_time
+        self.workers = workers
+        self.num_shards = num_shards
+
+    @property
+    def games_per_second(self):
+        return self.stats.num_games / self.wall_time if self.wall_time > 0 else float('inf')
+
+    def to_dict(self):
+        result = self.stats.to_dict()
+        result.update({
+            'workers': self.workers,
+            'num_shards': self.num_shards,
+            'wall_time_s': self.wall_time,
+            'cpu_time_s': self.stats.elapsed,
+            'games_per_second': self.games_per_second
+        })
+        return result
+
+
+def run_parallel(num_games, strategy_factory, seed=0, workers=None,
+                 shard_size=DEFAULT_SHARD_SIZE, on_shard=None):
+    """Play ``num_games`` games across ``workers`` processes.
+
+    ``strategy_factory`` must be picklable (a top-level function or class, or a
+    ``functools.partial`` of one); it is called once per shard.  ``on_shard``
+    is called with the running merged stats after each shard completes.
+    """
+    workers = workers or os.cpu_count() or 1
+    sizes = shard_sizes(num_games, shard_size)
+    merged = SimulationStats()
+    start = time.perf_counter()
+
+    if workers == 1:
+        for shard_idx, size in enumerate(sizes):
+            merged.merge(run_shard(strategy_factory, size, seed, shard_idx))
+            if on_shard:
+                on_shard(merged)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_shard, strategy_factory, size, seed, shard_idx)
+                       for shard_idx, size in enumerate(sizes)]
+            for future in as_completed(futures):
+                merged.merge(future.result())
+                if on_shard:
+                    on_shard(merged)
+
+    return ParallelResult(merged, time.perf_counter() - start, workers, len(sizes))
+
+
+if __name__ == '__main__':
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    strategy_name = sys.argv[2] if len(sys.argv) > 2 else 'greedy'
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    seed = int(sys.argv[4]) if len(sys.argv) > 4 else 0
+    result = run_parallel(num_games, partial(make_strategy, strategy_name), seed, workers)
+    print(f"Strategy:     {strategy_name}")
+    print(f"Workers:      {result.workers} ({result.num_shards} shards)")
+    print(f"Games played: {result.stats.num_games}")
+    print(f"Mean score:   {result.stats.mean_score:.2f} ± {result.stats.score_std:.2f}")
+    print(f"Throughput:   {result.games_per_second:,.0f} games/sec")
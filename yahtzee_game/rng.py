@@ -0,0 +1,79 @@
+"""Seedable random sources for dice, including a buffered bulk roller.
+
+Anything with a ``randint(a, b)`` method can drive ``Dice``: the ``random``
+module itself, a ``random.Random`` instance, or ``BufferedFaceSource``.  The
+buffered source generates faces in large blocks and hands them out one pop at
+a time, which removes most of the per-roll cost of ``random.randint``.
+"""
+import random
+from itertools import chain
+
+DEFAULT_BLOCK_SIZE = 4096
+
+# Each random byte holds two 3-bit chunks (bits 0-2 and 3-5); chunk values
+# 0-5 become faces 1-6 and 6-7 are rejected, keeping the faces uniform.
+_BYTE_FACES = tuple(
+    tuple(chunk + 1 for chunk in (byte & 7, (byte >> 3) & 7) if chunk < 6)
+    for byte in range(256)
+)
+
+
+class BufferedFaceSource:
+    """``random.Random``-compatible source whose ``randint(1, 6)`` pops pre-rolled faces.
+
+    Faces come from ``getrandbits`` split into 3-bit chunks with rejection, or
+    from ``generator.integers`` when a NumPy ``Generator`` is given.  Any other
+    method or range is served by the underlying ``random.Random``.
+    """
+
+    def __init__(self, seed=None, block_size=DEFAULT_BLOCK_SIZE, generator=None):
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        self._random = random.Random(seed)
+        self._generator = generator
+        self.block_size = block_size
+        self._buffer = []
+        # Bound directly so the common calls skip __getattr__
+        self.random = self._random.random
+        self.choice = self._random.choice
+
+    def _refill(self):
+        if self._generator is not None:
+            self._buffer = self._generator.integers(1, 7, size=self.block_size).tolist()
+            return
+        # 1.5 accepted faces per byte on average; a small block can lose
+        # every chunk to rejection, so draw again until at least one face is left
+        num_bytes = (self.block_size * 2 + 2) // 3
+        while not self._buffer:
+            data = self._random.getrandbits(8 * num_bytes).to_bytes(num_bytes, 'little')
+            self._buffer = list(chain.from_iterable(map(_BYTE_FACES.__getitem__, data)))
+
+    def roll(self):
+        """Return one face value 1-6."""
+        if not self._buffer:
+            self._refill()
+        return self._buffer.pop()
+
+    def faces(self, count):
+        """Return a list of ``count`` face values."""
+        result = []
+        while len(result) < count:
+            if not self._buffer:
+                self._refill()
+            take = min(count - len(result), len(self._buffer))
+            result.extend(self._buffer[-take:])
+            del self._buffer[-take:]
+        return result
+
+    def randint(self, a, b):
+        if a == 1 and b == 6:
+            if not self._buffer:
+                self._refill()
+            return self._buffer.pop()
+        return self._random.randint(a, b)
+
+    def __getattr__(self, name):
+        # random(), choice(), shuffle() ... come from the wrapped generator
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._random, name)
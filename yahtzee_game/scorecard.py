@@ -1,21 +1,80 @@
+from array import array
+
+from instrumentation import counted, timed
+from scoring import (NUM_SLOTS, NUM_UPPER_SLOTS, OPEN_SLOTS, UPPER_BONUS,
+                     UPPER_BONUS_THRESHOLD)
+
+FULL_MASK = (1 << NUM_SLOTS) - 1
+
+
 class Scorecard:
+    # All cards live in one flat int16 array ([players, 13], row-major).
+    # Each player also has a 13-bit used-slot mask, so a scratched 0 is
+    # distinguishable from an open slot.  get_player_card() hands out the
+    # live row, so totals are summed from the row rather than cached: a write
+    # through the card shows up in total() and state() straight away.
+
     def __init__(self, num_players):
-        
+
         self.num_players = num_players
-        self.cards = [[0] * 13 for _ in range(num_players)]
-    
+        self.scores = array('h', bytes(2 * NUM_SLOTS * num_players))
+        view = memoryview(self.scores)
+        self.cards = [view[p * NUM_SLOTS:(p + 1) * NUM_SLOTS] for p in range(num_players)]
+        self.used_masks = [0] * num_players
+
+    @counted('scorecard.reset')
+    def reset(self):
+        """Clear every card in place so the storage can be reused for a new game."""
+        for p in range(self.num_players):
+            self.cards[p][:] = array('h', bytes(2 * NUM_SLOTS))
+        self.used_masks = [0] * self.num_players
+
     def get_score(self, player_idx, slot_idx):
         if 0 <= player_idx < self.num_players and 0 <= slot_idx < 13:
             return self.cards[player_idx][slot_idx]
         raise IndexError("Invalid player or slot index")
-    
+
+    @timed('scorecard.set_score')
     def set_score(self, player_idx, slot_idx, value):
         if 0 <= player_idx < self.num_players and 0 <= slot_idx < 13:
             self.cards[player_idx][slot_idx] = value
+            self.used_masks[player_idx] |= 1 << slot_idx
         else:
             raise IndexError("Invalid player or slot index")
-    
+
     def get_player_card(self, player_idx):
+        """The player's 13 slots as a live view; writes to it change the card."""
         if 0 <= player_idx < self.num_players:
             return self.cards[player_idx]
-        raise IndexError("Invalid player index")
\ No newline at end of file
+        raise IndexError("Invalid player index")
+
+    def is_used(self, player_idx, slot_idx):
+        return bool(self.used_masks[player_idx] & (1 << slot_idx))
+
+    def used_mask(self, player_idx):
+        return self.used_masks[player_idx]
+
+    def open_slots(self, player_idx):
+        return OPEN_SLOTS[self.used_masks[player_idx]]
+
+    def is_complete(self, player_idx):
+        return self.used_masks[player_idx] == FULL_MASK
+
+    def upper_subtotal(self, player_idx):
+        return sum(self.cards[player_idx][:NUM_UPPER_SLOTS])
+
+    def upper_bonus(self, player_idx):
+        return UPPER_BONUS if self.upper_subtotal(player_idx) >= UPPER_BONUS_THRESHOLD else 0
+
+    def slot_total(self, player_idx):
+        """Sum of all slots, without the upper bonus."""
+        return sum(self.cards[player_idx])
+
+    def total(self, player_idx):
+        """Sum of all slots plus the upper bonus."""
+        return self.slot_total(player_idx) + self.upper_bonus(player_idx)
+
+    def state(self, player_idx):
+        """The (used-slot mask, capped upper subtotal) key used by the solver and caches."""
+        return (self.used_masks[player_idx],
+                min(UPPER_BONUS_THRESHOLD, self.upper_subtotal(player_idx)))
@@ -0,0 +1,154 @@
+"""Scoring rules and the precomputed score table for every Yahtzee hand.
+
+A hand of five dice has only 252 distinct sorted forms, so every category
+score is computed once at import time and looked up afterwards.  Hands are
+keyed by ``hand_key``: the face counts packed 3 bits per face into a single
+int, which is independent of dice order and needs no sorting.
+"""
+from collections import Counter
+from itertools import combinations_with_replacement
+
+NUM_SLOTS = 13
+NUM_FACES = 6
+NUM_DICE = 5
+
+# Upper section (slots 0-5) bonus
+NUM_UPPER_SLOTS = 6
+UPPER_BONUS_THRESHOLD = 63
+UPPER_BONUS = 35
+
+# FACE_BITS[v] adds one to the 3-bit count field of face v
+FACE_BITS = (0, 1, 1 << 3, 1 << 6, 1 << 9, 1 << 12, 1 << 15)
+
+SMALL_STRAIGHTS = ({1, 2, 3, 4}, {2, 3, 4, 5}, {3, 4, 5, 6})
+LARGE_STRAIGHTS = ([1, 2, 3, 4, 5], [2, 3, 4, 5, 6])
+
+
+def hand_key(values):
+    """Return the order-independent key of a hand of face values."""
+    key = 0
+    for value in values:
+        key += FACE_BITS[value]
+    return key
+
+
+def is_small_straight(sorted_values):
+    faces = set(sorted_values)
+    for straight in SMALL_STRAIGHTS:
+        if straight <= faces:
+            return True
+    return False
+
+
+def is_large_straight(sorted_values):
+    return list(sorted_values) in LARGE_STRAIGHTS
+
+
+# OPEN_SLOTS[mask] lists the slots not set in a 13-bit used-slot mask
+OPEN_SLOTS = tuple(
+    tuple(slot for slot in range(NUM_SLOTS) if not mask & (1 << slot))
+    for mask in range(1 << NUM_SLOTS)
+)
+
+
+def open_slots(mask):
+    """Return the slot indices not set in a 13-bit used-slot mask."""
+    return OPEN_SLOTS[mask]
+
+
+def next_upper(upper, slot_idx, score):
+    """Return the capped upper subtotal after scoring ``score`` in ``slot_idx``."""
+    if slot_idx < NUM_UPPER_SLOTS:
+        return min(UPPER_BONUS_THRESHOLD, upper + score)
+    return upper
+
+
+def reroll_indices(dice_values, kept):
+    """Return the positions in ``dice_values`` that are not part of ``kept``."""
+    remaining = Counter(kept)
+    reroll = set()
+    for idx, value in enumerate(dice_values):
+        if remaining[value]:
+            remaining[value] -= 1
+        else:
+            reroll.add(idx)
+    return reroll
+
+
+def score_slot(values, slot_idx):
+    """Score ``values`` in ``slot_idx`` by evaluating the category rules directly.
+
+    This is the reference implementation the lookup table is built from.
+    """
+    sorted_values = sorted(values)
+    freq = [0] * NUM_FACES
+    for value in values:
+        freq[value - 1] += 1
+
+    # Slots 0-5: number
+    if slot_idx < 6:
+        return sum(v for v in values if v == slot_idx + 1)
+
+    # Slot 6: Three of a Kind
+    elif slot_idx == 6:
+        if any(f >= 3 for f in freq):
+            return sum(values)
+        return 0
+
+    # Slot 7: Four of a Kind
+    elif slot_idx == 7:
+        if any(f >= 4 for f in freq):
+            return sum(values)
+        return 0
+
+    # Slot 8: Full House
+    elif slot_idx == 8:
+        if sorted(freq).count(0) == 4 and (3 in freq and 2 in freq):
+            return 25
+        return 0
+
+    # Slot 9: Small Straight (4 consecutive numbers)
+    elif slot_idx == 9:
+        if is_small_straight(sorted_values):
+            return 30
+        return 0
+
+    # Slot 10: Large Straight (5 consecutive numbers)
+    elif slot_idx == 10:
+        if is_large_straight(sorted_values):
+            return 40
+        return 0
+
+    # Slot 11: Yahtzee (all 5 dice the same)
+    elif slot_idx == 11:
+        if max(freq) == 5:
+            return 50
+        return 0
+
+    # Slot 12: Chance (sum of all dice)
+    elif slot_idx == 12:
+        return sum(values)
+
+    return 0
+
+
+# All 252 sorted hands, in lexicographic order; a hand's position here is its index
+ALL_HANDS = tuple(combinations_with_replacement(range(1, NUM_FACES + 1), NUM_DICE))
+HAND_INDEX = {hand_key(hand): idx for idx, hand in enumerate(ALL_HANDS)}
+SCORE_TABLE = tuple(
+    tuple(score_slot(hand, slot_idx) for slot_idx in range(NUM_SLOTS))
+    for hand in ALL_HANDS
+)
+SCORES_BY_KEY = {hand_key(hand): SCORE_TABLE[idx] for idx, hand in enumerate(ALL_HANDS)}
+
+
+def hand_scores(values):
+    """Return the 13 category scores of a hand as a tuple."""
+    return SCORES_BY_KEY[hand_key(values)]
+
+
+def lookup_score(values, slot_idx):
+    """Score ``values`` in ``slot_idx`` with a single table lookup."""
+    if 0 <= slot_idx < NUM_SLOTS:
+        return SCORES_BY_KEY[hand_key(values)][slot_idx]
+    return 0
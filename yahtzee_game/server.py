@@ -0,0 +1,391 @@
+"""Asyncio tournament host that multiplexes many games in one event loop.
+
+Each connection owns one ``GameSession`` at a time and speaks a line
+protocol over TCP or a Unix socket.  Commands are case-insensitive:
+
+    NEW <seat> [<seat> ...] [SEED <n>]   seats: human, random, greedy, optimal, win
+    ROLL <die> [<die> ...]               reroll dice 1-5 (at most twice a turn)
+    SCORE <slot>                         score the current dice in slot 0-12
+    STATE                                current round, player, dice and totals
+    METRICS                              server metrics as one JSON object
+    QUIT
+
+Every reply is one line.  Bot seats play their turns on the server, which
+yields to the event loop between turns so one bot-only game never holds up
+the others:
+
+    OK <session id>
+    TURN <player> DICE <d1> .. <d5> ROLLS <n>   a human seat is to move
+    DICE <d1> .. <d5> ROLLS <n>                 after ROLL
+    SCORED <player> SLOT <slot> SCORE <points>  after SCORE or a bot turn
+    OVER <total 1> .. <total n>                 final totals, bonus included
+    STATE ROUND <r> PLAYER <p> ROLLS <n> DICE <d1> .. <d5> TOTALS <t1> ..
+    ERR <message>
+
+Players and rounds are 1-based, slots 0-12 as in ``Game.play``.  A line that
+is not valid UTF-8 gets ``ERR``; one longer than the reader's 64 KiB limit
+gets ``ERR`` and the connection is closed.
+"""
+import asyncio
+import itertools
+import json
+import sys
+import time
+
+from game import Game
+from rng import BufferedFaceSource
+from scoring import NUM_DICE, NUM_SLOTS
+from simulation import make_strategy, play_turn
+
+HUMAN = 'human'
+BOT_NAMES = ('random', 'greedy', 'optimal', 'win')
+ROLLS_PER_TURN = 3
+
+# Upper edges (seconds) of the turn latency histogram buckets
+LATENCY_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0, 10.0, 60.0)
+
+
+class ProtocolError(Exception):
+    """A client command that is malformed or not allowed in the current state."""
+
+
+class ServerMetrics:
+    """Counters for games in flight and a turn latency histogram.
+
+    A turn's latency runs from its first roll to the moment it is scored, so
+    for human seats it includes the client's thinking time.
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.games_in_flight = 0
+        self.games_started = 0
+        self.games_completed = 0
+        self.turns = 0
+        self.turn_time = 0.0
+        self.max_turn_time = 0.0
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def game_started(self):
+        self.games_started += 1
+        self.games_in_flight += 1
+
+    def game_finished(self, completed):
+        self.games_in_flight -= 1
+        if completed:
+            self.games_completed += 1
+
+    def record_turn(self, elapsed):
+        self.turns += 1
+        self.turn_time += elapsed
+        self.max_turn_time = max(self.max_turn_time, elapsed)
+        for bucket, edge in enumerate(LATENCY_BUCKETS):
+            if elapsed <= edge:
+                break
+        else:
+            bucket = len(LATENCY_BUCKETS)
+        self.latency_counts[bucket] += 1
+
+    @property
+    def mean_turn_time(self):
+        return self.turn_time / self.turns if self.turns else 0.0
+
+    def latency_quantile(self, q):
+        """Upper bucket edge below which a fraction ``q`` of turn latencies fall."""
+        if not self.turns:
+            return 0.0
+        target = q * self.turns
+        seen = 0
+        for bucket, count in enumerate(self.latency_counts):
+            seen += count
+            if seen >= target:
+                break
+        if bucket < len(LATENCY_BUCKETS):
+            return LATENCY_BUCKETS[bucket]
+        return self.max_turn_time
+
+    def to_dict(self):
+        return {
+            'connections': self.connections,
+            'games_in_flight': self.games_in_flight,
+            'games_started': self.games_started,
+            'games_completed': self.games_completed,
+            'turns': self.turns,
+            'mean_turn_latency_s': self.mean_turn_time,
+            'p50_turn_latency_s': self.latency_quantile(0.5),
+            'p99_turn_latency_s': self.latency_quantile(0.99),
+            'max_turn_latency_s': self.max_turn_time,
+            'turn_latency_histogram': {
+                **{f"<={edge}": count for edge, count in zip(LATENCY_BUCKETS, self.latency_counts)},
+                f">{LATENCY_BUCKETS[-1]}": self.latency_counts[-1]
+            }
+        }
+
+
+class GameSession:
+    """Turn state of one game: whose move it is, rolls left and the dice.
+
+    ``seats`` holds ``None`` for a human seat and a ``Strategy`` for a bot.
+    The session never blocks; the server decides when bot turns run.
+    """
+
+    def __init__(self, session_id, seats, rng=None):
+        if not seats:
+            raise ProtocolError("A game needs at least one seat")
+        self.session_id = session_id
+        self.seats = seats
+        self.game = Game(len(seats), rng)
+        self.round = 0
+        self.player_idx = 0
+        self.rolls_left = 0
+        self.turn_started = None
+        self.over = False
+
+    @property
+    def scorecard(self):
+        return self.game.players
+
+    @property
+    def human_to_move(self):
+        return not self.over and self.seats[self.player_idx] is None
+
+    def start_turn(self):
+        """Roll the dice for the player to move."""
+        self.turn_started = time.perf_counter()
+        self.game.roll_dice()
+        self.rolls_left = ROLLS_PER_TURN - 1
+
+    def reroll(self, positions):
+        """Reroll the given 0-based dice positions for a human seat."""
+        if not self.human_to_move:
+            raise ProtocolError("Not a human turn")
+        if self.rolls_left == 0:
+            raise ProtocolError("No rolls left this turn")
+        if not positions or not all(0 <= idx < NUM_DICE for idx in positions):
+            raise ProtocolError("Dice numbers must be 1-5")
+        self.game.reroll_dice(set(positions))
+        self.rolls_left -= 1
+
+    def score(self, slot_idx):
+        """Score the human seat's dice in ``slot_idx`` and return the points."""
+        if not self.human_to_move:
+            raise ProtocolError("Not a human turn")
+        if not 0 <= slot_idx < NUM_SLOTS:
+            raise ProtocolError("Slot must be 0-12")
+        if self.scorecard.is_used(self.player_idx, slot_idx):
+            raise ProtocolError(f"Slot {slot_idx} already used")
+        points = self.game.calculate_score(slot_idx)
+        self.scorecard.set_score(self.player_idx, slot_idx, points)
+        return points
+
+    def play_bot_turn(self):
+        """Play the bot seat's whole turn and return ``(slot_idx, points)``."""
+        self.turn_started = time.perf_counter()
+        return play_turn(self.game, self.seats[self.player_idx], self.player_idx)
+
+    def end_turn(self):
+        """Advance to the next player and return the finished turn's latency."""
+        elapsed = time.perf_counter() - self.turn_started
+        self.rolls_left = 0
+        self.player_idx += 1
+        if self.player_idx == len(self.seats):
+            self.player_idx = 0
+            self.round += 1
+            if self.round == NUM_SLOTS:
+                self.over = True
+        return elapsed
+
+    def totals(self):
+        return [self.scorecard.total(p) for p in range(len(self.seats))]
+
+    def dice_text(self):
+        return ' '.join(map(str, self.game.hand.values()))
+
+    def dice_line(self):
+        return f"DICE {self.dice_text()} ROLLS {self.rolls_left}"
+
+    def state_line(self):
+        totals = ' '.join(map(str, self.totals()))
+        return (f"STATE ROUND {self.round + 1} PLAYER {self.player_idx + 1} "
+                f"ROLLS {self.rolls_left} DICE {self.dice_text()} TOTALS {totals}")
+
+
+class TournamentServer:
+    """Serve ``GameSession``s to line-protocol clients from a single event loop.
+
+    ``bots`` names the strategies clients may seat; one instance of each is
+    shared by every session, which is safe because a bot turn runs to
+    completion without awaiting.  ``optimal`` and ``win`` load (or solve) their
+    tables in ``start()``, before any client connects.
+    """
+
+    def __init__(self, bots=('random', 'greedy'), seed=None):
+        unknown = set(bots) - set(BOT_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown bot strategies: {sorted(unknown)}")
+        self.bot_names = tuple(bots)
+        self.strategies = {}
+        self.seed = seed
+        self.metrics = ServerMetrics()
+        self._session_ids = itertools.count(1)
+        self._server = None
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """Listen on ``path`` (Unix socket) if given, else on ``host:port``."""
+        for name in self.bot_names:
+            if name not in self.strategies:
+                self.strategies[name] = make_strategy(name)
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self.handle_client, path)
+        else:
+            self._server = await asyncio.start_server(self.handle_client, host, port)
+        return self._server
+
+    @property
+    def address(self):
+        """The bound ``(host, port)`` or socket path."""
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def new_session(self, args):
+        """Create a session from ``NEW`` arguments: seat names, optionally ``SEED <n>``."""
+        seed = None
+        if len(args) >= 2 and args[-2] == 'seed':
+            try:
+                seed = int(args[-1])
+            except ValueError:
+                raise ProtocolError("SEED must be an integer") from None
+            args = args[:-2]
+        seats = []
+        for name in args:
+            if name == HUMAN:
+                seats.append(None)
+            elif name in self.strategies:
+                seats.append(self.strategies[name])
+            else:
+                raise ProtocolError(f"Unknown seat: {name}")
+        session_id = next(self._session_ids)
+        if seed is None and self.seed is not None:
+            seed = f"{self.seed}:{session_id}"
+        rng = BufferedFaceSource(seed) if seed is not None else None
+        return GameSession(session_id, seats, rng)
+
+    async def advance(self, session, send):
+        """Run bot turns until a human is to move or the game ends."""
+        while not session.over and not session.human_to_move:
+            player = session.player_idx + 1
+            slot_idx, points = session.play_bot_turn()
+            self.metrics.record_turn(session.end_turn())
+            await send(f"SCORED {player} SLOT {slot_idx} SCORE {points}")
+            # Let other sessions run between bot turns
+            await asyncio.sleep(0)
+        if session.over:
+            self.metrics.game_finished(completed=True)
+            await send("OVER " + ' '.join(map(str, session.totals())))
+        else:
+            session.start_turn()
+            await send(f"TURN {session.player_idx + 1} {session.dice_line()}")
+
+    async def handle_client(self, reader, writer):
+        self.metrics.connections += 1
+        session = None
+
+        async def send(line):
+            writer.write(line.encode() + b'\n')
+            await writer.drain()
+
+        try:
+            while True:
+                try:
+                    raw = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # The line overran the reader's buffer limit; give up on this client
+                    await send("ERR Line too long")
+                    break
+                if not raw:
+                    break
+                try:
+                    words = raw.decode().lower().split()
+                except UnicodeDecodeError:
+                    await send("ERR Invalid UTF-8")
+                    continue
+                if not words:
+                    continue
+                command, args = words[0], words[1:]
+                if command == 'quit':
+                    await send("BYE")
+                    break
+                try:
+                    if command == 'new':
+                        if session is not None and not session.over:
+                            raise ProtocolError("Finish the current game first")
+                        session = self.new_session(args)
+                        self.metrics.game_started()
+                        await send(f"OK {session.session_id}")
+                        await self.advance(session, send)
+                    elif command == 'metrics':
+                        await send("METRICS " + json.dumps(self.metrics.to_dict()))
+                    elif session is None or session.over:
+                        raise ProtocolError("No game in progress")
+                    elif command == 'roll':
+                        session.reroll([_parse_int(arg) - 1 for arg in args])
+                        await send(session.dice_line())
+                    elif command == 'score':
+                        if len(args) != 1:
+                            raise ProtocolError("Usage: SCORE <slot>")
+                        slot_idx = _parse_int(args[0])
+                        player = session.player_idx + 1
+                        points = session.score(slot_idx)
+                        self.metrics.record_turn(session.end_turn())
+                        await send(f"SCORED {player} SLOT {slot_idx} SCORE {points}")
+                        await self.advance(session, send)
+                    elif command == 'state':
+                        await send(session.state_line())
+                    else:
+                        raise ProtocolError(f"Unknown command: {command}")
+                except ProtocolError as e:
+                    await send(f"ERR {e}")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if session is not None and not session.over:
+                self.metrics.game_finished(completed=False)
+            self.metrics.connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                # The client reset the connection; the transport is closed anyway
+                pass
+
+
+def _parse_int(text):
+    try:
+        return int(text)
+    except ValueError:
+        raise ProtocolError(f"Not a number: {text}") from None
+
+
+async def main(argv):
+    server = TournamentServer(bots=argv[1].split(',') if len(argv) > 1 else ('random', 'greedy'))
+    target = argv[0] if argv else '8765'
+    if target.isdigit():
+        await server.start(port=int(target))
+    else:
+        await server.start(path=target)
+    print(f"Tournament server listening on {server.address}")
+    await server.serve_forever()
+
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(main(sys.argv[1:]))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,192 @@
+"""Headless simulation engine that plays complete games with bot strategies.
+
+``play_game`` drives a ``Game`` through all 13 rounds without ``input()`` or
+``print()``: the prompt methods are replaced by strategy callbacks and the
+display methods are never called.  A strategy subclasses ``Strategy`` and
+overrides
+
+    choose_reroll(dice_values, rolls_left, mask, upper) -> set of dice positions
+    choose_slot(dice_values, mask, upper) -> slot index
+
+where ``mask`` is the player's 13-bit used-slot mask and ``upper`` their upper
+section subtotal (capped at 63).  ``begin_turn(game, player_idx)`` is called
+before each turn for strategies that need to look at the whole game.
+"""
+import random
+import sys
+import time
+
+from decision_cache import DEFAULT_MAXSIZE, DecisionCache
+from game import Game
+from rng import BufferedFaceSource
+from scoring import NUM_DICE, NUM_SLOTS, hand_scores, open_slots
+
+
+class Strategy:
+    """Base strategy: keep every roll and take the first open slot."""
+
+    def begin_turn(self, game, player_idx):
+        pass
+
+    def choose_reroll(self, dice_values, rolls_left, mask, upper):
+        return set()
+
+    def choose_slot(self, dice_values, mask, upper):
+        return open_slots(mask)[0]
+
+
+class RandomStrategy(Strategy):
+    """Reroll a random subset of dice and score in a random open slot.
+
+    Without an explicit ``rng`` the strategy draws from the game's generator,
+    so a seeded game is reproducible end to end.
+    """
+
+    def __init__(self, rng=None):
+        self._own_rng = rng
+        self.rng = rng if rng is not None else random
+
+    def begin_turn(self, game, player_idx):
+        if self._own_rng is None:
+            self.rng = game.rng
+
+    def choose_reroll(self, dice_values, rolls_left, mask, upper):
+        return {idx for idx in range(NUM_DICE) if self.rng.random() < 0.5}
+
+    def choose_slot(self, dice_values, mask, upper):
+        return self.rng.choice(open_slots(mask))
+
+
+class GreedyStrategy(Strategy):
+    """Never reroll and take the open slot with the highest immediate score."""
+
+    def choose_slot(self, dice_values, mask, upper):
+        scores = hand_scores(dice_values)
+        return max(open_slots(mask), key=scores.__getitem__)
+
+
+class OptimalStrategy(Strategy):
+    """Play the expected-score-optimal action from a solved ``StrategyTable``.
+
+    Keep decisions go through an LRU ``DecisionCache`` of ``cache_size``
+    positions; pass ``cache_size=None`` to query the table every time.
+    """
+
+    def __init__(self, table, cache_size=DEFAULT_MAXSIZE):
+        self.table = table
+        self.cache = DecisionCache(table.choose_keep, cache_size) if cache_size else None
+
+    def choose_reroll(self, dice_values, rolls_left, mask, upper):
+        if self.cache is not None:
+            return self.cache.choose_reroll(dice_values, rolls_left, mask, upper)
+        return self.table.choose_reroll(dice_values, rolls_left, mask, upper)
+
+    def choose_slot(self, dice_values, mask, upper):
+        return self.table.choose_slot(dice_values, mask, upper)
+
+
+def play_turn(game, strategy, player_idx):
+    """Play one turn for ``player_idx``: roll, up to two rerolls, then score.
+
+    Returns ``(slot_idx, score)``.
+    """
+    scorecard = game.players
+    mask, upper = scorecard.state(player_idx)
+    strategy.begin_turn(game, player_idx)
+    game.roll_dice()
+    for rolls_left in (2, 1):
+        reroll = strategy.choose_reroll(game.hand.values(), rolls_left, mask, upper)
+        if not reroll:
+            break
+        game.reroll_dice(reroll)
+    slot_idx = strategy.choose_slot(game.hand.values(), mask, upper)
+    if mask & (1 << slot_idx):
+        raise ValueError(f"Slot {slot_idx} already used by player {player_idx + 1}")
+    score = game.calculate_score(slot_idx)
+    scorecard.set_score(player_idx, slot_idx, score)
+    return slot_idx, score
+
+
+def play_game(game, strategies):
+    """Play all 13 rounds of ``game`` with one strategy per player.
+
+    Returns the final score of each player, including the upper bonus.
+    """
+    scorecard = game.players
+    num_players = scorecard.num_players
+    if len(strategies) != num_players:
+        raise ValueError("Need exactly one strategy per player")
+
+    for _ in range(NUM_SLOTS):
+        for player_idx, strategy in enumerate(strategies):
+            play_turn(game, strategy, player_idx)
+
+    return [scorecard.total(p) for p in range(num_players)]
+
+
+class SimulationResult:
+    """Final scores of a batch of games plus wall-clock throughput."""
+
+    def __init__(self, scores, elapsed):
+        self.scores = scores
+        self.elapsed = elapsed
+
+    @property
+    def num_games(self):
+        return len(self.scores)
+
+    @property
+    def games_per_second(self):
+        return self.num_games / self.elapsed if self.elapsed > 0 else float('inf')
+
+    @property
+    def mean_score(self):
+        return sum(self.scores) / len(self.scores) if self.scores else 0.0
+
+    def to_dict(self):
+        return {
+            'num_games': self.num_games,
+            'elapsed_s': self.elapsed,
+            'games_per_second': self.games_per_second,
+            'mean_score': self.mean_score
+        }
+
+
+def run_simulation(num_games, strategy, seed=None):
+    """Play ``num_games`` single-player games with ``strategy``.
+
+    A ``seed`` gives the game its own buffered generator, making the run
+    reproducible without touching the global ``random`` state.
+    """
+    rng = BufferedFaceSource(seed) if seed is not None else None
+    game = Game(1, rng)
+    scores = []
+    start = time.perf_counter()
+    for _ in range(num_games):
+        game.players.reset()
+        scores.append(play_game(game, [strategy])[0])
+    return SimulationResult(scores, time.perf_counter() - start)
+
+
+def make_strategy(name):
+    if name == 'random':
+        return RandomStrategy()
+    if name == 'greedy':
+        return GreedyStrategy()
+    if name == 'optimal':
+        from solver import StrategyTable
+        return OptimalStrategy(StrategyTable.load_or_solve(progress=True))
+    if name == 'win':
+        from win_probability import make_win_strategy
+        return make_win_strategy(progress=True)
+    raise ValueError(f"Unknown strategy: {name}")
+
+
+if __name__ == '__main__':
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    strategy_name = sys.argv[2] if len(sys.argv) > 2 else 'greedy'
+    result = run_simulation(num_games, make_strategy(strategy_name))
+    print(f"Strategy:     {strategy_name}")
+    print(f"Games played: {result.num_games}")
+    print(f"Mean score:   {result.mean_score:.2f}")
+    print(f"Throughput:   {result.games_per_second:,.0f} games/sec")
@@ -0,0 +1,217 @@
+"""Optimal single-player strategy solved by dynamic programming.
+
+A game state between turns is the 13-bit mask of used slots plus the upper
+section subtotal capped at 63, i.e. 2^13 x 64 states.  ``solve`` computes the
+expected final score still to come from every state, working backwards from
+the full card.  Each turn is evaluated exactly: the 252 final hands are scored
+against every open slot, then two rounds of "best keep, then reroll" are
+folded in with the keep -> hand transition matrix from ``transitions``.
+
+This tree's rules award the 35 point upper bonus at 63 but have no Yahtzee
+bonus or joker rule, so no bonus flag is needed in the state.
+
+The solved table (8192 x 64 float32) is saved in the ``table_file`` format and
+memory-mapped on load, so bot processes start instantly, share one copy of the
+table and only pay for the per-turn arithmetic when they ask for an action.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from scoring import (HAND_INDEX, NUM_SLOTS, NUM_UPPER_SLOTS, SCORE_TABLE, UPPER_BONUS,
+                     UPPER_BONUS_THRESHOLD, hand_key, next_upper, open_slots, reroll_indices)
+from table_file import open_table, write_table
+from transitions import (EMPTY_KEEP, HAND_KEEPS, KEEPS, NUM_HANDS, SCORES, TRANSITIONS,
+                         keep_expectations)
+
+NUM_MASKS = 1 << NUM_SLOTS
+FULL_MASK = NUM_MASKS - 1
+NUM_UPPER_STATES = UPPER_BONUS_THRESHOLD + 1
+
+DEFAULT_TABLE_PATH = Path(__file__).parent / 'data' / 'strategy_table.bin'
+# Recorded in saved tables so a table solved under other rules is rejected
+RULES_VARIANT = 'upper35@63;no-yahtzee-bonus'
+
+UPPER_STATES = np.arange(NUM_UPPER_STATES)
+HAND_ROWS = np.arange(NUM_HANDS)
+
+
+def _final_hand_values(values, mask, uppers):
+    """Best "score now + value of the next state" for every hand and upper subtotal."""
+    best = np.full((NUM_HANDS, len(uppers)), -np.inf)
+    for slot in open_slots(mask):
+        next_values = values[mask | (1 << slot)]
+        scores = SCORES[:, slot]
+        if slot < NUM_UPPER_SLOTS:
+            next_idx = np.minimum(UPPER_BONUS_THRESHOLD,
+                                  uppers[None, :] + scores[:, None].astype(np.intp))
+            candidate = scores[:, None] + next_values[next_idx]
+        else:
+            candidate = scores[:, None] + next_values[uppers][None, :]
+        np.maximum(best, candidate, out=best)
+    return best
+
+
+def _slot_values_at(values, mask, upper):
+    """Open slots and the [252, open slots] array of "score now + next state value"."""
+    slots = np.array(open_slots(mask))
+    scores = SCORES[:, slots]
+    next_masks = mask | (1 << slots)
+    next_uppers = np.where(slots < NUM_UPPER_SLOTS,
+                           np.minimum(UPPER_BONUS_THRESHOLD, upper + scores.astype(np.intp)),
+                           upper)
+    return slots, scores + values[next_masks, next_uppers]
+
+
+def _final_hand_values_at(values, mask, upper):
+    """``_final_hand_values`` for a single upper subtotal, as one gather."""
+    return _slot_values_at(values, mask, upper)[1].max(axis=1)
+
+
+def _best_keeps(hand_values):
+    """Return (best keep index, its expected value) for every hand before one reroll."""
+    expected = TRANSITIONS @ hand_values
+    choice = expected[HAND_KEEPS].argmax(axis=1)
+    keeps = HAND_KEEPS[HAND_ROWS, choice]
+    return keeps, expected[keeps]
+
+
+def _best_keep_values(hand_values):
+    """Fold one reroll into per-hand values: max over keeps of the expected outcome."""
+    expected = TRANSITIONS @ hand_values
+    return expected[HAND_KEEPS].max(axis=1)
+
+
+def _solve_mask(values, mask):
+    final = _final_hand_values(values, mask, UPPER_STATES)
+    one_roll_left = _best_keep_values(final)
+    two_rolls_left = _best_keep_values(one_roll_left)
+    return TRANSITIONS[EMPTY_KEEP] @ two_rolls_left
+
+
+def terminal_values():
+    return np.where(UPPER_STATES >= UPPER_BONUS_THRESHOLD, float(UPPER_BONUS), 0.0)
+
+
+def solve(base_mask=0, progress=False):
+    """Solve every state whose used-slot mask contains ``base_mask``.
+
+    Returns a float32 array of shape [8192, 64]; entry [mask, upper] is the
+    optimal expected score still to come.  Rows for masks that do not contain
+    ``base_mask`` are left at zero.
+    """
+    values = np.zeros((NUM_MASKS, NUM_UPPER_STATES))
+    values[FULL_MASK] = terminal_values()
+    masks = [mask for mask in range(FULL_MASK - 1, -1, -1) if mask & base_mask == base_mask]
+    start = time.perf_counter()
+    for count, mask in enumerate(masks, 1):
+        values[mask] = _solve_mask(values, mask)
+        if progress and count % 512 == 0:
+            elapsed = time.perf_counter() - start
+            print(f"  solved {count}/{len(masks)} masks ({elapsed:.1f}s)")
+    return values.astype(np.float32)
+
+
+class StrategyTable:
+    """Query the optimal action for a position from a solved state-value table."""
+
+    def __init__(self, values):
+        if values.shape != (NUM_MASKS, NUM_UPPER_STATES):
+            raise ValueError(f"Expected a {NUM_MASKS}x{NUM_UPPER_STATES} table, got {values.shape}")
+        self.values = values
+
+    @classmethod
+    def solve(cls, base_mask=0, progress=False):
+        return cls(solve(base_mask, progress))
+
+    @classmethod
+    def load(cls, path=DEFAULT_TABLE_PATH, verify=True):
+        """Memory-map a saved table; worker processes share it through the page cache."""
+        return cls(open_table(path, RULES_VARIANT, (NUM_MASKS, NUM_UPPER_STATES), verify))
+
+    @classmethod
+    def load_or_solve(cls, path=DEFAULT_TABLE_PATH, progress=False):
+        """Load the table at ``path``, solving and saving it if missing or invalid."""
+        path = Path(path)
+        if path.exists():
+            try:
+                return cls.load(path)
+            except ValueError as e:
+                if progress:
+                    print(f"Ignoring saved table: {e}")
+        table = cls.solve(progress=progress)
+        table.save(path)
+        return table
+
+    def save(self, path=DEFAULT_TABLE_PATH):
+        write_table(path, self.values, RULES_VARIANT)
+
+    def expected_score(self, mask=0, upper=0):
+        """Optimal expected score still to come from a state between turns."""
+        return float(self.values[mask, upper])
+
+    def choose_slot(self, dice_values, mask, upper):
+        """Return the open slot that maximises score now plus expected future score."""
+        scores = SCORE_TABLE[HAND_INDEX[hand_key(dice_values)]]
+        values = self.values
+        best_slot, best_value = None, -1.0
+        for slot in open_slots(mask):
+            score = scores[slot]
+            value = score + values[mask | (1 << slot), next_upper(upper, slot, score)]
+            if value > best_value:
+                best_slot, best_value = slot, value
+        if best_slot is None:
+            raise ValueError("No open slots left")
+        return best_slot
+
+    def turn_policy(self, mask, upper):
+        """The optimal action for every sorted hand during one turn from a state.
+
+        Returns three [252] arrays indexed like ``ALL_HANDS``: the keep (a
+        ``KEEPS`` index) with two rolls left, the keep with one roll left, and
+        the slot to score a final hand in.
+        """
+        if mask == FULL_MASK:
+            raise ValueError("No open slots left")
+        slots, totals = _slot_values_at(self.values, mask, upper)
+        best_slots = slots[totals.argmax(axis=1)]
+        keeps_one_left, one_left_values = _best_keeps(totals.max(axis=1))
+        keeps_two_left, _ = _best_keeps(one_left_values)
+        return keeps_two_left, keeps_one_left, best_slots
+
+    def _keep_expectations(self, dice_values, rolls_left, mask, upper):
+        if rolls_left not in (1, 2):
+            raise ValueError("rolls_left must be 1 or 2")
+        hand_values = _final_hand_values_at(self.values, mask, upper)
+        if rolls_left == 2:
+            hand_values = _best_keep_values(hand_values)
+        return keep_expectations(dice_values, hand_values)
+
+    def keep_values(self, dice_values, rolls_left, mask, upper):
+        """Return {kept values: expected value} for every keep of the current hand."""
+        keeps, expected = self._keep_expectations(dice_values, rolls_left, mask, upper)
+        return {KEEPS[k]: float(value) for k, value in zip(keeps, expected)}
+
+    def choose_keep(self, dice_values, rolls_left, mask, upper):
+        """Return (kept values, expected value) of the best keep for the current hand."""
+        keeps, expected = self._keep_expectations(dice_values, rolls_left, mask, upper)
+        best = int(np.argmax(expected))
+        return KEEPS[keeps[best]], float(expected[best])
+
+    def choose_reroll(self, dice_values, rolls_left, mask, upper):
+        """Return the set of dice positions to reroll under the best keep."""
+        kept, _ = self.choose_keep(dice_values, rolls_left, mask, upper)
+        return reroll_indices(dice_values, kept)
+
+
+if __name__ == '__main__':
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TABLE_PATH
+    print(f"Solving {NUM_MASKS} x {NUM_UPPER_STATES} states...")
+    start = time.perf_counter()
+    table = StrategyTable.solve(progress=True)
+    table.save(path)
+    print(f"Solved in {time.perf_counter() - start:.1f}s")
+    print(f"Optimal expected score: {table.expected_score():.4f}")
+    print(f"Table saved to: {path}")
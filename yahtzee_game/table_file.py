@@ -0,0 +1,99 @@
+"""Binary file format for solver tables, read through ``np.memmap``.
+
+A table file is a 64-byte little-endian header followed by the table as a
+flat C-order float32 array:
+
+    offset  size  field
+         0     8  magic b'YZTABLE\\0'
+         8     2  format version
+        10     2  number of dimensions (1-4)
+        12     4  CRC-32 of the data bytes
+        16    32  rules variant, ASCII, NUL padded
+        48    16  dimensions, four uint32 (unused ones are 0)
+
+``open_table`` maps the data read-only, so every process that opens the same
+file shares one copy through the page cache and startup costs one header
+read.  The checksum pass touches every page once; pass ``verify=False`` to
+skip it when the file is trusted.
+"""
+import struct
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b'YZTABLE\0'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<8sHHI32s4I')
+HEADER_SIZE = HEADER.size
+DTYPE = np.dtype('<f4')
+MAX_DIMS = 4
+
+
+class TableHeader:
+    """Decoded header of a table file."""
+
+    def __init__(self, version, shape, checksum, rules):
+        self.version = version
+        self.shape = shape
+        self.checksum = checksum
+        self.rules = rules
+
+    @classmethod
+    def read(cls, path):
+        with open(path, 'rb') as f:
+            raw = f.read(HEADER_SIZE)
+        if len(raw) < HEADER_SIZE:
+            raise ValueError(f"{path} is too short to be a table file")
+        magic, version, ndim, checksum, rules, *dims = HEADER.unpack(raw)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a table file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported table format version {version}")
+        if not 1 <= ndim <= MAX_DIMS:
+            raise ValueError(f"Invalid table rank {ndim}")
+        return cls(version, tuple(dims[:ndim]), checksum, rules.rstrip(b'\0').decode('ascii'))
+
+    def pack(self):
+        dims = list(self.shape) + [0] * (MAX_DIMS - len(self.shape))
+        return HEADER.pack(MAGIC, self.version, len(self.shape), self.checksum,
+                           self.rules.encode('ascii'), *dims)
+
+
+def write_table(path, values, rules):
+    """Write ``values`` as float32 with a header recording ``rules`` and a checksum."""
+    data = np.asarray(values, dtype=DTYPE)
+    if not 1 <= data.ndim <= MAX_DIMS:
+        raise ValueError(f"Tables must have 1-{MAX_DIMS} dimensions")
+    if len(rules.encode('ascii')) > 32:
+        raise ValueError("Rules variant must fit in 32 ASCII characters")
+    payload = np.ascontiguousarray(data).tobytes()
+    header = TableHeader(FORMAT_VERSION, data.shape, zlib.crc32(payload), rules)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write beside the target and rename, so readers never map a partial file
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header.pack())
+        f.write(payload)
+    tmp_path.replace(path)
+
+
+def open_table(path, rules=None, shape=None, verify=True):
+    """Memory-map a table file read-only and return it as a float32 array.
+
+    Raises ``ValueError`` if the header is invalid, the rules variant or shape
+    differ from the expected ones, or (with ``verify``) the checksum fails.
+    """
+    header = TableHeader.read(path)
+    if rules is not None and header.rules != rules:
+        raise ValueError(f"Table was solved for rules '{header.rules}', expected '{rules}'")
+    if shape is not None and header.shape != tuple(shape):
+        raise ValueError(f"Expected a table of shape {tuple(shape)}, got {header.shape}")
+    expected_size = HEADER_SIZE + DTYPE.itemsize * int(np.prod(header.shape))
+    if Path(path).stat().st_size != expected_size:
+        raise ValueError(f"{path} is truncated or has trailing data")
+    values = np.memmap(path, dtype=DTYPE, mode='r', offset=HEADER_SIZE, shape=header.shape)
+    if verify and zlib.crc32(values) != header.checksum:
+        raise ValueError(f"Checksum mismatch in {path}")
+    return values
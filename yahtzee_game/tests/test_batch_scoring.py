@@ -0,0 +1,64 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from batch_scoring import face_counts, score_batch
+from scoring import ALL_HANDS, SCORE_TABLE, lookup_score
+
+
+class TestBatchScoring(unittest.TestCase):
+    """Test suite for the vectorized batch scorer."""
+
+    def test_score_batch_shape(self):
+        """Test that score_batch() returns one row of 13 scores per hand."""
+        scores = score_batch([[1, 2, 3, 4, 5], [6, 6, 6, 6, 6]])
+        self.assertEqual(scores.shape, (2, 13))
+
+    def test_score_batch_matches_table_for_all_hands(self):
+        """Test score_batch() against the scoring table for all 252 sorted hands."""
+        scores = score_batch(np.array(ALL_HANDS))
+        np.testing.assert_array_equal(scores, np.array(SCORE_TABLE))
+
+    def test_score_batch_unsorted_random_hands(self):
+        """Test score_batch() on random unsorted hands against lookup_score()."""
+        rng = np.random.default_rng(7)
+        hands = rng.integers(1, 7, size=(2000, 5))
+        scores = score_batch(hands)
+        for hand, row in zip(hands.tolist(), scores.tolist()):
+            self.assertEqual(row, [lookup_score(hand, slot) for slot in range(13)])
+
+    def test_score_batch_chunking(self):
+        """Test that small chunk sizes give the same result as one chunk."""
+        rng = np.random.default_rng(11)
+        hands = rng.integers(1, 7, size=(1001, 5))
+        np.testing.assert_array_equal(score_batch(hands, chunk_size=64), score_batch(hands))
+
+    def test_score_batch_empty(self):
+        """Test that an empty batch returns an empty [0, 13] array."""
+        scores = score_batch(np.empty((0, 5), dtype=int))
+        self.assertEqual(scores.shape, (0, 13))
+
+    def test_score_batch_invalid_shape(self):
+        """Test that score_batch() rejects arrays that are not [N, 5]."""
+        with self.assertRaises(ValueError):
+            score_batch([[1, 2, 3, 4]])
+
+    def test_score_batch_invalid_face_value(self):
+        """Test that score_batch() rejects face values outside 1-6."""
+        with self.assertRaises(ValueError) as context:
+            score_batch([[1, 2, 3, 4, 7]])
+        self.assertIn("Face value must be between 1 and 6", str(context.exception))
+
+    def test_face_counts(self):
+        """Test that face_counts() counts each face per hand."""
+        counts = face_counts(np.array([[1, 1, 3, 3, 3], [6, 5, 4, 3, 2]]))
+        np.testing.assert_array_equal(counts, [[2, 0, 3, 0, 0, 0], [0, 1, 1, 1, 1, 1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
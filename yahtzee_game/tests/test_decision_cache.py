@@ -0,0 +1,102 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from decision_cache import DecisionCache
+from game import Game
+from simulation import OptimalStrategy, play_game
+
+
+class CountingKeeper:
+    """Stand-in for StrategyTable.choose_keep: keep the sixes, count the calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def choose_keep(self, dice_values, rolls_left, mask, upper):
+        self.calls += 1
+        kept = tuple(value for value in sorted(dice_values) if value == 6)
+        return kept, float(len(kept))
+
+    def choose_slot(self, dice_values, mask, upper):
+        return min(slot for slot in range(13) if not mask & (1 << slot))
+
+
+class TestDecisionCache(unittest.TestCase):
+    """Test suite for the keep/reroll decision cache."""
+
+    def setUp(self):
+        """Set up a cache over the counting stand-in."""
+        self.keeper = CountingKeeper()
+        self.cache = DecisionCache(self.keeper.choose_keep, maxsize=3)
+
+    def test_miss_then_hit(self):
+        """Test that a repeated position is answered from memory."""
+        first = self.cache.choose_keep([6, 1, 6, 2, 3], 2, 0, 0)
+        second = self.cache.choose_keep([6, 1, 6, 2, 3], 2, 0, 0)
+        self.assertEqual(first, ((6, 6), 2.0))
+        self.assertEqual(second, first)
+        self.assertEqual(self.keeper.calls, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+    def test_permutations_share_an_entry(self):
+        """Test that dice order does not change the cache key."""
+        self.cache.choose_keep([6, 1, 6, 2, 3], 1, 5, 10)
+        self.cache.choose_keep([3, 2, 1, 6, 6], 1, 5, 10)
+        self.assertEqual(len(self.cache), 1)
+        self.assertIn(([1, 2, 3, 6, 6], 1, 5, 10), self.cache)
+
+    def test_key_includes_state(self):
+        """Test that rolls left, mask and upper subtotal are separate entries."""
+        dice = [1, 2, 3, 4, 6]
+        self.cache.choose_keep(dice, 1, 0, 0)
+        self.cache.choose_keep(dice, 2, 0, 0)
+        self.cache.choose_keep(dice, 1, 1, 0)
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used position is evicted first."""
+        hands = [[1, 1, 1, 1, v] for v in range(2, 6)]
+        for dice in hands[:3]:
+            self.cache.choose_keep(dice, 1, 0, 0)
+        self.cache.choose_keep(hands[0], 1, 0, 0)
+        self.cache.choose_keep(hands[3], 1, 0, 0)
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertIn((hands[0], 1, 0, 0), self.cache)
+        self.assertNotIn((hands[1], 1, 0, 0), self.cache)
+
+    def test_choose_reroll_follows_dice_order(self):
+        """Test that reroll positions come from the actual dice order."""
+        self.assertEqual(self.cache.choose_reroll([6, 1, 6, 2, 3], 2, 0, 0), {1, 3, 4})
+        self.assertEqual(self.cache.choose_reroll([1, 6, 2, 6, 3], 2, 0, 0), {0, 2, 4})
+        self.assertEqual(self.keeper.calls, 1)
+
+    def test_clear_and_invalid_size(self):
+        """Test that clear() empties the cache and maxsize must be positive."""
+        self.cache.choose_keep([6, 6, 6, 6, 6], 1, 0, 0)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.to_dict()['misses'], 0)
+        with self.assertRaises(ValueError):
+            DecisionCache(self.keeper.choose_keep, maxsize=0)
+
+    def test_optimal_strategy_uses_cache(self):
+        """Test that OptimalStrategy routes keep decisions through its cache."""
+        strategy = OptimalStrategy(self.keeper, cache_size=1000)
+        self.assertEqual(strategy.choose_reroll([6, 2, 6, 3, 1], 2, 0, 0), {1, 3, 4})
+        self.assertEqual(strategy.choose_reroll([1, 6, 6, 3, 2], 2, 0, 0), {0, 3, 4})
+        self.assertEqual(self.keeper.calls, 1)
+        self.assertEqual(strategy.cache.hits, 1)
+        game = Game(1)
+        play_game(game, [strategy])
+        self.assertEqual(self.keeper.calls, strategy.cache.misses)
+        self.assertIsNone(OptimalStrategy(self.keeper, cache_size=None).cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
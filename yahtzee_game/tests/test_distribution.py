@@ -0,0 +1,105 @@
+import unittest
+import sys
+import os
+from itertools import product
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from distribution import MAX_SCORE, StrategyPolicy, as_policy, score_distribution
+from simulation import GreedyStrategy, OptimalStrategy
+from solver import FULL_MASK, StrategyTable
+
+CHANCE_ONLY = FULL_MASK ^ (1 << 12)
+SIXES_ONLY = FULL_MASK ^ (1 << 5)
+YAHTZEE_AND_CHANCE = FULL_MASK ^ (1 << 11) ^ (1 << 12)
+
+
+def dice_sum_pmf():
+    """Exact PMF of the sum of five dice, by enumerating all 7776 rolls."""
+    pmf = np.zeros(31)
+    for roll in product(range(1, 7), repeat=5):
+        pmf[sum(roll)] += 1
+    return pmf / 6 ** 5
+
+
+class TestDistribution(unittest.TestCase):
+    """Test suite for the exact final-score distribution engine."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Solving only the last two rounds keeps the suite fast
+        cls.table = StrategyTable.solve(base_mask=YAHTZEE_AND_CHANCE)
+
+    def test_greedy_chance_is_dice_sum(self):
+        """Test that Chance without rerolls is distributed as the sum of five dice."""
+        dist = score_distribution(GreedyStrategy(), CHANCE_ONLY)
+        np.testing.assert_allclose(dist.pmf[:31], dice_sum_pmf(), atol=1e-15)
+        self.assertAlmostEqual(dist.mean, 17.5)
+
+    def test_optimal_mean_matches_table(self):
+        """Test that the optimal policy's PMF has the solver's expected score."""
+        dist = score_distribution(self.table, YAHTZEE_AND_CHANCE, score=120)
+        self.assertAlmostEqual(dist.total_probability, 1.0)
+        self.assertAlmostEqual(dist.mean - 120,
+                               self.table.expected_score(YAHTZEE_AND_CHANCE, 0), places=4)
+        self.assertEqual(dist.cdf(119), 0.0)
+
+    def test_upper_bonus_is_added(self):
+        """Test that the 35 point bonus applies once the upper subtotal reaches 63."""
+        dist = score_distribution(GreedyStrategy(), SIXES_ONLY, upper=60, score=100)
+        no_six = (5 / 6) ** 5
+        self.assertAlmostEqual(dist.pmf[100], no_six)
+        self.assertAlmostEqual(dist.pmf[100 + 6 + 35], 5 * (1 / 6) * (5 / 6) ** 4)
+        self.assertAlmostEqual(dist.prob_above(100), 1 - no_six)
+
+    def test_max_score_folds_the_tail(self):
+        """Test that scores above max_score land in the top bucket."""
+        dist = score_distribution(GreedyStrategy(), CHANCE_ONLY, max_score=20)
+        exact = dice_sum_pmf()
+        self.assertEqual(len(dist.pmf), 21)
+        self.assertAlmostEqual(dist.pmf[20], exact[20:].sum())
+        self.assertAlmostEqual(dist.total_probability, 1.0)
+
+    def test_min_prob_truncation_is_reported(self):
+        """Test that dropped probability is accounted for in truncated."""
+        dist = score_distribution(GreedyStrategy(), CHANCE_ONLY, min_prob=1e-3)
+        self.assertGreater(dist.truncated, 0)
+        self.assertAlmostEqual(dist.total_probability + dist.truncated, 1.0)
+        self.assertEqual(dist.pmf[5], 0.0)
+
+    def test_min_prob_can_truncate_everything(self):
+        """Test that a min_prob above every state's mass gives an empty distribution."""
+        dist = score_distribution(GreedyStrategy(), CHANCE_ONLY, min_prob=0.9)
+        self.assertEqual(dist.total_probability, 0.0)
+        self.assertAlmostEqual(dist.truncated, 1.0)
+        self.assertEqual(len(dist.pmf), MAX_SCORE + 1)
+        self.assertEqual(dist.to_dict()['max_score'], 0)
+
+    def test_quantiles_and_summary(self):
+        """Test CDF, quantiles and the JSON summary."""
+        dist = score_distribution(GreedyStrategy(), CHANCE_ONLY)
+        self.assertAlmostEqual(dist.cdf(17), dice_sum_pmf()[:18].sum())
+        self.assertEqual(dist.quantile(0.5), 17)
+        summary = dist.to_dict()
+        self.assertEqual((summary['min_score'], summary['max_score']), (5, 30))
+        self.assertAlmostEqual(sum(summary['pmf'].values()), 1.0)
+
+    def test_policy_resolution(self):
+        """Test that tables, optimal bots and plain strategies become policies."""
+        self.assertIs(as_policy(self.table), self.table)
+        self.assertIs(as_policy(OptimalStrategy(self.table)), self.table)
+        self.assertIsInstance(as_policy(GreedyStrategy()), StrategyPolicy)
+
+    def test_strategy_policy_matches_table_policy(self):
+        """Test that querying OptimalStrategy hand by hand reproduces turn_policy."""
+        wrapped = StrategyPolicy(OptimalStrategy(self.table, cache_size=None))
+        direct = self.table.turn_policy(YAHTZEE_AND_CHANCE, 0)
+        for ours, theirs in zip(wrapped.turn_policy(YAHTZEE_AND_CHANCE, 0), direct):
+            np.testing.assert_array_equal(ours, theirs)
+
+
+if __name__ == '__main__':
+    unittest.main()
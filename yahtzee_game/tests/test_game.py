@@ -63,7 +63,22 @@ class TestGame(unittest.TestCase):
         values = self.game.get_dice_values()
         for i, value in enumerate(values):
             self.assertEqual(value, self.game.die[i].face_value)
-    
+
+    def test_die_write_is_visible_without_resync(self):
+        """Test that setting a Dice face directly updates the game's dice values."""
+        self.game.dice_values = [3, 6, 4, 2, 1]
+        self.game.die[0].face_value = 6
+        self.assertEqual(self.game.get_dice_values(), [6, 6, 4, 2, 1])
+        self.assertEqual(self.game.get_frequency(), [1, 1, 0, 1, 0, 2])
+        self.assertEqual(self.game.calculate_score(5), 12)
+
+    def test_dice_values_setter_writes_through_to_dice(self):
+        """Test that assigning dice_values updates every Dice object."""
+        self.game.dice_values = [1, 1, 1, 1, 1]
+        self.assertEqual([die.face_value for die in self.game.die], [1, 1, 1, 1, 1])
+        self.game.set_dice_values()
+        self.assertEqual(self.game.calculate_score(11), 50)
+
     def test_get_sorted_dice_returns_sorted_list(self):
         """Test that get_sorted_dice() returns a sorted list."""
         # Set known values
@@ -0,0 +1,85 @@
+import unittest
+import sys
+import os
+import random
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hand import Hand
+from game import Game
+from scoring import ALL_HANDS, hand_key, hand_scores
+
+
+class TestHand(unittest.TestCase):
+    """Test suite for the packed Hand type."""
+
+    def test_values_round_trip(self):
+        """Test that values() returns the faces in dice order."""
+        self.assertEqual(Hand([5, 2, 6, 1, 3]).values(), [5, 2, 6, 1, 3])
+
+    def test_key_matches_hand_key(self):
+        """Test that the packed counts equal scoring.hand_key()."""
+        self.assertEqual(Hand([5, 2, 6, 2, 3]).key, hand_key([5, 2, 6, 2, 3]))
+
+    def test_count_total_and_sorted(self):
+        """Test the O(1) count, total and sorted accessors."""
+        hand = Hand([4, 1, 4, 6, 4])
+        self.assertEqual(hand.count(4), 3)
+        self.assertEqual(hand.count(2), 0)
+        self.assertEqual(hand.counts(), [1, 0, 0, 3, 0, 1])
+        self.assertEqual(hand.total, 19)
+        self.assertEqual(hand.sorted_values(), (1, 4, 4, 4, 6))
+        self.assertEqual(ALL_HANDS[hand.index], (1, 4, 4, 4, 6))
+
+    def test_set_face_updates_incrementally(self):
+        """Test that set_face() keeps every accessor consistent with a fresh Hand."""
+        rng = random.Random(3)
+        hand = Hand([1, 1, 1, 1, 1])
+        for _ in range(500):
+            hand.set_face(rng.randrange(5), rng.randint(1, 6))
+            fresh = Hand(hand.values())
+            self.assertEqual(hand.key, fresh.key)
+            self.assertEqual(hand.total, fresh.total)
+            self.assertEqual(hand.faces, fresh.faces)
+
+    def test_scores_match_table(self):
+        """Test that scores() returns the precomputed category scores."""
+        self.assertEqual(Hand([2, 3, 4, 5, 6]).scores(), hand_scores([2, 3, 4, 5, 6]))
+
+    def test_invalid_face_value(self):
+        """Test that faces outside 1-6 raise ValueError."""
+        with self.assertRaises(ValueError):
+            Hand([1, 2, 3, 4, 7])
+        with self.assertRaises(ValueError):
+            Hand([1, 2, 3, 4, 5]).set_face(0, 0)
+
+    def test_wrong_number_of_dice(self):
+        """Test that a hand must have exactly five dice."""
+        with self.assertRaises(ValueError):
+            Hand([1, 2, 3])
+
+    def test_equality_and_hash(self):
+        """Test that hands compare by position-ordered faces."""
+        self.assertEqual(Hand([1, 2, 3, 4, 5]), Hand([1, 2, 3, 4, 5]))
+        self.assertNotEqual(Hand([1, 2, 3, 4, 5]), Hand([5, 4, 3, 2, 1]))
+        self.assertEqual(len({Hand([1, 2, 3, 4, 5]), Hand([1, 2, 3, 4, 5])}), 1)
+
+    def test_game_reroll_keeps_hand_in_sync(self):
+        """Test that Game.reroll_dice() updates the hand from the rerolled dice."""
+        game = Game(1, random.Random(4))
+        for _ in range(50):
+            game.reroll_dice({0, 2})
+            self.assertEqual(game.get_dice_values(), [die.face_value for die in game.die])
+
+    def test_game_views_follow_hand(self):
+        """Test that sorted_dice and frequency are derived from the current hand."""
+        game = Game(1)
+        game.dice_values = [6, 6, 2, 2, 2]
+        self.assertEqual(game.sorted_dice, [2, 2, 2, 6, 6])
+        self.assertEqual(game.frequency, [0, 3, 0, 0, 0, 2])
+        self.assertEqual(game.calculate_score(8), 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
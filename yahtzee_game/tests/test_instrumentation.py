@@ -0,0 +1,109 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import instrumentation
+from game import Game
+
+
+def double(x):
+    return 2 * x
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test suite for the hot-path counters and timers."""
+
+    def setUp(self):
+        """Turn instrumentation on for the decorators created in each test."""
+        self.was_enabled = instrumentation.ENABLED
+        instrumentation.ENABLED = True
+        instrumentation.reset()
+
+    def tearDown(self):
+        """Restore the import-time setting and clear recorded data."""
+        instrumentation.ENABLED = self.was_enabled
+        instrumentation.reset()
+
+    def test_disabled_decorators_return_the_function(self):
+        """Test that with instrumentation off the decorators add no wrapper."""
+        instrumentation.ENABLED = False
+        self.assertIs(instrumentation.counted('x')(double), double)
+        self.assertIs(instrumentation.timed('x')(double), double)
+        instrumentation.count('x')
+        self.assertEqual(instrumentation.snapshot()['counters'], {})
+
+    def test_game_hot_paths_unwrapped_by_default(self):
+        """Test that Game methods are plain functions when the env var is unset."""
+        if self.was_enabled:
+            self.skipTest(f"{instrumentation.ENV_VAR} is set")
+        self.assertFalse(hasattr(Game.calculate_score, '__wrapped__'))
+        self.assertFalse(hasattr(Game.roll_dice, '__wrapped__'))
+
+    def test_counted_counts_calls(self):
+        """Test that each call increments the named counter."""
+        wrapped = instrumentation.counted('test.double')(double)
+        self.assertEqual([wrapped(i) for i in range(5)], [0, 2, 4, 6, 8])
+        instrumentation.count('test.double', 10)
+        self.assertEqual(instrumentation.snapshot()['counters'], {'test.double': 15})
+
+    def test_timed_records_histogram(self):
+        """Test that a timer records every call in its histogram."""
+        wrapped = instrumentation.timed('test.double')(double)
+        for i in range(100):
+            wrapped(i)
+        timer = instrumentation.snapshot()['timers']['test.double']
+        self.assertEqual(timer['count'], 100)
+        self.assertEqual(sum(timer['buckets']), 100)
+        self.assertLessEqual(timer['min_ns'], timer['p50_ns'])
+        self.assertLessEqual(timer['p50_ns'], timer['p99_ns'])
+        self.assertLessEqual(timer['p99_ns'], timer['max_ns'])
+
+    def test_threads_aggregate_without_sharing(self):
+        """Test that counts from several threads are summed by snapshot()."""
+        wrapped = instrumentation.counted('test.thread')(double)
+
+        def work():
+            for i in range(1000):
+                wrapped(i)
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(instrumentation.snapshot()['counters']['test.thread'], 4000)
+
+    def test_histogram_quantiles_and_round_trip(self):
+        """Test bucket quantiles and that dict round trips keep the histogram."""
+        histogram = instrumentation.Histogram()
+        for ns in [100] * 90 + [5000] * 10:
+            histogram.record(ns)
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.quantile(0.5), 128)
+        self.assertEqual(histogram.quantile(0.99), 5000)
+        self.assertEqual(histogram.min_ns, 64)
+        restored = instrumentation.Histogram.from_dict(histogram.to_dict())
+        self.assertEqual(restored.to_dict(), histogram.to_dict())
+
+    def test_merge_snapshots_and_export(self):
+        """Test that exported snapshots from several processes merge by summing."""
+        wrapped = instrumentation.timed('test.double')(double)
+        instrumentation.count('test.count', 3)
+        wrapped(1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = instrumentation.export_snapshot(os.path.join(tmp, 'snap.json'))
+            with open(path) as f:
+                exported = json.load(f)
+        merged = instrumentation.merge_snapshots([exported, dict(exported, pid=-1)])
+        self.assertEqual(merged['counters'], {'test.count': 6})
+        self.assertEqual(merged['timers']['test.double']['count'], 2)
+        self.assertEqual(len(merged['pids']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from parallel import SimulationStats, run_parallel, run_shard, shard_sizes
+from simulation import GreedyStrategy, RandomStrategy
+
+
+class TestParallel(unittest.TestCase):
+    """Test suite for the multi-core simulation runner."""
+
+    def test_shard_sizes(self):
+        """Test that games are split into full shards plus a remainder."""
+        self.assertEqual(shard_sizes(25, 10), [10, 10, 5])
+        self.assertEqual(shard_sizes(20, 10), [10, 10])
+        self.assertEqual(shard_sizes(0, 10), [])
+
+    def test_run_shard_is_reproducible(self):
+        """Test that a shard replays the same games for the same seed and index."""
+        first = run_shard(RandomStrategy, 15, 3, 2)
+        second = run_shard(RandomStrategy, 15, 3, 2)
+        self.assertTrue(first.same_results(second))
+
+    def test_shards_use_independent_seeds(self):
+        """Test that different shard indices play different games."""
+        first = run_shard(RandomStrategy, 15, 3, 0)
+        second = run_shard(RandomStrategy, 15, 3, 1)
+        self.assertFalse(first.same_results(second))
+
+    def test_results_independent_of_worker_count(self):
+        """Test that one and two workers produce identical aggregates."""
+        serial = run_parallel(60, RandomStrategy, seed=9, workers=1, shard_size=16)
+        pooled = run_parallel(60, RandomStrategy, seed=9, workers=2, shard_size=16)
+        self.assertEqual(serial.stats.num_games, 60)
+        self.assertTrue(serial.stats.same_results(pooled.stats))
+
+    def test_on_shard_called_incrementally(self):
+        """Test that the callback sees the merged stats grow shard by shard."""
+        seen = []
+        run_parallel(30, GreedyStrategy, workers=1, shard_size=10,
+                     on_shard=lambda stats: seen.append(stats.num_games))
+        self.assertEqual(seen, [10, 20, 30])
+
+    def test_stats_merge(self):
+        """Test that merging stats adds histograms and category totals."""
+        a = SimulationStats()
+        a.add_game(10, [1, 0] + [0] * 11)
+        b = SimulationStats()
+        b.add_game(20, [3, 2] + [0] * 11)
+        a.merge(b)
+        self.assertEqual(a.num_games, 2)
+        self.assertEqual(a.histogram, {10: 1, 20: 1})
+        self.assertEqual(a.category_sums[:2], [4, 2])
+        self.assertEqual(a.category_zeros[1], 1)
+        self.assertEqual(a.mean_score, 15)
+        self.assertEqual(a.category_means()[0], 2)
+        self.assertEqual(a.category_stds()[0], 1)
+
+    def test_result_to_dict(self):
+        """Test that the run summary includes throughput and per-category stats."""
+        result = run_parallel(10, GreedyStrategy, workers=1, shard_size=5).to_dict()
+        self.assertEqual(result['num_games'], 10)
+        self.assertEqual(result['num_shards'], 2)
+        self.assertEqual(len(result['category_means']), 13)
+        self.assertEqual(sum(result['histogram'].values()), 10)
+        self.assertGreater(result['games_per_second'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+import pickle
+import random
+from collections import Counter
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from rng import BufferedFaceSource
+from dice import Dice
+from game import Game
+
+
+class TestBufferedFaceSource(unittest.TestCase):
+    """Test suite for the buffered dice random source."""
+
+    def test_randint_returns_faces(self):
+        """Test that randint(1, 6) only returns values 1-6."""
+        source = BufferedFaceSource(1)
+        for _ in range(5000):
+            self.assertIn(source.randint(1, 6), range(1, 7))
+
+    def test_faces_are_roughly_uniform(self):
+        """Test that each face appears close to 1/6 of the time."""
+        counts = Counter(BufferedFaceSource(2).faces(60000))
+        self.assertEqual(set(counts), set(range(1, 7)))
+        for face in range(1, 7):
+            self.assertAlmostEqual(counts[face] / 60000, 1 / 6, delta=0.01)
+
+    def test_same_seed_same_faces(self):
+        """Test that a seed reproduces the same sequence of faces."""
+        a, b = BufferedFaceSource(42), BufferedFaceSource(42)
+        self.assertEqual([a.roll() for _ in range(10000)], [b.roll() for _ in range(10000)])
+
+    def test_different_seeds_differ(self):
+        """Test that different seeds give different sequences."""
+        self.assertNotEqual(BufferedFaceSource(1).faces(100), BufferedFaceSource(2).faces(100))
+
+    def test_faces_spans_several_refills(self):
+        """Test that faces() returns exactly the requested count across refills."""
+        source = BufferedFaceSource(3, block_size=7)
+        self.assertEqual(len(source.faces(100)), 100)
+
+    @unittest.skipUnless(np is not None, "NumPy not installed")
+    def test_numpy_generator_source(self):
+        """Test that faces can be drawn from a NumPy Generator."""
+        source = BufferedFaceSource(generator=np.random.default_rng(5), block_size=64)
+        faces = source.faces(1000)
+        self.assertEqual(set(faces), set(range(1, 7)))
+        again = BufferedFaceSource(generator=np.random.default_rng(5), block_size=64)
+        self.assertEqual(again.faces(1000), faces)
+
+    def test_tiny_block_size_never_runs_dry(self):
+        """Test that a refill whose chunks are all rejected draws again."""
+        source = BufferedFaceSource(0, block_size=1)
+        for _ in range(200):
+            self.assertIn(source.randint(1, 6), range(1, 7))
+        self.assertIn(BufferedFaceSource(0, block_size=1).roll(), range(1, 7))
+
+    def test_other_ranges_use_wrapped_generator(self):
+        """Test that non-die ranges and other methods delegate to random.Random."""
+        source = BufferedFaceSource(4)
+        for _ in range(100):
+            self.assertIn(source.randint(10, 12), range(10, 13))
+        self.assertIn(source.choice([7, 8]), (7, 8))
+        self.assertLess(source.random(), 1.0)
+
+    def test_invalid_block_size(self):
+        """Test that a non-positive block size raises ValueError."""
+        with self.assertRaises(ValueError):
+            BufferedFaceSource(block_size=0)
+
+    def test_pickle_round_trip(self):
+        """Test that a source can be pickled and keeps its sequence."""
+        source = BufferedFaceSource(8)
+        source.roll()
+        clone = pickle.loads(pickle.dumps(source))
+        self.assertEqual(clone.faces(50), source.faces(50))
+
+    def test_dice_with_injected_rng(self):
+        """Test that Dice rolls from an injected generator reproducibly."""
+        first = Dice(random.Random(9))
+        second = Dice(random.Random(9))
+        self.assertEqual([first.roll() for _ in range(20)], [second.roll() for _ in range(20)])
+
+    def test_game_with_injected_rng(self):
+        """Test that a Game seeded with the same source rolls the same dice."""
+        first = Game(1, BufferedFaceSource(10))
+        second = Game(1, BufferedFaceSource(10))
+        for _ in range(5):
+            first.roll_dice()
+            second.roll_dice()
+            self.assertEqual(first.get_dice_values(), second.get_dice_values())
+
+
+if __name__ == '__main__':
+    unittest.main()
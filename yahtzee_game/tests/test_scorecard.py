@@ -159,6 +159,23 @@ class TestScorecard(unittest.TestCase):
         
         # Verify the change is reflected in the scorecard
         self.assertEqual(scorecard.get_score(0, 0), 100)
+
+    def test_write_through_card_keeps_totals_consistent(self):
+        """Test that total() and state() follow writes made through the card."""
+        scorecard = Scorecard(1)
+        card = scorecard.get_player_card(0)
+        card[11] = 50
+        card[5] = 30
+        self.assertEqual(scorecard.total(0), 80)
+        self.assertEqual(scorecard.upper_subtotal(0), 30)
+        self.assertEqual(scorecard.state(0), (0, 30))
+        self.assertFalse(scorecard.is_used(0, 11))
+        card[4] = 35
+        self.assertEqual(scorecard.total(0), 115 + 35)
+        scorecard.set_score(0, 11, 0)
+        self.assertEqual(scorecard.total(0), 65 + 35)
+        self.assertEqual(scorecard.state(0), (1 << 11, 63))
+        self.assertEqual(card[11], 0)
     
     def test_multiple_players_independent(self):
         """Test that scores for different players are independent."""
@@ -180,5 +197,61 @@ class TestScorecard(unittest.TestCase):
         for slot_idx in range(13):
             self.assertEqual(scorecard.get_score(0, slot_idx), slot_idx * 5)
 
+    def test_scratched_zero_marks_slot_used(self):
+        """Test that scoring 0 in a slot marks it used, unlike an open slot."""
+        scorecard = Scorecard(1)
+        scorecard.set_score(0, 11, 0)
+        self.assertTrue(scorecard.is_used(0, 11))
+        self.assertFalse(scorecard.is_used(0, 10))
+        self.assertEqual(scorecard.get_score(0, 11), scorecard.get_score(0, 10))
+
+    def test_used_mask_and_open_slots(self):
+        """Test the used-slot bitmask and the open slots derived from it."""
+        scorecard = Scorecard(2)
+        scorecard.set_score(1, 0, 3)
+        scorecard.set_score(1, 12, 20)
+        self.assertEqual(scorecard.used_mask(1), (1 << 0) | (1 << 12))
+        self.assertEqual(scorecard.used_mask(0), 0)
+        self.assertEqual(list(scorecard.open_slots(1)), list(range(1, 12)))
+
+    def test_upper_subtotal_and_bonus(self):
+        """Test that the upper bonus is awarded at an upper subtotal of 63."""
+        scorecard = Scorecard(1)
+        for slot_idx, value in enumerate([3, 6, 9, 12, 15, 18]):
+            scorecard.set_score(0, slot_idx, value)
+        self.assertEqual(scorecard.upper_subtotal(0), 63)
+        self.assertEqual(scorecard.upper_bonus(0), 35)
+        scorecard.set_score(0, 0, 2)
+        self.assertEqual(scorecard.upper_subtotal(0), 62)
+        self.assertEqual(scorecard.upper_bonus(0), 0)
+
+    def test_total_includes_bonus(self):
+        """Test that total() sums every slot plus the upper bonus."""
+        scorecard = Scorecard(1)
+        for slot_idx, value in enumerate([4, 8, 12, 16, 20, 24, 30, 0, 25, 30, 40, 50, 22]):
+            scorecard.set_score(0, slot_idx, value)
+        self.assertTrue(scorecard.is_complete(0))
+        self.assertEqual(scorecard.total(0), 281 + 35)
+
+    def test_state_caps_upper_subtotal(self):
+        """Test that state() returns the mask and the upper subtotal capped at 63."""
+        scorecard = Scorecard(1)
+        scorecard.set_score(0, 5, 30)
+        scorecard.set_score(0, 4, 25)
+        scorecard.set_score(0, 3, 20)
+        self.assertEqual(scorecard.state(0), (0b111000, 63))
+
+    def test_reset_clears_cards(self):
+        """Test that reset() clears scores, masks and totals in place."""
+        scorecard = Scorecard(2)
+        card = scorecard.get_player_card(1)
+        scorecard.set_score(1, 3, 12)
+        scorecard.reset()
+        self.assertEqual(scorecard.get_score(1, 3), 0)
+        self.assertEqual(card[3], 0)
+        self.assertEqual(scorecard.used_mask(1), 0)
+        self.assertEqual(scorecard.total(1), 0)
+        self.assertIs(scorecard.get_player_card(1), card)
+
 if __name__ == '__main__':
     unittest.main()
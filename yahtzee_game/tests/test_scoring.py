@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+from itertools import permutations
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import scoring
+from game import Game
+
+
+class TestScoring(unittest.TestCase):
+    """Test suite for the precomputed scoring table."""
+
+    def test_all_hands_has_252_entries(self):
+        """Test that every sorted multiset of five dice is enumerated once."""
+        self.assertEqual(len(scoring.ALL_HANDS), 252)
+        self.assertEqual(len(set(scoring.ALL_HANDS)), 252)
+
+    def test_hand_keys_are_unique(self):
+        """Test that each sorted hand maps to a distinct key."""
+        self.assertEqual(len(scoring.HAND_INDEX), 252)
+
+    def test_hand_key_ignores_order(self):
+        """Test that every permutation of a hand produces the same key."""
+        expected = scoring.hand_key([1, 2, 2, 5, 6])
+        for perm in permutations([6, 2, 1, 5, 2]):
+            self.assertEqual(scoring.hand_key(perm), expected)
+
+    def test_table_matches_reference_rules(self):
+        """Test that every table entry equals the branchy reference scorer."""
+        for idx, hand in enumerate(scoring.ALL_HANDS):
+            for slot_idx in range(scoring.NUM_SLOTS):
+                self.assertEqual(scoring.SCORE_TABLE[idx][slot_idx],
+                                 scoring.score_slot(list(hand), slot_idx))
+
+    def test_lookup_score_unsorted_hand(self):
+        """Test lookup_score() on a hand given in arbitrary order."""
+        self.assertEqual(scoring.lookup_score([5, 2, 5, 2, 5], 8), 25)
+        self.assertEqual(scoring.lookup_score([6, 3, 5, 4, 1], 9), 30)
+        self.assertEqual(scoring.lookup_score([6, 3, 5, 4, 2], 10), 40)
+
+    def test_lookup_score_invalid_slot(self):
+        """Test that lookup_score() returns 0 for out-of-range slots."""
+        self.assertEqual(scoring.lookup_score([1, 1, 1, 1, 1], 13), 0)
+        self.assertEqual(scoring.lookup_score([1, 1, 1, 1, 1], -1), 0)
+
+    def test_hand_scores_returns_all_categories(self):
+        """Test that hand_scores() returns all 13 category scores."""
+        scores = scoring.hand_scores([3, 3, 3, 3, 3])
+        self.assertEqual(scores, (0, 0, 15, 0, 0, 0, 15, 15, 0, 0, 0, 50, 15))
+
+    def test_game_calculate_score_matches_table(self):
+        """Test that Game.calculate_score() agrees with the reference for every hand."""
+        game = Game(1)
+        for hand in scoring.ALL_HANDS:
+            for i, die in enumerate(game.die):
+                die.face_value = hand[i]
+            game.set_dice_values()
+            for slot_idx in range(scoring.NUM_SLOTS):
+                self.assertEqual(game.calculate_score(slot_idx),
+                                 scoring.score_slot(list(hand), slot_idx))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,321 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server import GameSession, ProtocolError, ServerMetrics, TournamentServer
+from simulation import GreedyStrategy
+
+
+class Client:
+    """Minimal line-protocol client standing in for a tournament player."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, server):
+        host, port = server.address[:2]
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def send(self, line):
+        self.writer.write(line.encode() + b'\n')
+        await self.writer.drain()
+
+    async def recv(self):
+        return (await self.reader.readline()).decode().strip()
+
+    async def request(self, line):
+        await self.send(line)
+        return await self.recv()
+
+    async def play_to_end(self):
+        """Score every human turn in the first open slot; return all lines up to OVER."""
+        lines = []
+        used = set()
+        while True:
+            line = await self.recv()
+            lines.append(line)
+            if line.startswith('OVER'):
+                return lines
+            if line.startswith('TURN'):
+                slot = min(set(range(13)) - used)
+                used.add(slot)
+                await self.send(f"SCORE {slot}")
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def with_server(body, **kwargs):
+    server = TournamentServer(**kwargs)
+    await server.start()
+    try:
+        return await body(server)
+    finally:
+        await server.close()
+
+
+class TestServer(unittest.TestCase):
+    """Test suite for the asyncio tournament server."""
+
+    def test_session_limits_rerolls(self):
+        """Test that a human seat gets at most two rerolls per turn."""
+        session = GameSession(1, [None])
+        session.start_turn()
+        session.reroll([0])
+        session.reroll([1, 2])
+        with self.assertRaises(ProtocolError):
+            session.reroll([0])
+
+    def test_session_rejects_used_slot(self):
+        """Test that scoring an already used slot is a protocol error."""
+        session = GameSession(1, [None, None])
+        session.start_turn()
+        session.score(12)
+        session.end_turn()
+        session.start_turn()
+        session.score(12)
+        session.end_turn()
+        session.start_turn()
+        with self.assertRaises(ProtocolError):
+            session.score(12)
+        with self.assertRaises(ProtocolError):
+            session.score(13)
+
+    def test_session_advances_rounds(self):
+        """Test that a session ends after 13 rounds of every seat."""
+        session = GameSession(1, [GreedyStrategy(), GreedyStrategy()])
+        turns = 0
+        while not session.over:
+            session.play_bot_turn()
+            session.end_turn()
+            turns += 1
+        self.assertEqual(turns, 26)
+        self.assertTrue(all(session.scorecard.is_complete(p) for p in range(2)))
+
+    def test_metrics_latency_quantiles(self):
+        """Test that turn latencies land in the right histogram buckets."""
+        metrics = ServerMetrics()
+        for _ in range(99):
+            metrics.record_turn(0.00005)
+        metrics.record_turn(0.5)
+        self.assertEqual(metrics.latency_quantile(0.5), 0.0001)
+        self.assertEqual(metrics.latency_quantile(1.0), 1.0)
+        self.assertEqual(metrics.max_turn_time, 0.5)
+
+    def test_bot_game_over_tcp(self):
+        """Test that a bot-only game streams 13 bot turns per seat and the totals."""
+        async def body(server):
+            client = await Client.connect(server)
+            self.assertEqual(await client.request("NEW greedy random SEED 7"), "OK 1")
+            lines = await client.play_to_end()
+            await client.close()
+            return lines
+
+        lines = run(with_server(body))
+        self.assertEqual(len(lines), 27)
+        self.assertTrue(all(line.startswith('SCORED') for line in lines[:-1]))
+        self.assertEqual(len(lines[-1].split()), 3)
+
+    def test_seeded_games_are_reproducible(self):
+        """Test that the same seed replays the same bot game."""
+        async def body(server):
+            client = await Client.connect(server)
+            await client.request("NEW greedy SEED 11")
+            first = await client.play_to_end()
+            await client.request("NEW greedy SEED 11")
+            second = await client.play_to_end()
+            await client.close()
+            return first, second
+
+        first, second = run(with_server(body))
+        self.assertEqual(first, second)
+
+    def test_human_vs_bot(self):
+        """Test that a human seat is prompted each round and the bot moves in between."""
+        async def body(server):
+            client = await Client.connect(server)
+            self.assertEqual(await client.request("NEW human greedy"), "OK 1")
+            turn = await client.recv()
+            self.assertTrue(turn.startswith("TURN 1 DICE"))
+            self.assertTrue(turn.endswith("ROLLS 2"))
+            rolled = await client.request("ROLL 1 2")
+            self.assertTrue(rolled.endswith("ROLLS 1"))
+            state = await client.request("STATE")
+            self.assertTrue(state.startswith("STATE ROUND 1 PLAYER 1 ROLLS 1"))
+            await client.send("SCORE 12")
+            self.assertTrue((await client.recv()).startswith("SCORED 1 SLOT 12"))
+            self.assertTrue((await client.recv()).startswith("SCORED 2"))
+            self.assertTrue((await client.recv()).startswith("TURN 1"))
+            self.assertTrue((await client.request("SCORE 12")).startswith("ERR"))
+            await client.close()
+
+        run(with_server(body))
+
+    def test_protocol_errors(self):
+        """Test that bad commands get ERR replies without dropping the connection."""
+        async def body(server):
+            client = await Client.connect(server)
+            replies = [await client.request(line) for line in
+                       ("ROLL 1", "NEW wizard", "NEW", "FLY", "NEW greedy SEED x")]
+            self.assertEqual(await client.request("QUIT"), "BYE")
+            await client.close()
+            return replies
+
+        replies = run(with_server(body))
+        self.assertTrue(all(reply.startswith("ERR") for reply in replies))
+
+    def test_invalid_utf8_gets_err(self):
+        """Test that undecodable bytes get an ERR reply and the connection stays usable."""
+        async def body(server):
+            client = await Client.connect(server)
+            client.writer.write(b'NEW \xff\xfe\n')
+            await client.writer.drain()
+            reply = await client.recv()
+            bye = await client.request("QUIT")
+            await client.close()
+            return reply, bye
+
+        reply, bye = run(with_server(body))
+        self.assertTrue(reply.startswith("ERR"))
+        self.assertEqual(bye, "BYE")
+
+    def test_overlong_line_closes_connection(self):
+        """Test that a line over the reader limit gets ERR and a clean close."""
+        async def body(server):
+            client = await Client.connect(server)
+            client.writer.write(b'x' * (1 << 17) + b'\n')
+            await client.writer.drain()
+            reply = await client.recv()
+            try:
+                closed = await client.reader.read() == b''
+            except ConnectionResetError:
+                # The server closed with the rest of the line still unread
+                closed = True
+            client.writer.close()
+            for _ in range(100):
+                if server.metrics.connections == 0:
+                    break
+                await asyncio.sleep(0.01)
+            return reply, closed, server.metrics.connections
+
+        reply, closed, connections = run(with_server(body))
+        self.assertEqual(reply, "ERR Line too long")
+        self.assertTrue(closed)
+        self.assertEqual(connections, 0)
+
+    def test_many_concurrent_games(self):
+        """Test that hundreds of concurrent sessions all finish and are counted."""
+        async def play(server):
+            client = await Client.connect(server)
+            await client.request("NEW human random")
+            lines = await client.play_to_end()
+            await client.close()
+            return lines[-1]
+
+        async def body(server):
+            results = await asyncio.gather(*(play(server) for _ in range(200)))
+            client = await Client.connect(server)
+            metrics = json.loads((await client.request("METRICS")).split(' ', 1)[1])
+            await client.close()
+            return results, metrics
+
+        results, metrics = run(with_server(body))
+        self.assertTrue(all(line.startswith("OVER") for line in results))
+        self.assertEqual(metrics['games_started'], 200)
+        self.assertEqual(metrics['games_completed'], 200)
+        self.assertEqual(metrics['games_in_flight'], 0)
+        self.assertEqual(metrics['turns'], 200 * 26)
+
+    def test_disconnect_abandons_game(self):
+        """Test that a client dropping mid-game removes it from games in flight."""
+        async def body(server):
+            client = await Client.connect(server)
+            await client.request("NEW human")
+            await client.recv()
+            self.assertEqual(server.metrics.games_in_flight, 1)
+            await client.close()
+            for _ in range(100):
+                if server.metrics.connections == 0:
+                    break
+                await asyncio.sleep(0.01)
+            return server.metrics
+
+        metrics = run(with_server(body))
+        self.assertEqual(metrics.games_in_flight, 0)
+        self.assertEqual(metrics.games_completed, 0)
+
+    def test_handler_waits_for_close_after_reset(self):
+        """Test that the handler waits for its socket to close and ends cleanly on a reset."""
+        outcomes = []
+
+        class RecordingServer(TournamentServer):
+            async def handle_client(self, reader, writer):
+                try:
+                    await super().handle_client(reader, writer)
+                except BaseException as e:
+                    outcomes.append(e)
+                    raise
+                # wait_closed() returned, so the socket itself is closed, not just closing
+                outcomes.append(writer.get_extra_info('socket').fileno())
+
+        async def body(server):
+            client = await Client.connect(server)
+            await client.request("NEW human")
+            await client.recv()
+            # Drop the connection with a reset rather than a clean shutdown
+            client.writer.transport.abort()
+            for _ in range(100):
+                if outcomes:
+                    break
+                await asyncio.sleep(0.01)
+            return server.metrics
+
+        async def with_recording_server(body):
+            server = RecordingServer()
+            await server.start()
+            try:
+                return await body(server)
+            finally:
+                await server.close()
+
+        metrics = run(with_recording_server(body))
+        self.assertEqual(outcomes, [-1])
+        self.assertEqual(metrics.connections, 0)
+        self.assertEqual(metrics.games_in_flight, 0)
+
+    @unittest.skipUnless(hasattr(asyncio, 'start_unix_server'), "Unix sockets unavailable")
+    def test_unix_socket(self):
+        """Test that the server also listens on a Unix socket."""
+        async def body():
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, 'yahtzee.sock')
+                server = TournamentServer()
+                await server.start(path=path)
+                reader, writer = await asyncio.open_unix_connection(path)
+                client = Client(reader, writer)
+                reply = await client.request("NEW greedy")
+                lines = await client.play_to_end()
+                await client.close()
+                await server.close()
+                return reply, lines
+
+        reply, lines = run(body())
+        self.assertEqual(reply, "OK 1")
+        self.assertTrue(lines[-1].startswith("OVER"))
+
+
+if __name__ == '__main__':
+    unittest.main()
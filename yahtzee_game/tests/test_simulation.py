@@ -0,0 +1,118 @@
+import unittest
+import sys
+import os
+import random
+from unittest.mock import patch
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from game import Game
+from simulation import (GreedyStrategy, RandomStrategy, SimulationResult, Strategy,
+                        play_game, play_turn, run_simulation)
+
+
+class RecordingStrategy(Strategy):
+    """Strategy that rerolls everything once and records the calls it receives."""
+
+    def __init__(self):
+        self.turns = 0
+        self.reroll_calls = []
+        self.masks = []
+
+    def begin_turn(self, game, player_idx):
+        self.turns += 1
+
+    def choose_reroll(self, dice_values, rolls_left, mask, upper):
+        self.reroll_calls.append(rolls_left)
+        return {0, 1, 2, 3, 4} if rolls_left == 2 else set()
+
+    def choose_slot(self, dice_values, mask, upper):
+        self.masks.append(mask)
+        return super().choose_slot(dice_values, mask, upper)
+
+
+class RepeatSlotStrategy(Strategy):
+    """Strategy that always picks slot 0."""
+
+    def choose_slot(self, dice_values, mask, upper):
+        return 0
+
+
+class TestSimulation(unittest.TestCase):
+    """Test suite for the headless simulation engine."""
+
+    @patch('builtins.print', side_effect=AssertionError("print called"))
+    @patch('builtins.input', side_effect=AssertionError("input called"))
+    def test_play_game_is_headless(self, mock_input, mock_print):
+        """Test that a full game never prompts or prints."""
+        game = Game(2)
+        scores = play_game(game, [GreedyStrategy(), GreedyStrategy()])
+        self.assertEqual(len(scores), 2)
+
+    def test_play_game_fills_every_slot_once(self):
+        """Test that each player is asked for 13 slots with a growing used-slot mask."""
+        strategy = RecordingStrategy()
+        play_game(Game(1), [strategy])
+        self.assertEqual(strategy.turns, 13)
+        self.assertEqual(strategy.masks, [(1 << n) - 1 for n in range(13)])
+
+    def test_play_game_stops_rerolling_when_keeping_all(self):
+        """Test that an empty reroll ends the turn's rolling early."""
+        strategy = RecordingStrategy()
+        play_game(Game(1), [strategy])
+        self.assertEqual(strategy.reroll_calls, [2, 1] * 13)
+
+    def test_play_game_score_matches_card(self):
+        """Test that the returned score is the card total plus any upper bonus."""
+        game = Game(1)
+        score = play_game(game, [GreedyStrategy()])[0]
+        card_total = sum(game.players.get_player_card(0))
+        self.assertIn(score - card_total, (0, 35))
+
+    def test_play_game_rejects_used_slot(self):
+        """Test that choosing an already used slot raises ValueError."""
+        with self.assertRaises(ValueError):
+            play_game(Game(1), [RepeatSlotStrategy()])
+
+    def test_play_game_requires_one_strategy_per_player(self):
+        """Test that the number of strategies must match the number of players."""
+        with self.assertRaises(ValueError):
+            play_game(Game(2), [GreedyStrategy()])
+
+    def test_play_game_completes_card(self):
+        """Test that every slot of the player's card is used after a game."""
+        strategy = RecordingStrategy()
+        game = Game(1)
+        play_game(game, [strategy])
+        self.assertTrue(game.players.is_complete(0))
+
+    def test_play_turn_scores_one_slot(self):
+        """Test that a single turn fills exactly the slot it reports."""
+        game = Game(2)
+        slot_idx, score = play_turn(game, GreedyStrategy(), 1)
+        self.assertEqual(game.players.used_mask(1), 1 << slot_idx)
+        self.assertEqual(game.players.get_score(1, slot_idx), score)
+        self.assertEqual(game.players.used_mask(0), 0)
+
+    def test_run_simulation_reproducible_with_seed(self):
+        """Test that the same seed reproduces the same scores."""
+        first = run_simulation(20, RandomStrategy(random.Random(1)), seed=5)
+        second = run_simulation(20, RandomStrategy(random.Random(1)), seed=5)
+        self.assertEqual(first.scores, second.scores)
+
+    def test_run_simulation_reports_throughput(self):
+        """Test that run_simulation() reports games played and games per second."""
+        result = run_simulation(10, GreedyStrategy())
+        self.assertEqual(result.num_games, 10)
+        self.assertGreater(result.games_per_second, 0)
+        self.assertEqual(set(result.to_dict()),
+                         {'num_games', 'elapsed_s', 'games_per_second', 'mean_score'})
+
+    def test_simulation_result_mean_score(self):
+        """Test SimulationResult.mean_score on known scores."""
+        self.assertEqual(SimulationResult([100, 200], 1.0).mean_score, 150)
+
+
+if __name__ == '__main__':
+    unittest.main()
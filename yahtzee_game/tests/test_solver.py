@@ -0,0 +1,111 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+import solver
+from solver import FULL_MASK, StrategyTable
+from table_file import write_table
+
+CHANCE_ONLY = FULL_MASK ^ (1 << 12)
+YAHTZEE_ONLY = FULL_MASK ^ (1 << 11)
+YAHTZEE_AND_CHANCE = FULL_MASK ^ (1 << 11) ^ (1 << 12)
+
+
+class TestSolver(unittest.TestCase):
+    """Test suite for the dynamic programming solver."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Solving only the last two rounds keeps the suite fast
+        cls.table = StrategyTable.solve(base_mask=YAHTZEE_AND_CHANCE)
+
+    def test_chance_only_expected_value(self):
+        """Test the known optimal expectation of 70/3 for Chance alone."""
+        self.assertAlmostEqual(self.table.expected_score(CHANCE_ONLY, 0), 70 / 3, places=4)
+
+    def test_upper_bonus_added_at_threshold(self):
+        """Test that a state with the upper subtotal at 63 includes the 35 point bonus."""
+        self.assertAlmostEqual(self.table.expected_score(CHANCE_ONLY, 63), 70 / 3 + 35, places=4)
+
+    def test_yahtzee_only_probability(self):
+        """Test the known 4.6029% chance of a Yahtzee in three rolls."""
+        self.assertAlmostEqual(self.table.expected_score(YAHTZEE_ONLY, 0) / 50, 0.046029, places=5)
+
+    def test_two_slots_worth_more_than_either(self):
+        """Test that two open slots are worth at least as much as each one alone."""
+        both = self.table.expected_score(YAHTZEE_AND_CHANCE, 0)
+        self.assertGreater(both, self.table.expected_score(CHANCE_ONLY, 0))
+        self.assertGreater(both, self.table.expected_score(YAHTZEE_ONLY, 0))
+
+    def test_choose_slot_takes_yahtzee(self):
+        """Test that five of a kind is scored as a Yahtzee rather than Chance."""
+        self.assertEqual(self.table.choose_slot([4, 4, 4, 4, 4], YAHTZEE_AND_CHANCE, 0), 11)
+
+    def test_choose_slot_no_open_slots(self):
+        """Test that choose_slot() raises ValueError on a full card."""
+        with self.assertRaises(ValueError):
+            self.table.choose_slot([1, 2, 3, 4, 5], FULL_MASK, 0)
+
+    def test_choose_keep_for_yahtzee(self):
+        """Test that the solver keeps the triple when only Yahtzee is open."""
+        kept, value = self.table.choose_keep([2, 5, 2, 6, 2], 2, YAHTZEE_ONLY, 0)
+        self.assertEqual(kept, (2, 2, 2))
+        self.assertGreater(value, 0)
+
+    def test_choose_keep_for_chance(self):
+        """Test the Chance thresholds: keep 4+ with one roll left, 5+ with two."""
+        kept, _ = self.table.choose_keep([1, 4, 5, 6, 6], 1, CHANCE_ONLY, 0)
+        self.assertEqual(kept, (4, 5, 6, 6))
+        kept, _ = self.table.choose_keep([1, 4, 5, 6, 6], 2, CHANCE_ONLY, 0)
+        self.assertEqual(kept, (5, 6, 6))
+
+    def test_choose_keep_invalid_rolls_left(self):
+        """Test that choose_keep() rejects rolls_left outside 1-2."""
+        with self.assertRaises(ValueError):
+            self.table.choose_keep([1, 2, 3, 4, 5], 0, CHANCE_ONLY, 0)
+
+    def test_choose_reroll_returns_positions(self):
+        """Test that choose_reroll() returns the positions of the dice not kept."""
+        reroll = self.table.choose_reroll([2, 5, 2, 6, 2], 2, YAHTZEE_ONLY, 0)
+        self.assertEqual(reroll, {1, 3})
+
+    def test_reroll_indices_with_duplicates(self):
+        """Test that reroll_indices() keeps only as many copies as requested."""
+        self.assertEqual(solver.reroll_indices([3, 3, 3, 1, 3], (3, 3)), {2, 3, 4})
+
+    def test_save_and_load_round_trip(self):
+        """Test that a saved table loads back with identical values."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'table.bin')
+            self.table.save(path)
+            loaded = StrategyTable.load(path)
+            self.assertIsInstance(loaded.values, np.memmap)
+            np.testing.assert_array_equal(loaded.values, self.table.values)
+            self.assertEqual(loaded.choose_slot([6, 6, 6, 6, 6], YAHTZEE_AND_CHANCE, 0), 11)
+
+    def test_load_or_solve_replaces_invalid_table(self):
+        """Test that a table saved under other rules is re-solved and overwritten."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'table.bin')
+            write_table(path, np.zeros((8192, 64)), 'other-rules')
+            with patch.object(StrategyTable, 'solve', return_value=self.table):
+                table = StrategyTable.load_or_solve(path)
+            self.assertIs(table, self.table)
+            self.assertEqual(StrategyTable.load(path).expected_score(YAHTZEE_AND_CHANCE, 0),
+                             self.table.expected_score(YAHTZEE_AND_CHANCE, 0))
+
+    def test_invalid_table_shape(self):
+        """Test that StrategyTable rejects a table of the wrong shape."""
+        with self.assertRaises(ValueError):
+            StrategyTable(np.zeros((10, 64), dtype=np.float32))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from table_file import HEADER_SIZE, TableHeader, open_table, write_table
+
+
+class TestTableFile(unittest.TestCase):
+    """Test suite for the memory-mapped table file format."""
+
+    def setUp(self):
+        """Set up a temporary directory and a small table."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'table.bin')
+        self.values = np.arange(24, dtype=np.float64).reshape(4, 6) / 7
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_is_memory_mapped(self):
+        """Test that a written table maps back read-only with float32 values."""
+        write_table(self.path, self.values, 'test-rules')
+        values = open_table(self.path, 'test-rules', (4, 6))
+        self.assertIsInstance(values, np.memmap)
+        self.assertEqual(values.dtype, np.float32)
+        np.testing.assert_array_equal(values, self.values.astype(np.float32))
+        with self.assertRaises(ValueError):
+            values[0, 0] = 1.0
+
+    def test_header_fields(self):
+        """Test that the header records version, shape and rules variant."""
+        write_table(self.path, self.values, 'test-rules')
+        header = TableHeader.read(self.path)
+        self.assertEqual((header.version, header.shape, header.rules), (1, (4, 6), 'test-rules'))
+        self.assertEqual(os.path.getsize(self.path), HEADER_SIZE + 24 * 4)
+
+    def test_rules_and_shape_mismatch(self):
+        """Test that a table for other rules or of another shape is rejected."""
+        write_table(self.path, self.values, 'test-rules')
+        with self.assertRaises(ValueError):
+            open_table(self.path, 'other-rules')
+        with self.assertRaises(ValueError):
+            open_table(self.path, shape=(6, 4))
+
+    def test_checksum_detects_corruption(self):
+        """Test that a flipped data byte fails verification unless it is skipped."""
+        write_table(self.path, self.values, 'test-rules')
+        with open(self.path, 'r+b') as f:
+            f.seek(HEADER_SIZE + 5)
+            f.write(b'\xff')
+        with self.assertRaises(ValueError):
+            open_table(self.path)
+        self.assertEqual(open_table(self.path, verify=False).shape, (4, 6))
+
+    def test_rejects_bad_files(self):
+        """Test that foreign, short and truncated files are rejected."""
+        with open(self.path, 'wb') as f:
+            f.write(b'not a table' * 10)
+        with self.assertRaises(ValueError):
+            open_table(self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'YZ')
+        with self.assertRaises(ValueError):
+            open_table(self.path)
+        write_table(self.path, self.values, 'test-rules')
+        with open(self.path, 'r+b') as f:
+            f.truncate(HEADER_SIZE + 10)
+        with self.assertRaises(ValueError):
+            open_table(self.path)
+
+    def test_write_validates_input(self):
+        """Test that over-long rules names and scalar tables are refused."""
+        with self.assertRaises(ValueError):
+            write_table(self.path, self.values, 'x' * 33)
+        with self.assertRaises(ValueError):
+            write_table(self.path, np.float32(1.0), 'test-rules')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+import transitions
+from scoring import hand_key
+
+
+class TestTransitions(unittest.TestCase):
+    """Test suite for the keep -> hand transition matrices."""
+
+    def test_transitions_shape_and_rows_sum_to_one(self):
+        """Test that there are 462 keeps, each a probability distribution over 252 hands."""
+        self.assertEqual(transitions.TRANSITIONS.shape, (462, 252))
+        np.testing.assert_allclose(transitions.TRANSITIONS.sum(axis=1), 1.0)
+
+    def test_keep_all_is_deterministic(self):
+        """Test that keeping all five dice always yields the same hand."""
+        keep = transitions.KEEP_INDEX[hand_key((1, 2, 3, 4, 6))]
+        self.assertEqual(transitions.TRANSITIONS[keep].max(), 1.0)
+
+    def test_expected_scores_keep_four_sixes(self):
+        """Test exact expectations when rerolling one die next to four sixes."""
+        expected = transitions.expected_scores((6, 6, 6, 6))
+        self.assertAlmostEqual(expected[12], 24 + 3.5)
+        self.assertAlmostEqual(expected[5], 24 + 1)
+        self.assertAlmostEqual(expected[11], 50 / 6)
+        self.assertEqual(expected.shape, (13,))
+
+    def test_expected_scores_reroll_everything(self):
+        """Test the Yahtzee probability of 6/7776 when rerolling all dice."""
+        expected = transitions.expected_scores(())
+        self.assertAlmostEqual(expected[11], 50 * 6 / 7776)
+        self.assertAlmostEqual(expected[12], 17.5)
+
+    def test_expected_scores_ignores_keep_order(self):
+        """Test that a keep gives the same expectation in any order."""
+        np.testing.assert_array_equal(transitions.expected_scores((2, 5, 2)),
+                                      transitions.expected_scores((2, 2, 5)))
+        with self.assertRaises(ValueError):
+            transitions.expected_scores((7,))
+
+    def test_keep_expectations_for_a_hand(self):
+        """Test that a hand's 32 keeps are evaluated in one product."""
+        keeps, expected = transitions.keep_expectations([3, 1, 4, 1, 5])
+        self.assertEqual(expected.shape, (32, 13))
+        self.assertEqual(keeps[0], transitions.EMPTY_KEEP)
+        full = transitions.KEEP_INDEX[hand_key((1, 1, 3, 4, 5))]
+        self.assertEqual(keeps[-1], full)
+        np.testing.assert_array_equal(expected[-1], transitions.SCORES[
+            transitions.TRANSITIONS[full].argmax()])
+
+    def test_save_and_load_round_trip(self):
+        """Test that a cached matrix file loads back unchanged."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'transitions.npy')
+            transitions.save_transitions(transitions.TRANSITIONS, path)
+            loaded = transitions.load_or_build_transitions(path)
+        np.testing.assert_array_equal(loaded, transitions.TRANSITIONS)
+
+    def test_invalid_cache_is_rebuilt(self):
+        """Test that a malformed cache file is rejected and rebuilt in memory."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'transitions.npy')
+            transitions.save_transitions(np.zeros((462, 252)), path)
+            with self.assertRaises(ValueError):
+                transitions.load_transitions(path)
+            rebuilt = transitions.load_or_build_transitions(path)
+        np.testing.assert_allclose(rebuilt, transitions.TRANSITIONS)
+
+    def test_truncated_cache_is_rebuilt(self):
+        """Test that an empty or truncated cache file falls back to building the matrix."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'transitions.npy')
+            transitions.save_transitions(transitions.TRANSITIONS, path)
+            self.assertEqual(os.listdir(tmp), ['transitions.npy'])
+            with open(path, 'rb') as f:
+                data = f.read()
+            for size in (0, len(data) // 2):
+                with open(path, 'wb') as f:
+                    f.write(data[:size])
+                rebuilt = transitions.load_or_build_transitions(path)
+                np.testing.assert_allclose(rebuilt, transitions.TRANSITIONS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+import sys
+import os
+import math
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from distribution import score_distribution
+from game import Game
+from simulation import play_turn
+from solver import FULL_MASK, StrategyTable
+from win_probability import (MAX_REMAINING, MIN_REMAINING, MomentsTable, WinProbabilityStrategy,
+                             max_of_normals, normal_cdf)
+
+YAHTZEE_AND_CHANCE = FULL_MASK ^ (1 << 11) ^ (1 << 12)
+
+
+class TestWinProbability(unittest.TestCase):
+    """Test suite for the multiplayer win-probability strategy."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Solving only the last two rounds keeps the suite fast
+        cls.table = StrategyTable.solve(base_mask=YAHTZEE_AND_CHANCE)
+        cls.moments = MomentsTable.solve(cls.table, base_mask=YAHTZEE_AND_CHANCE)
+
+    def setUp(self):
+        """Set up a two-player game where player 2 has finished with 295 points."""
+        self.strategy = WinProbabilityStrategy(self.table, self.moments)
+        self.game = Game(2)
+        for slot in range(13):
+            self.game.players.set_score(1, slot, 20)
+
+    def fill_card(self, slot_scores):
+        for slot in range(11):
+            self.game.players.set_score(0, slot, slot_scores)
+
+    def test_means_match_expected_scores(self):
+        """Test that the mean remaining score equals the solver's value."""
+        np.testing.assert_allclose(self.moments.moments[YAHTZEE_AND_CHANCE, :, 0],
+                                   self.table.values[YAHTZEE_AND_CHANCE], rtol=1e-5)
+
+    def test_variance_matches_exact_distribution(self):
+        """Test that the variance agrees with the exact score distribution."""
+        dist = score_distribution(self.table, YAHTZEE_AND_CHANCE)
+        self.assertAlmostEqual(self.moments.variance(YAHTZEE_AND_CHANCE, 0), dist.std ** 2,
+                               places=2)
+
+    def test_max_of_normals(self):
+        """Test Clark's approximation on known cases."""
+        self.assertEqual(max_of_normals([3.0], [4.0]), (3.0, 4.0))
+        mean, _ = max_of_normals([0.0, 0.0], [1.0, 1.0])
+        self.assertAlmostEqual(mean, 1 / math.sqrt(math.pi), places=6)
+        mean, variance = max_of_normals([100.0, 0.0], [1.0, 1.0])
+        self.assertAlmostEqual(mean, 100.0)
+        self.assertAlmostEqual(variance, 1.0)
+
+    def test_normal_cdf_lookup(self):
+        """Test that the tabulated CDF matches erf and saturates at the ends."""
+        z = np.array([-20.0, -1.5, 0.0, 0.3333, 2.0, 20.0])
+        expected = [0.5 * math.erfc(-x / math.sqrt(2)) for x in z]
+        np.testing.assert_allclose(normal_cdf(z), expected, atol=1e-7)
+
+    def test_remaining_bounds(self):
+        """Test the smallest and largest scores still to come."""
+        self.assertEqual(MAX_REMAINING[0, 0], 375)
+        self.assertEqual(MAX_REMAINING[FULL_MASK, 63], 35)
+        self.assertEqual(MIN_REMAINING[FULL_MASK, 63], 35)
+        self.assertEqual(MIN_REMAINING[0, 62], 0)
+        sixes_open = FULL_MASK ^ (1 << 5)
+        self.assertEqual(MAX_REMAINING[sixes_open, 32], 30)
+        self.assertEqual(MAX_REMAINING[sixes_open, 33], 65)
+
+    def test_trailing_player_gambles(self):
+        """Test that a player 40 behind keeps Yahtzee open where optimal play scratches it."""
+        self.fill_card(20)
+        mask, upper = self.game.players.state(0)
+        self.assertEqual(self.game.players.total(1) - self.game.players.total(0), 40)
+        self.strategy.begin_turn(self.game, 0)
+        hand = [1, 1, 1, 2, 3]
+        self.assertEqual(self.strategy.fallback.choose_slot(hand, mask, upper), 11)
+        self.assertEqual(self.strategy.choose_slot(hand, mask, upper), 12)
+
+    def test_decided_lead_plays_for_score(self):
+        """Test that a player who cannot lose still plays the expected-score action."""
+        self.fill_card(25)
+        mask, upper = self.game.players.state(0)
+        self.strategy.begin_turn(self.game, 0)
+        hand = [6, 6, 5, 5, 4]
+        for rolls_left in (1, 2):
+            self.assertEqual(self.strategy.choose_reroll(hand, rolls_left, mask, upper),
+                             self.strategy.fallback.choose_reroll(hand, rolls_left, mask, upper))
+
+    def test_single_player_falls_back_to_optimal(self):
+        """Test that without opponents the strategy plays like OptimalStrategy."""
+        game = Game(1)
+        for slot in range(11):
+            game.players.set_score(0, slot, 10)
+        mask, upper = game.players.state(0)
+        self.strategy.begin_turn(game, 0)
+        hand = [2, 2, 3, 3, 3]
+        self.assertEqual(self.strategy.choose_slot(hand, mask, upper),
+                         self.strategy.fallback.choose_slot(hand, mask, upper))
+
+    def test_plays_multiplayer_endgame(self):
+        """Test that three win-probability bots finish the last two rounds."""
+        game = Game(3)
+        for player in range(3):
+            for slot in range(11):
+                game.players.set_score(player, slot, 10 + player)
+        for _ in range(2):
+            for player in range(3):
+                play_turn(game, self.strategy, player)
+        self.assertTrue(all(game.players.is_complete(p) for p in range(3)))
+
+    def test_save_and_load_round_trip(self):
+        """Test that the moments table is saved and memory-mapped back."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'moments.bin')
+            self.moments.save(path)
+            loaded = MomentsTable.load(path)
+            np.testing.assert_array_equal(loaded.moments, self.moments.moments)
+        with self.assertRaises(ValueError):
+            MomentsTable(np.zeros((8192, 64), dtype=np.float32))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Exact reroll transition matrices: keep -> distribution over final hands.
+
+There are 462 sub-multisets of five dice a player can keep (0 to 5 dice) and
+252 sorted hands.  ``TRANSITIONS[k, h]`` is the exact probability of ending
+with hand ``h`` after rerolling every die not in keep ``k``, so the expected
+value of any per-hand quantity under a keep is one matrix-vector product
+instead of a Monte Carlo estimate:
+
+    expected_scores((6, 6, 6))     # expected score in each of the 13 slots
+
+The matrix is only about 4% non-zero, but at 462 x 252 float64 (under 1 MB)
+it is kept dense so the solver can fold whole batches of hand values through
+it with one BLAS call.  It is built at import in about 10 ms, or read from
+``data/transitions.npy`` when that file exists (``python transitions.py``
+writes it).
+"""
+import sys
+from collections import Counter
+from itertools import combinations, combinations_with_replacement
+from math import factorial
+from pathlib import Path
+
+import numpy as np
+
+from scoring import ALL_HANDS, HAND_INDEX, NUM_DICE, NUM_FACES, SCORE_TABLE, hand_key
+
+NUM_HANDS = len(ALL_HANDS)
+
+DEFAULT_TRANSITIONS_PATH = Path(__file__).parent / 'data' / 'transitions.npy'
+
+# SCORES[h, slot] is the score of hand h in slot
+SCORES = np.array(SCORE_TABLE, dtype=np.float64)
+
+
+def _build_keeps():
+    keeps = [keep for size in range(NUM_DICE + 1)
+             for keep in combinations_with_replacement(range(1, NUM_FACES + 1), size)]
+    keep_index = {hand_key(keep): idx for idx, keep in enumerate(keeps)}
+    return tuple(keeps), keep_index
+
+
+def build_transitions(keeps):
+    """Return T with T[k, h] = P(hand h after rerolling the dice not in keep k)."""
+    transitions = np.zeros((len(keeps), NUM_HANDS))
+    for k, keep in enumerate(keeps):
+        num_rolled = NUM_DICE - len(keep)
+        base = hand_key(keep)
+        total = NUM_FACES ** num_rolled
+        for outcome in combinations_with_replacement(range(1, NUM_FACES + 1), num_rolled):
+            ways = factorial(num_rolled)
+            for count in Counter(outcome).values():
+                ways //= factorial(count)
+            h = HAND_INDEX[base + hand_key(outcome)]
+            transitions[k, h] += ways / total
+    return transitions
+
+
+def _build_hand_keeps(keep_index):
+    """Return an [252, 32] array of the keep index for every subset of each hand."""
+    hand_keeps = np.empty((NUM_HANDS, 1 << NUM_DICE), dtype=np.intp)
+    for h, hand in enumerate(ALL_HANDS):
+        subsets = [keep_index[hand_key(kept)]
+                   for size in range(NUM_DICE + 1)
+                   for kept in combinations(hand, size)]
+        hand_keeps[h] = subsets
+    return hand_keeps
+
+
+KEEPS, KEEP_INDEX = _build_keeps()
+NUM_KEEPS = len(KEEPS)
+
+
+def save_transitions(transitions, path=DEFAULT_TRANSITIONS_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write beside the target and rename, so an interrupted save never leaves
+    # a truncated file for the next import to trip over
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        np.save(f, transitions)
+    tmp_path.replace(path)
+
+
+def load_transitions(path=DEFAULT_TRANSITIONS_PATH):
+    """Read a saved transition matrix, checking its shape and that rows sum to one."""
+    transitions = np.load(path)
+    if transitions.shape != (NUM_KEEPS, NUM_HANDS):
+        raise ValueError(f"Expected a {NUM_KEEPS}x{NUM_HANDS} matrix, got {transitions.shape}")
+    if not np.allclose(transitions.sum(axis=1), 1.0):
+        raise ValueError("Transition rows must sum to 1")
+    return transitions
+
+
+def load_or_build_transitions(path=DEFAULT_TRANSITIONS_PATH):
+    """Use the cached matrix at ``path`` if it is valid, else build it in memory."""
+    if Path(path).exists():
+        try:
+            return load_transitions(path)
+        except (ValueError, EOFError, OSError):
+            # Wrong shape, truncated or unreadable: rebuilding is cheap
+            pass
+    return build_transitions(KEEPS)
+
+
+TRANSITIONS = load_or_build_transitions()
+HAND_KEEPS = _build_hand_keeps(KEEP_INDEX)
+EMPTY_KEEP = KEEP_INDEX[0]
+
+
+def keep_row(kept):
+    """Row of ``TRANSITIONS`` for a keep given as face values in any order."""
+    if len(kept) > NUM_DICE or not all(1 <= value <= NUM_FACES for value in kept):
+        raise ValueError("A keep is at most 5 face values between 1 and 6")
+    return KEEP_INDEX[hand_key(kept)]
+
+
+def expected_scores(kept, hand_values=SCORES):
+    """Expected ``hand_values`` after rerolling the dice not in ``kept``.
+
+    ``hand_values`` is indexed by hand along its first axis; the default gives
+    the expected score of each of the 13 slots.
+    """
+    return TRANSITIONS[keep_row(kept)] @ hand_values
+
+
+def keep_expectations(dice_values, hand_values=SCORES):
+    """Expected ``hand_values`` for all 32 keeps of a hand in one product.
+
+    Returns ``(keeps, expected)`` where ``keeps`` are the 32 keep indices (one
+    per subset of dice positions, duplicates included) and ``expected`` is
+    ``TRANSITIONS[keeps] @ hand_values``.
+    """
+    keeps = HAND_KEEPS[HAND_INDEX[hand_key(dice_values)]]
+    return keeps, TRANSITIONS[keeps] @ hand_values
+
+
+if __name__ == '__main__':
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TRANSITIONS_PATH
+    save_transitions(build_transitions(KEEPS), path)
+    print(f"Saved {NUM_KEEPS} x {NUM_HANDS} transition matrix to: {path}")
@@ -0,0 +1,320 @@
+"""Multiplayer strategy that maximises the probability of winning.
+
+The expected-score table says nothing about risk, which is what matters when
+trailing or leading.  ``solve_moments`` walks the same state space as the
+solver and records, for every (used-slot mask, capped upper subtotal), the
+mean and variance of the score still to come when the optimal policy is
+played.  With those, a final score is summarised as a normal distribution:
+
+* an opponent's final score ~ N(banked + mean, variance) of their state
+* several opponents collapse to their maximum with Clark's moment-matching
+  approximation for the max of normals
+* the current player's turn is resolved exactly over the 252 hands and the
+  transition matrix, and only the turns after it are approximated
+
+so P(win) for any final hand and slot is one normal CDF lookup, read from a
+precomputed grid by direct indexing.  ``WinProbabilityStrategy.begin_turn``
+does all of this once per turn (well under a millisecond); the reroll and
+slot queries afterwards are array lookups.
+
+The moments table (8192 x 64 x 2 float32) is saved in the ``table_file``
+format beside the strategy table.
+"""
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from scoring import (HAND_INDEX, NUM_SLOTS, NUM_UPPER_SLOTS, UPPER_BONUS, UPPER_BONUS_THRESHOLD,
+                     hand_key, open_slots, reroll_indices)
+from simulation import OptimalStrategy, Strategy
+from solver import (FULL_MASK, NUM_MASKS, NUM_UPPER_STATES, RULES_VARIANT, UPPER_STATES,
+                    StrategyTable, terminal_values)
+from table_file import open_table, write_table
+from transitions import EMPTY_KEEP, HAND_KEEPS, KEEPS, NUM_HANDS, NUM_KEEPS, SCORES, TRANSITIONS
+
+DEFAULT_MOMENTS_PATH = Path(__file__).parent / 'data' / 'score_moments.bin'
+
+# Standard normal CDF on a uniform grid, read by direct indexing
+CDF_MIN, CDF_MAX, CDF_STEP = -12.0, 12.0, 0.001
+CDF_VALUES = np.array([0.5 * math.erfc(-z / math.sqrt(2.0))
+                       for z in np.arange(CDF_MIN, CDF_MAX + CDF_STEP / 2, CDF_STEP)])
+
+# Final scores are integers: this variance floor keeps a sure comparison finite
+MIN_VARIANCE = 1.0 / 6.0
+# Prefers the higher expected score once win probabilities are indistinguishable
+TIE_BREAK = 1e-15
+
+HAND_ROWS = np.arange(NUM_HANDS)
+UPPER_COLS = UPPER_STATES[None, :]
+
+
+def _remaining_bounds():
+    """Smallest and largest possible score still to come from every state.
+
+    The bonus counts as still to come, as in the solver's tables, so it is the
+    whole minimum once the upper subtotal has reached 63.
+    """
+    slot_max = SCORES.max(axis=0)
+    open_masks = FULL_MASK ^ np.arange(NUM_MASKS)
+    is_open = (open_masks[:, None] >> np.arange(NUM_SLOTS)) & 1
+    open_upper_max = is_open[:, :NUM_UPPER_SLOTS] @ slot_max[:NUM_UPPER_SLOTS]
+    reachable_bonus = UPPER_STATES[None, :] + open_upper_max[:, None] >= UPPER_BONUS_THRESHOLD
+    most = (is_open @ slot_max)[:, None] + UPPER_BONUS * reachable_bonus
+    least = np.where(UPPER_STATES >= UPPER_BONUS_THRESHOLD, UPPER_BONUS, 0)
+    return np.broadcast_to(least, most.shape), most
+
+
+MIN_REMAINING, MAX_REMAINING = _remaining_bounds()
+
+
+def normal_cdf(z):
+    """Standard normal CDF of an array, linearly interpolated from the grid."""
+    position = (np.clip(z, CDF_MIN, CDF_MAX) - CDF_MIN) * (1.0 / CDF_STEP)
+    below = np.minimum(position.astype(np.intp), len(CDF_VALUES) - 2)
+    frac = position - below
+    return CDF_VALUES[below] * (1.0 - frac) + CDF_VALUES[below + 1] * frac
+
+
+def _pdf(z):
+    return math.exp(-0.5 * z * z) / math.sqrt(2.0 * math.pi)
+
+
+def max_of_normals(means, variances):
+    """Moment-match the max of independent normals with one normal (Clark, 1961)."""
+    mean, variance = means[0], variances[0]
+    for other_mean, other_variance in zip(means[1:], variances[1:]):
+        spread = math.sqrt(variance + other_variance)
+        if spread == 0.0:
+            mean = max(mean, other_mean)
+            continue
+        alpha = (mean - other_mean) / spread
+        cdf = 0.5 * math.erfc(-alpha / math.sqrt(2.0))
+        pdf = _pdf(alpha)
+        first = mean * cdf + other_mean * (1.0 - cdf) + spread * pdf
+        second = ((mean * mean + variance) * cdf
+                  + (other_mean * other_mean + other_variance) * (1.0 - cdf)
+                  + (mean + other_mean) * spread * pdf)
+        mean, variance = first, max(0.0, second - first * first)
+    return mean, variance
+
+
+def _best_keeps_all(hand_values):
+    """``solver._best_keeps`` for a [252, 64] array: one keep per hand and upper subtotal."""
+    expected = TRANSITIONS @ hand_values
+    choice = expected[HAND_KEEPS].argmax(axis=1)
+    keeps = np.take_along_axis(HAND_KEEPS[:, :, None], choice[:, None, :], axis=1)[:, 0, :]
+    return keeps, expected[keeps, UPPER_COLS]
+
+
+def _reroll_all(keeps, hand_probs):
+    """Hand distribution per upper subtotal after rerolling from the given keeps."""
+    pooled = np.bincount((keeps * NUM_UPPER_STATES + UPPER_COLS).ravel(),
+                         weights=np.broadcast_to(hand_probs, keeps.shape).ravel(),
+                         minlength=NUM_KEEPS * NUM_UPPER_STATES)
+    return TRANSITIONS.T @ pooled.reshape(NUM_KEEPS, NUM_UPPER_STATES)
+
+
+def _moments_for_mask(values, means, second, mask):
+    """Mean and second moment of the remaining score from (mask, every upper)."""
+    slots = np.array(open_slots(mask))
+    scores = SCORES[:, slots]
+    next_masks = mask | (1 << slots)
+    # next_uppers[h, s, u]: upper subtotal after scoring hand h in slot s from u
+    is_upper = (slots < NUM_UPPER_SLOTS)[None, :, None]
+    uppers = UPPER_STATES[None, None, :]
+    next_uppers = np.where(is_upper,
+                           np.minimum(UPPER_BONUS_THRESHOLD,
+                                      uppers + scores[:, :, None].astype(np.intp)),
+                           uppers)
+    totals = scores[:, :, None] + values[next_masks[None, :, None], next_uppers]
+    choice = totals.argmax(axis=1)
+
+    keeps_one_left, one_left_values = _best_keeps_all(totals.max(axis=1))
+    keeps_two_left, _ = _best_keeps_all(one_left_values)
+    hand_probs = _reroll_all(keeps_two_left, TRANSITIONS[EMPTY_KEEP][:, None])
+    hand_probs = _reroll_all(keeps_one_left, hand_probs)
+
+    points = np.take_along_axis(scores, choice, axis=1)
+    chosen_masks = next_masks[choice]
+    chosen_uppers = np.take_along_axis(next_uppers, choice[:, None, :], axis=1)[:, 0, :]
+    next_mean = means[chosen_masks, chosen_uppers]
+    next_second = second[chosen_masks, chosen_uppers]
+    mean = (hand_probs * (points + next_mean)).sum(axis=0)
+    second_moment = (hand_probs
+                     * (points * points + 2 * points * next_mean + next_second)).sum(axis=0)
+    return mean, second_moment
+
+
+def solve_moments(table, base_mask=0, progress=False):
+    """Mean and variance of the remaining score under ``table``'s policy, per state.
+
+    Returns a float32 array of shape [8192, 64, 2]; rows for masks that do not
+    contain ``base_mask`` are left at zero.
+    """
+    values = np.asarray(table.values, dtype=np.float64)
+    means = np.zeros((NUM_MASKS, NUM_UPPER_STATES))
+    second = np.zeros((NUM_MASKS, NUM_UPPER_STATES))
+    means[FULL_MASK] = terminal_values()
+    second[FULL_MASK] = terminal_values() ** 2
+    masks = [mask for mask in range(FULL_MASK - 1, -1, -1) if mask & base_mask == base_mask]
+    start = time.perf_counter()
+    for count, mask in enumerate(masks, 1):
+        means[mask], second[mask] = _moments_for_mask(values, means, second, mask)
+        if progress and count % 512 == 0:
+            elapsed = time.perf_counter() - start
+            print(f"  solved {count}/{len(masks)} masks ({elapsed:.1f}s)")
+    variances = np.maximum(0.0, second - means * means)
+    return np.stack([means, variances], axis=-1).astype(np.float32)
+
+
+class MomentsTable:
+    """Per-state mean and variance of the score still to come under optimal play."""
+
+    def __init__(self, moments):
+        if moments.shape != (NUM_MASKS, NUM_UPPER_STATES, 2):
+            raise ValueError(f"Expected a {NUM_MASKS}x{NUM_UPPER_STATES}x2 table, "
+                             f"got {moments.shape}")
+        self.moments = moments
+
+    @classmethod
+    def solve(cls, table, base_mask=0, progress=False):
+        return cls(solve_moments(table, base_mask, progress))
+
+    @classmethod
+    def load(cls, path=DEFAULT_MOMENTS_PATH, verify=True):
+        return cls(open_table(path, RULES_VARIANT, (NUM_MASKS, NUM_UPPER_STATES, 2), verify))
+
+    @classmethod
+    def load_or_solve(cls, table, path=DEFAULT_MOMENTS_PATH, progress=False):
+        """Load the moments at ``path``, solving and saving them if missing or invalid."""
+        path = Path(path)
+        if path.exists():
+            try:
+                return cls.load(path)
+            except ValueError as e:
+                if progress:
+                    print(f"Ignoring saved moments: {e}")
+        moments = cls.solve(table, progress=progress)
+        moments.save(path)
+        return moments
+
+    def save(self, path=DEFAULT_MOMENTS_PATH):
+        write_table(path, self.moments, RULES_VARIANT)
+
+    def mean(self, mask, upper):
+        return float(self.moments[mask, upper, 0])
+
+    def variance(self, mask, upper):
+        return float(self.moments[mask, upper, 1])
+
+
+class WinProbabilityStrategy(Strategy):
+    """Choose rerolls and slots that maximise P(final score > every opponent's).
+
+    ``begin_turn`` reads the opponents' cards from the game, so this strategy
+    must be driven by ``play_game``/``play_turn`` (or the server).  With no
+    opponents it plays the expected-score-optimal actions.
+    """
+
+    def __init__(self, table, moments):
+        self.table = table
+        # A plain ndarray view of the (possibly memory-mapped) table: no copy,
+        # but no per-index memmap bookkeeping either
+        self.moments = np.asarray(moments.moments)
+        self.fallback = OptimalStrategy(table)
+        self._turn = None
+
+    def opponent_summary(self, scorecard, player_idx):
+        """Summary of the best opponent final score, or None without opponents.
+
+        Returns (mean, variance) of the moment-matched normal plus the smallest
+        score the leading opponent is sure to reach and the largest any can.
+        """
+        means, variances, floors, ceilings = [], [], [], []
+        for opponent in range(scorecard.num_players):
+            if opponent == player_idx:
+                continue
+            mask, upper = scorecard.state(opponent)
+            mean, variance = self.moments[mask, upper]
+            banked = scorecard.slot_total(opponent)
+            means.append(banked + float(mean))
+            variances.append(float(variance))
+            floors.append(banked + int(MIN_REMAINING[mask, upper]))
+            ceilings.append(banked + int(MAX_REMAINING[mask, upper]))
+        if not means:
+            return None
+        return max_of_normals(means, variances) + (max(floors), max(ceilings))
+
+    def begin_turn(self, game, player_idx):
+        scorecard = game.players
+        summary = self.opponent_summary(scorecard, player_idx)
+        mask, upper = scorecard.state(player_idx)
+        if summary is None or mask == FULL_MASK:
+            self._turn = None
+            return
+        self._turn = (mask, upper) + self._plan_turn(mask, upper, scorecard.slot_total(player_idx),
+                                                     *summary)
+
+    def _plan_turn(self, mask, upper, banked, opponent_mean, opponent_variance,
+                   opponent_floor, opponent_ceiling):
+        """Win probability of every hand and the best slot and keeps for this turn."""
+        slots = np.array(open_slots(mask))
+        scores = SCORES[:, slots]
+        next_masks = mask | (1 << slots)
+        next_uppers = np.where(slots < NUM_UPPER_SLOTS,
+                               np.minimum(UPPER_BONUS_THRESHOLD, upper + scores.astype(np.intp)),
+                               upper)
+        future = self.moments[next_masks, next_uppers]
+        banked_after = banked + scores
+        mean = banked_after + future[..., 0]
+        spread = np.sqrt(future[..., 1] + opponent_variance + MIN_VARIANCE)
+        win = normal_cdf((mean - opponent_mean) / spread)
+        # The normal tails are wrong near the bounds of the score ranges, so
+        # outcomes that are already decided are set exactly
+        win[banked_after + MIN_REMAINING[next_masks, next_uppers] > opponent_ceiling] = 1.0
+        win[banked_after + MAX_REMAINING[next_masks, next_uppers] < opponent_floor] = 0.0
+        win += TIE_BREAK * mean
+        choice = win.argmax(axis=1)
+        best_slots = slots[choice]
+        final = win[HAND_ROWS, choice]
+        keep_values_one_left = TRANSITIONS @ final
+        one_left = keep_values_one_left[HAND_KEEPS].max(axis=1)
+        keep_values_two_left = TRANSITIONS @ one_left
+        return best_slots, {1: keep_values_one_left, 2: keep_values_two_left}
+
+    def _planned(self, mask, upper):
+        turn = self._turn
+        return turn is not None and turn[0] == mask and turn[1] == upper
+
+    def choose_reroll(self, dice_values, rolls_left, mask, upper):
+        if not self._planned(mask, upper):
+            return self.fallback.choose_reroll(dice_values, rolls_left, mask, upper)
+        keep_values = self._turn[3][rolls_left]
+        keeps = HAND_KEEPS[HAND_INDEX[hand_key(dice_values)]]
+        kept = KEEPS[keeps[keep_values[keeps].argmax()]]
+        return reroll_indices(dice_values, kept)
+
+    def choose_slot(self, dice_values, mask, upper):
+        if not self._planned(mask, upper):
+            return self.fallback.choose_slot(dice_values, mask, upper)
+        return int(self._turn[2][HAND_INDEX[hand_key(dice_values)]])
+
+
+def make_win_strategy(progress=False):
+    table = StrategyTable.load_or_solve(progress=progress)
+    return WinProbabilityStrategy(table, MomentsTable.load_or_solve(table, progress=progress))
+
+
+if __name__ == '__main__':
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MOMENTS_PATH
+    table = StrategyTable.load_or_solve(progress=True)
+    print(f"Solving score moments for {NUM_MASKS} x {NUM_UPPER_STATES} states...")
+    start = time.perf_counter()
+    moments = MomentsTable.solve(table, progress=True)
+    moments.save(path)
+    print(f"Solved in {time.perf_counter() - start:.1f}s")
+    print(f"Final score: mean {moments.mean(0, 0):.4f}, std {moments.variance(0, 0) ** 0.5:.2f}")
+    print(f"Moments saved to: {path}")
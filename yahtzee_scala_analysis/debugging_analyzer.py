@@ -4,6 +4,8 @@ import subprocess
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from scala_scanner import scan_sources
+
 def run_scala_tests():
     """Run Scala tests and capture results."""
     scala_dir = Path(__file__).parent.parent / 'yahtzee_scala'
@@ -122,34 +124,8 @@ def check_scalastyle():
         }
 
 def analyze_error_handling():
-    """Analyze error handling patterns (Either, Try, Option)."""
-    scala_dir = Path(__file__).parent.parent / 'yahtzee_scala' / 'src' / 'main' / 'scala' / 'yahtzee'
-    
-    stats = {
-        'either_usage': 0,
-        'option_usage': 0,
-        'try_usage': 0,
-        'require_usage': 0,
-        'left_usage': 0,
-        'right_usage': 0,
-        'none_usage': 0,
-        'some_usage': 0
-    }
-    
-    for scala_file in scala_dir.glob('*.scala'):
-        with open(scala_file, 'r') as f:
-            content = f.read()
-            
-            stats['either_usage'] += content.count('Either[')
-            stats['option_usage'] += content.count('Option[')
-            stats['try_usage'] += content.count('Try[')
-            stats['require_usage'] += content.count('require(')
-            stats['left_usage'] += content.count('Left(')
-            stats['right_usage'] += content.count('Right(')
-            stats['none_usage'] += content.count('None')
-            stats['some_usage'] += content.count('Some(')
-    
-    return stats
+    """Analyze error handling patterns (Either, Try, Option), outside comments and strings."""
+    return scan_sources()['error_handling']
 
 def run_debugging_analysis():
     print("Running Scala debugging analysis...")
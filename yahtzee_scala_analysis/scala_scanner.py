@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Single-pass scanner for Scala sources.
+
+Every metric the readability and debugging analyzers report comes from one
+streaming pass over each file: lines are read one at a time, a small lexer
+blanks out comments and string/char literals (carrying block comments and
+triple-quoted strings across lines), and one combined regex over the
+remaining code counts every pattern at once.  So ``"var"`` in a string,
+``// TODO: use Either[``, or a commented-out ``def`` are not counted, and
+keywords must stand alone (``value`` does not count as ``val``).
+
+Scala block comments nest (``/* /* */ */``) and are tracked as such.
+Interpolated strings (``s"...${expr}..."``) are treated as literals as a
+whole, expressions included.
+
+Lines are classified as:
+
+* blank - only whitespace
+* comment - only comments (``//``, ``/* */``, ``/** */``) and whitespace
+* code - anything else, including lines inside a multi-line string
+
+Files are scanned in a process pool once there are ``PARALLEL_THRESHOLD``
+of them, so large multi-module trees use every core; memory per file is
+one line plus the counters.
+"""
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+SCALA_ROOT = Path(__file__).parent.parent / 'yahtzee_scala'
+PARALLEL_THRESHOLD = 64
+
+# Token pattern name -> regex, matched against code with comments and literals removed.
+# Listed before 'class' so 'case class' is not also counted as a plain class.
+PATTERNS = {
+    'case_class': r'\bcase\s+class\b',
+    'class': r'\bclass\b',
+    'object': r'\bobject\b',
+    'def': r'\bdef\b',
+    'extension': r'\bextension\b',
+    'opaque_type': r'\bopaque\s+type\b',
+    'val': r'\bval\b',
+    'var': r'\bvar\b',
+    'copy': r'\.copy\b',
+    'map': r'\.map\b',
+    'either': r'\bEither\s*\[',
+    'option': r'\bOption\s*\[',
+    'try': r'\bTry\s*\[',
+    'require': r'\brequire\s*\(',
+    'left': r'\bLeft\s*\(',
+    'right': r'\bRight\s*\(',
+    'none': r'\bNone\b',
+    'some': r'\bSome\s*\(',
+}
+
+# Reported metric groups: metric key -> token pattern name
+METRICS = {
+    'structure': {
+        'objects': 'object',
+        'case_classes': 'case_class',
+        'classes': 'class',
+        'def_functions': 'def',
+        'extension_methods': 'extension',
+        'opaque_types': 'opaque_type'
+    },
+    'immutability': {
+        'val_count': 'val',
+        'var_count': 'var',
+        'case_class_count': 'case_class',
+        'copy_usage': 'copy',
+        'map_usage': 'map'
+    },
+    'error_handling': {
+        'either_usage': 'either',
+        'option_usage': 'option',
+        'try_usage': 'try',
+        'require_usage': 'require',
+        'left_usage': 'left',
+        'right_usage': 'right',
+        'none_usage': 'none',
+        'some_usage': 'some'
+    }
+}
+
+# One alternation finds every token, with the leading \b shared by the word
+# patterns: re then only tries them at word starts, about 10x faster than
+# one branch (or named group) per pattern.  The few distinct matched strings
+# are classified afterwards, once each.
+WORD_PATTERNS = [regex[2:] for regex in PATTERNS.values() if regex.startswith(r'\b')]
+OTHER_PATTERNS = [regex for regex in PATTERNS.values() if not regex.startswith(r'\b')]
+TOKEN_RE = re.compile(r'\b(?:' + '|'.join(WORD_PATTERNS) + ')|' + '|'.join(OTHER_PATTERNS))
+PATTERN_RES = {name: re.compile(regex) for name, regex in PATTERNS.items()}
+
+# Start of anything that is not code: comments, strings, char literals
+SPECIAL_RE = re.compile(r"//|/\*|\"\"\"|\"|'(?:\\.|[^\\'\n])'")
+SPECIAL_CHAR_RE = re.compile(r'[/"\']')
+BLOCK_COMMENT_RE = re.compile(r'/\*|\*/')
+STRING_END_RE = re.compile(r'(?:\\.|[^"\\])*"')
+TRIPLE_END = '"""'
+
+CODE, BLOCK_COMMENT, TRIPLE_STRING = range(3)
+
+
+def strip_line(line, state, depth):
+    """Code part of ``line`` with comments and literals removed.
+
+    Returns ``(code, has_comment, in_literal, state, depth)``, where ``state``
+    and ``depth`` (block comment nesting) carry over to the next line.
+    Literals are replaced by ``""`` so calls such as ``Some("x")`` still
+    read as calls.
+    """
+    if state == CODE and SPECIAL_CHAR_RE.search(line) is None:
+        # Most lines: nothing to strip
+        return line, False, False, state, depth
+    code = []
+    has_comment = False
+    in_literal = False
+    pos = 0
+    end = len(line)
+    while pos < end:
+        if state == BLOCK_COMMENT:
+            has_comment = True
+            match = BLOCK_COMMENT_RE.search(line, pos)
+            if match is None:
+                break
+            depth += 1 if match.group() == '/*' else -1
+            pos = match.end()
+            if depth == 0:
+                state = CODE
+                # Keep tokens on either side of the comment apart
+                code.append(' ')
+        elif state == TRIPLE_STRING:
+            in_literal = True
+            close = line.find(TRIPLE_END, pos)
+            if close < 0:
+                break
+            # A closing """ may be followed by more quotes that belong to the string
+            pos = close + 3
+            while pos < end and line[pos] == '"':
+                pos += 1
+            state = CODE
+        else:
+            match = SPECIAL_RE.search(line, pos)
+            if match is None:
+                code.append(line[pos:])
+                break
+            code.append(line[pos:match.start()])
+            token = match.group()
+            pos = match.end()
+            if token == '//':
+                has_comment = True
+                break
+            if token == '/*':
+                state, depth = BLOCK_COMMENT, 1
+            elif token == TRIPLE_END:
+                code.append('""')
+                state = TRIPLE_STRING
+            elif token == '"':
+                code.append('""')
+                in_literal = True
+                string_end = STRING_END_RE.match(line, pos)
+                # An unterminated string ends with the line, as in scalac's error recovery
+                pos = string_end.end() if string_end else end
+            else:
+                code.append("' '")
+                in_literal = True
+    return ''.join(code), has_comment, in_literal, state, depth
+
+
+def scan_file(path):
+    """Line counts and token counts for one Scala file, reading it once."""
+    lines = Counter(total=0, code=0, comments=0, blank=0)
+    tokens = Counter()
+    state = CODE
+    depth = 0
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            lines['total'] += 1
+            was_literal = state == TRIPLE_STRING
+            code, has_comment, in_literal, state, depth = strip_line(line, state, depth)
+            if not line.strip():
+                lines['blank'] += 1
+            elif code.strip() or in_literal or was_literal:
+                lines['code'] += 1
+                tokens.update(TOKEN_RE.findall(code))
+            elif has_comment:
+                lines['comments'] += 1
+    return {'lines': dict(lines), 'tokens': dict(classify(tokens))}
+
+
+def token_name(text):
+    """Name of the ``PATTERNS`` entry that matched ``text``."""
+    for name, pattern in PATTERN_RES.items():
+        if pattern.fullmatch(text):
+            return name
+    raise ValueError(f"No pattern matches {text!r}")
+
+
+def classify(matches):
+    """Counts per matched string -> counts per pattern name."""
+    counts = Counter()
+    for text, count in matches.items():
+        counts[token_name(text)] += count
+    return counts
+
+
+def source_files(root=SCALA_ROOT):
+    """Main sources of every module under ``root`` (``**/src/main/scala/**/*.scala``)."""
+    files = set()
+    for source_dir in root.glob('**/src/main/scala'):
+        files.update(source_dir.rglob('*.scala'))
+    return sorted(files)
+
+
+def scan_files(paths, workers=None):
+    """``scan_file`` for each path, in a process pool for large file sets."""
+    paths = list(paths)
+    if len(paths) < PARALLEL_THRESHOLD:
+        return [scan_file(path) for path in paths]
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(scan_file, paths, chunksize=max(1, len(paths) // (4 * workers))))
+
+
+def file_labels(paths):
+    """Short per-file names: paths relative to the deepest directory they share."""
+    if not paths:
+        return []
+    if len(paths) == 1:
+        return [paths[0].name]
+    common = Path(os.path.commonpath([path.parent for path in paths]))
+    return [str(path.relative_to(common)) for path in paths]
+
+
+def scan_sources(root=SCALA_ROOT, workers=None):
+    """All Scala metrics for the sources under ``root`` from a single pass per file.
+
+    Returns ``line_counts`` (per file plus ``_total``) and one dict per
+    group in ``METRICS``.
+    """
+    paths = source_files(root)
+    scans = scan_files(paths, workers)
+
+    line_counts = {}
+    total_lines = Counter(total=0, code=0, comments=0, blank=0)
+    total_tokens = Counter()
+    for label, scan in zip(file_labels(paths), scans):
+        line_counts[label] = scan['lines']
+        total_lines.update(scan['lines'])
+        total_tokens.update(scan['tokens'])
+    line_counts['_total'] = dict(total_lines)
+
+    results = {'line_counts': line_counts, 'files_scanned': len(paths)}
+    for group, metrics in METRICS.items():
+        results[group] = {key: total_tokens[name] for key, name in metrics.items()}
+    return results
@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scala_scanner import BLOCK_COMMENT, CODE, TRIPLE_STRING, scan_file, strip_line
+
+# Every token below that sits in a comment or literal must not be counted;
+# the real code has one object, one case class, two defs, one val, one Option[ and one Some(.
+FIXTURE = '''\
+// def commented(): Option[Int] = None
+package yahtzee
+
+/* var hidden = 1
+   /* nested: class Hidden */
+   val stillHidden = Some(2)
+*/
+object Game {
+
+  case class Roll(faces: List[Int]) /* def inline() */
+
+  val banner = """var in a
+triple-quoted string with Either[ and class
+"""
+  def label(): String = "def in a string \\" var" + 'v' + '\\''
+  /** Scaladoc: def documented */
+  def best(): Option[Int] = Some(6) // Right(0) in a comment
+}
+'''
+
+
+class TestStripLine(unittest.TestCase):
+    """Test suite for the per-line lexer states."""
+
+    def test_plain_code_is_unchanged(self):
+        """Test that a line with nothing to strip is returned as is."""
+        self.assertEqual(strip_line('val x = 1\n', CODE, 0), ('val x = 1\n', False, False, CODE, 0))
+
+    def test_line_comment(self):
+        """Test that everything after // is dropped and flagged as a comment."""
+        code, has_comment, in_literal, state, _ = strip_line('val x = 1 // var y\n', CODE, 0)
+        self.assertEqual(code, 'val x = 1 ')
+        self.assertTrue(has_comment)
+        self.assertFalse(in_literal)
+        self.assertEqual(state, CODE)
+
+    def test_nested_block_comment_spans_lines(self):
+        """Test that /* /* */ */ nests and carries its depth to the next line."""
+        code, has_comment, _, state, depth = strip_line('val a = 1 /* x /* y */\n', CODE, 0)
+        self.assertEqual(code.strip(), 'val a = 1')
+        self.assertTrue(has_comment)
+        self.assertEqual((state, depth), (BLOCK_COMMENT, 1))
+        code, _, _, state, depth = strip_line('def hidden */ val b = 2\n', state, depth)
+        self.assertEqual(code.split(), ['val', 'b', '=', '2'])
+        self.assertEqual((state, depth), (CODE, 0))
+
+    def test_strings_and_chars_become_empty_literals(self):
+        """Test that string and char literals are blanked, escapes included."""
+        code, _, in_literal, state, _ = strip_line('f("var \\" def", \'v\', \'\\n\')\n', CODE, 0)
+        self.assertEqual(code, 'f("", \' \', \' \')\n')
+        self.assertTrue(in_literal)
+        self.assertEqual(state, CODE)
+
+    def test_triple_quoted_string_spans_lines(self):
+        """Test that a triple-quoted string is blanked until its closing quotes."""
+        code, _, _, state, _ = strip_line('val s = """class A\n', CODE, 0)
+        self.assertEqual(code, 'val s = ""')
+        self.assertEqual(state, TRIPLE_STRING)
+        code, _, in_literal, state, _ = strip_line('def f""""; val t = 1\n', state, 0)
+        self.assertEqual(code, '; val t = 1\n')
+        self.assertTrue(in_literal)
+        self.assertEqual(state, CODE)
+
+
+class TestScanFile(unittest.TestCase):
+    """Test suite for line classification and token counts over a fixture."""
+
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'Game.scala'
+            path.write_text(FIXTURE)
+            cls.scan = scan_file(path)
+
+    def test_line_classification(self):
+        """Test blank, comment-only and code line counts."""
+        self.assertEqual(self.scan['lines'], {'total': 18, 'code': 9, 'comments': 6, 'blank': 3})
+
+    def test_tokens_in_comments_and_literals_are_not_counted(self):
+        """Test that only tokens in real code are counted."""
+        self.assertEqual(self.scan['tokens'], {'object': 1, 'case_class': 1, 'def': 2, 'val': 1,
+                                               'option': 1, 'some': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()